@@ -0,0 +1,343 @@
+"""
+Moteur NumPy optionnel : mêmes fonctions, mêmes tuples que algorithmes_tri
+et algorithmes_recherche, pour les gros volumes où seul le débit compte.
+Il s'utilise directement ou via moteur="numpy" sur les fonctions d'origine.
+
+  • tri_fusion / tri_rapide / tri_tas / tri_radix → np.argsort(kind=...)
+    (np.lexsort pour les clés multiples), mêmes clés que le moteur Python
+    (colonnes texte par collation, valeurs absentes en dernier)
+  • recherche_binaire / recherche_dans_plage      → np.searchsorted
+  • recherche_min_max / recherche_lineaire        → masques vectorisés
+Une valeur absente vaut ABSENTE (+inf) comme dans le moteur Python : triée
+en dernier, hors de toute plage finie, ignorée par min/max.
+
+Les compteurs ne sont pas comptés mais estimés analytiquement (coût moyen
+de l'algorithme exécuté par NumPy) : ce sont des Estimation, des entiers
+marqués estime=True qui s'affichent préfixés de « ≈ ».
+
+Sans NumPy, chaque fonction délègue à l'implémentation Python d'origine
+(compteurs exacts) : le module s'importe et s'utilise partout.
+"""
+
+from time import perf_counter as _now
+from array import array
+from math import log, log2, ceil
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import algorithmes_tri as _tri
+import algorithmes_recherche as _recherche
+from utilitaires import DatasetColonnes, ABSENTE
+
+NUMPY_DISPONIBLE = np is not None
+
+EULER_MASCHERONI = 0.5772156649
+
+
+class Estimation(int):
+    """Compteur estimé analytiquement, et non compté opération par opération"""
+
+    estime = True
+
+    def __repr__(self):
+        return f"≈{int(self)}"
+
+    __str__ = __repr__
+
+
+def est_estimation(compteur):
+    """Le compteur est-il une estimation du moteur NumPy ?"""
+    return getattr(compteur, "estime", False)
+
+
+# --------------------------------------------------------------------------- #
+# Estimations du coût moyen (n éléments)
+# --------------------------------------------------------------------------- #
+def _estimer_fusion(n):
+    """Tri fusion : ~n·log2(n) − n comparaisons"""
+    return (Estimation(max(0, round(n * log2(n) - n))),) if n > 1 else (Estimation(0),)
+
+
+def _estimer_rapide(n):
+    """Tri rapide : 2(n+1)·H(n) − 4n comparaisons, un échange pour 6 comparaisons (Hoare)"""
+    if n < 2:
+        return Estimation(0), Estimation(0)
+    comp = max(0, round(2 * (n + 1) * (log(n) + EULER_MASCHERONI) - 4 * n))
+    return Estimation(comp), Estimation(comp // 6)
+
+
+def _estimer_tas(n):
+    """Tri par tas : ~2n·log2(n) comparaisons, ~n·log2(n) échanges"""
+    if n < 2:
+        return Estimation(0), Estimation(0)
+    return Estimation(round(2 * n * log2(n))), Estimation(round(n * log2(n)))
+
+
+def _estimer_dichotomie(n):
+    """Recherche binaire : ⌈log2(n + 1)⌉ comparaisons"""
+    return Estimation(ceil(log2(n + 1)))
+
+
+# --------------------------------------------------------------------------- #
+# Conversion vers NumPy
+# --------------------------------------------------------------------------- #
+def _vecteur(table, key):
+    """Valeurs numériques de table pour key : vue sans copie d'une colonne typée"""
+    if isinstance(table, DatasetColonnes):
+        cles = table.cles(key)
+        if isinstance(cles, array):
+            return np.frombuffer(cles, dtype=cles.typecode)
+        return np.asarray(cles, dtype=float)
+    return np.fromiter((_tri._get_numeric_value(item, key) for item in table),
+                       dtype=float, count=len(table))
+
+
+def _est_numerique(table, key):
+    """La colonne key de table est-elle numérique ? (première valeur présente)"""
+    if isinstance(table, DatasetColonnes):
+        return key in table.absentes
+    valeur = next((item[key] for item in table if item[key] is not None), None)
+    try:
+        float(valeur)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def _vue_colonne(table, key):
+    """Vue sans copie d'une colonne numérique complète d'un DatasetColonnes, sinon None"""
+    if isinstance(table, DatasetColonnes) and key in table.absentes:
+        cles = table.cles(key)
+        if cles is table.colonne(key):
+            return np.frombuffer(cles, dtype=cles.typecode)
+    return None
+
+
+def _cles(lst, key):
+    """
+    Clés de tri d'une clé simple, celles de algorithmes_tri._cles_tri : vue
+    sans copie d'une colonne numérique complète, sinon valeurs absentes à
+    +inf et colonnes texte par rang de collation.
+    """
+    vue = _vue_colonne(lst, key)
+    if vue is not None:
+        return vue
+    return np.asarray(_tri._cles_tri(lst, key), dtype=float)
+
+
+def _argsort(lst, key, kind):
+    """Ordre de tri des positions (np.lexsort pour une liste de specs multi-clés)"""
+    if isinstance(key, str):
+        return np.argsort(_cles(lst, key), kind=kind)
+    colonnes = list(zip(*_tri._cles_tri(lst, key)))
+    # lexsort trie par la dernière clé d'abord : ordre des specs inversé
+    return np.lexsort([np.asarray(c) for c in reversed(colonnes)])
+
+
+def _resultat(lst, ordre, index):
+    ordre = ordre.tolist()
+    if index:
+        return array('I', ordre)
+    if isinstance(lst, DatasetColonnes):
+        return lst.permuter(ordre)
+    return [lst[i] for i in ordre]
+
+
+def _trier(lst, key, kind, estimer, index):
+    """Même rôle que algorithmes_tri._trier, tri délégué à NumPy"""
+    n = len(lst)
+    if not n:
+        return (_tri._resultat_vide(lst, index),) + estimer(0) + (0.0,)
+    t0 = _now()
+    ordre = _argsort(lst, key, kind)
+    return (_resultat(lst, ordre, index),) + estimer(n) + (_now() - t0,)
+
+
+# --------------------------------------------------------------------------- #
+# Tris
+# --------------------------------------------------------------------------- #
+def tri_fusion(lst, key, variante="recursive", index=False):
+    """
+    Tri stable par np.argsort(kind="stable") (Timsort ou radix selon le type).
+    Retourne (liste triée, ≈comparaisons, temps_sec).
+    """
+    if np is None:
+        return _tri.tri_fusion(lst, key, variante, index)
+    if variante not in ("ascendante", "recursive", "adaptative"):
+        raise ValueError(f"Variante de tri fusion inconnue : {variante!r}")
+    return _trier(lst, key, "stable", _estimer_fusion, index)
+
+
+def tri_rapide(lst, key, variante="aleatoire", index=False):
+    """
+    Tri par np.argsort(kind="quicksort") (introsort de NumPy), non stable.
+    Retourne (liste triée, ≈comparaisons, ≈échanges, temps_sec).
+    """
+    if np is None:
+        return _tri.tri_rapide(lst, key, variante, index)
+    if variante not in ("aleatoire", "introsort"):
+        raise ValueError(f"Variante de tri rapide inconnue : {variante!r}")
+    return _trier(lst, key, "quicksort", _estimer_rapide, index)
+
+
+def tri_tas(lst, key, variante="binaire", index=False):
+    """
+    Tri par np.argsort(kind="heapsort"), non stable.
+    Retourne (liste triée, ≈comparaisons, ≈échanges, temps_sec).
+    """
+    if np is None:
+        return _tri.tri_tas(lst, key, variante, index)
+    if variante not in ("binaire", "recursive", "floyd", "4-aire"):
+        raise ValueError(f"Variante de tri par tas inconnue : {variante!r}")
+    return _trier(lst, key, "heapsort", _estimer_tas, index)
+
+
+def tri_radix(lst, key, index=False):
+    """
+    Tri stable de clés entières par np.argsort(kind="stable") (radix natif
+    de NumPy jusqu'à 16 bits). Retourne (liste triée, passes, ≈mouvements,
+    temps_sec) : une passe par octet de (max − min), comme tri_radix. Clés
+    réelles ou multiples : (liste triée, ≈comparaisons, 0, temps_sec).
+    """
+    if np is None:
+        return _tri.tri_radix(lst, key, index)
+    n = len(lst)
+    if not n:
+        return _tri._resultat_vide(lst, index), Estimation(0), Estimation(0), 0.0
+
+    t0 = _now()
+    if not isinstance(key, str):
+        ordre = _argsort(lst, key, "stable")
+        return _resultat(lst, ordre, index), _estimer_fusion(n)[0], 0, _now() - t0
+
+    cles = _cles(lst, key)
+    if cles.dtype.kind == "f":
+        if not np.all(np.isfinite(cles) & (cles == np.floor(cles))):
+            ordre = np.argsort(cles, kind="stable")
+            return _resultat(lst, ordre, index), _estimer_fusion(n)[0], 0, _now() - t0
+        cles = cles.astype(np.int64)
+    ordre = np.argsort(cles, kind="stable")
+    etendue = int(cles.max()) - int(cles.min())
+    passes = Estimation((etendue.bit_length() + 7) // 8)
+    return _resultat(lst, ordre, index), passes, Estimation(passes * n), _now() - t0
+
+
+# --------------------------------------------------------------------------- #
+# Recherches
+# --------------------------------------------------------------------------- #
+def recherche_binaire(sorted_table, cible, key):
+    """
+    Position de cible par np.searchsorted sur une colonne numérique complète
+    d'un DatasetColonnes, lue sans copie : O(log n), ≈comparaisons. La
+    position est la PREMIÈRE occurrence parmi les doublons, là où la
+    dichotomie Python renvoie le premier milieu égal à cible.
+    Une liste (ou une colonne avec valeurs absentes) devrait d'abord être
+    convertie en O(n) : dichotomie de algorithmes_recherche, position et
+    comparaisons exactes.
+    Retourne (position | -1, comparaisons, temps).
+    """
+    cles = _vue_colonne(sorted_table, key) if np is not None else None
+    if cles is None or not len(cles):
+        return _recherche.recherche_binaire(sorted_table, cible, key)
+    t0 = _now()
+    position = int(np.searchsorted(cles, cible, side="left"))
+    if position == len(cles) or cles[position] != cible:
+        position = -1
+    return position, _estimer_dichotomie(len(cles)), _now() - t0
+
+
+def recherche_dans_plage(table, key, min_val, max_val, trie=False):
+    """
+    Éléments de clé dans [min_val, max_val] : masque vectorisé (2
+    comparaisons par élément), ou deux np.searchsorted si trie=True (table
+    triée par key, les éléments sont alors une tranche contiguë).
+    Retourne (elements_trouves, ≈comparaisons, temps).
+    """
+    if np is None:
+        return _recherche.recherche_dans_plage(table, key, min_val, max_val)
+    if not len(table):
+        return [], Estimation(0), 0.0
+    t0 = _now()
+    cles = _vecteur(table, key)
+    if trie:
+        debut = int(np.searchsorted(cles, min_val, side="left"))
+        fin = int(np.searchsorted(cles, max_val, side="right"))
+        positions = np.arange(debut, max(debut, fin))
+        comp = Estimation(2 * _estimer_dichotomie(len(cles)))
+    else:
+        positions = np.flatnonzero((cles >= min_val) & (cles <= max_val))
+        comp = Estimation(2 * len(cles))
+    return _resultat(table, positions, False), comp, _now() - t0
+
+
+def recherche_min_max(table, key):
+    """
+    Minimum et maximum par réductions vectorisées de la colonne.
+    Retourne (min_val, max_val, ≈comparaisons, temps), 2·(n − 1) comparaisons
+    sur les n valeurs présentes (ABSENTE ignorée).
+    Une colonne non numérique (ex: commune) lève ValueError.
+    """
+    # Itérable sans longueur (ex: iter_biens) : parcours Python en un passage
+    if np is None or not isinstance(table, (list, tuple, DatasetColonnes)):
+        return _recherche.recherche_min_max(table, key)
+    if not len(table):
+        return None, None, Estimation(0), 0.0
+    if not _est_numerique(table, key):
+        raise ValueError(f"Colonne non numérique pour recherche_min_max : {key!r}")
+    t0 = _now()
+    cles = _vecteur(table, key)
+    cles = cles[cles != ABSENTE]
+    if not len(cles):
+        return None, None, Estimation(0), 0.0
+    if len(cles) == 1:
+        return float(cles[0]), float(cles[0]), Estimation(0), 0.0
+    return (float(cles.min()), float(cles.max()), Estimation(2 * (len(cles) - 1)),
+            _now() - t0)
+
+
+def _masque_egalite(table, colonne, valeur):
+    """Masque des lignes dont la colonne vaut valeur (codes pour une catégorielle)"""
+    if isinstance(table, DatasetColonnes):
+        brute = table.colonne(colonne)
+        if colonne in table.tables:
+            code = table.tables[colonne].codes.get(valeur)
+            if code is None:
+                return np.zeros(len(table), dtype=bool)
+            valeur = code
+        if isinstance(brute, array):
+            return np.frombuffer(brute, dtype=brute.typecode) == valeur
+        return np.array(brute, dtype=object) == valeur
+    valeurs = np.empty(len(table), dtype=object)
+    valeurs[:] = [item.get(colonne) for item in table]
+    return valeurs == valeur
+
+
+def _predicat(criteres):
+    """Prédicat Python équivalent à un dictionnaire de critères d'égalité"""
+    def _satisfait(elt):
+        return all(elt[colonne] == valeur for colonne, valeur in criteres.items())
+    return _satisfait
+
+
+def recherche_lineaire(table, predicate):
+    """
+    Recherche linéaire vectorisée. predicate est un dictionnaire de critères
+    {colonne: valeur} (toutes les égalités doivent être vraies), évalué par
+    masques sur les colonnes ; une fonction, qu'on ne peut pas vectoriser,
+    est évaluée par la recherche linéaire Python (comparaisons exactes).
+    Retourne (nombre_trouvés, ≈comparaisons, temps).
+    """
+    if callable(predicate):
+        return _recherche.recherche_lineaire(table, predicate)
+    if np is None:
+        return _recherche.recherche_lineaire(table, _predicat(predicate))
+    if not len(table):
+        return 0, Estimation(0), 0.0
+    t0 = _now()
+    masque = np.ones(len(table), dtype=bool)
+    for colonne, valeur in predicate.items():
+        masque &= _masque_egalite(table, colonne, valeur)
+    return int(masque.sum()), Estimation(len(table)), _now() - t0
@@ -3,39 +3,137 @@
   • Linéaire (compte ou position)
   • Binaire (nécessite tableau trié)
   • Min/Max (un seul parcours)
+ainsi que les statistiques d'ordre (k-ième élément, quantiles) par sélection.
 
 Chaque fonction renvoie les résultats + nombre de comparaisons + temps
+(compter=False : incréments des compteurs sautés, comparaisons à 0)
+
+Les recherches par clé acceptent aussi un DatasetColonnes : elles
+parcourent alors directement la colonne typée, sans accès dictionnaire.
 """
 
 from time import perf_counter as _now
 
+from utilitaires import DatasetColonnes, ABSENTE
+# Valeur absente : ABSENTE (+inf), après toutes les autres comme dans les tris
+from algorithmes_tri import (_cles_tri, _composante, _get_numeric_value, _normaliser_specs,
+                             _insertion_cles, _sous_plage, _pivot_ninther, _partition_3_voies, _version_moteur,
+                             SEUIL_INSERTION)
 
-def _get_numeric_value(item, key):
-    """
-    Extrait et convertit la valeur numérique pour la comparaison.
-    """
-    value = item[key]
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return 0.0
+
+# --------------------------------------------------------------------------- #
+# Versions sur clés précalculées : colonne typée d'un DatasetColonnes, ou
+# clés d'une liste extraites une seule fois comme pour les tris. Mêmes
+# comptages, sans accès dictionnaire ni conversion dans la boucle : avec
+# compter=False, le temps mesuré est celui de la recherche seule.
+# --------------------------------------------------------------------------- #
+def _cles_numeriques(table, key):
+    """Clés numériques de la colonne key (ABSENTE pour une valeur absente)"""
+    if isinstance(table, DatasetColonnes):
+        return table.cles(key)
+    return _composante([elt[key] for elt in table], False)
+
+
+def _recherche_lineaire_position_colonne(colonne, cible, compter=True):
+    comp = 0
+    t0 = _now()
+    for i, val in enumerate(colonne):
+        if compter:
+            comp += 1
+        if val == cible:
+            return i, comp, _now() - t0
+    return -1, comp, _now() - t0
+
+
+def _recherche_binaire_colonne(colonne, cible, compter=True):
+    gauche, droite = 0, len(colonne) - 1
+    comp = 0
+    t0 = _now()
+    while gauche <= droite:
+        milieu = (gauche + droite) // 2
+        val_milieu = colonne[milieu]
+        if compter:
+            comp += 1
+        if val_milieu == cible:
+            return milieu, comp, _now() - t0
+        elif val_milieu < cible:
+            gauche = milieu + 1
+        else:
+            droite = milieu - 1
+    return -1, comp, _now() - t0
+
+
+def _recherche_min_max_colonne(colonne, compter=True):
+    t0 = _now()
+    presentes = (val for val in colonne if val != ABSENTE)
+    val_init = next(presentes, None)
+    if val_init is None:
+        return None, None, 0, 0.0
+    val_min = val_max = val_init
+    comp = 0
+    seul = True
+    for val_courante in presentes:
+        seul = False
+        if compter:
+            comp += 1
+        if val_courante < val_min:
+            val_min = val_courante
+        if compter:
+            comp += 1
+        if val_courante > val_max:
+            val_max = val_courante
+    if seul:
+        return float(val_min), float(val_max), 0, 0.0
+    return float(val_min), float(val_max), comp, _now() - t0
+
+
+def _recherche_lineaire_multiple_colonne(colonne, valeur, compter=True):
+    positions = []
+    comp = 0
+    t0 = _now()
+    for i, val in enumerate(colonne):
+        if compter:
+            comp += 1
+        if val == valeur:
+            positions.append(i)
+    return positions, comp, _now() - t0
+
+
+def _recherche_dans_plage_colonne(table, colonne, min_val, max_val, compter=True):
+    positions = []
+    comp = 0
+    t0 = _now()
+    for i, val in enumerate(colonne):
+        if compter:
+            comp += 2
+        if min_val <= val <= max_val:
+            positions.append(i)
+    if isinstance(table, DatasetColonnes):
+        resultats = table.permuter(positions)
+    else:
+        resultats = [table[i] for i in positions]
+    return resultats, comp, _now() - t0
 
 
 # --------------------------------------------------------------------------- #
-def recherche_lineaire(table, predicate):
+def recherche_lineaire(table, predicate, compter=True, moteur="python"):
     """
     Recherche linéaire avec prédicat personnalisé.
     Compte tous les éléments qui satisfont la condition.
     
     Args:
-        table: Liste d'éléments à parcourir
+        table: Liste (ou itérable, ex: iter_biens) d'éléments à parcourir
         predicate: Fonction qui retourne True/False pour chaque élément
+        moteur: "python" ou "numpy" (masques vectorisés pour un
+            dictionnaire de critères {colonne: valeur})
     
     Returns:
         (nombre_trouvés, comparaisons, temps)
     """
+    version = _version_moteur(moteur, "recherche_lineaire")
+    if version:
+        return version(table, predicate)
+    
     if not table:
         return 0, 0, 0.0
     
@@ -43,14 +141,15 @@ def recherche_lineaire(table, predicate):
     t0 = _now()
     
     for elt in table:
-        comp += 1  
+        if compter:
+            comp += 1
         if predicate(elt):
             found += 1
     
     return found, comp, _now() - t0
 
 
-def recherche_lineaire_position(table, cible, key):
+def recherche_lineaire_position(table, cible, key, compter=True):
     """
     Recherche linéaire pour trouver la PREMIÈRE position d'une valeur.
     S'arrête dès qu'elle trouve la valeur.
@@ -63,22 +162,14 @@ def recherche_lineaire_position(table, cible, key):
     Returns:
         (position | -1, comparaisons, temps)
     """
-    if not table:
+    if not len(table):
         return -1, 0, 0.0
     
-    comp = 0
-    t0 = _now()
-    
-    for i, elt in enumerate(table):
-        comp += 1
-        if _get_numeric_value(elt, key) == cible:
-            return i, comp, _now() - t0
-    
-    return -1, comp, _now() - t0
+    return _recherche_lineaire_position_colonne(_cles_numeriques(table, key), cible, compter)
 
 
 # --------------------------------------------------------------------------- #
-def recherche_binaire(sorted_table, cible, key):
+def recherche_binaire(sorted_table, cible, key, compter=True, moteur="python"):
     """
     Recherche binaire dans un tableau TRIÉ.
     Divise l'espace de recherche en deux à chaque étape.
@@ -87,10 +178,18 @@ def recherche_binaire(sorted_table, cible, key):
         sorted_table: Liste triée par la clé spécifiée
         cible: Valeur numérique recherchée
         key: Clé du dictionnaire à comparer
+        moteur: "python" ou "numpy" (même dichotomie, voir algorithmes_numpy)
     
     Returns:
         (position | -1, comparaisons, temps)
     """
+    version = _version_moteur(moteur, "recherche_binaire")
+    if version:
+        return version(sorted_table, cible, key)
+    
+    if isinstance(sorted_table, DatasetColonnes) and len(sorted_table):
+        return _recherche_binaire_colonne(sorted_table.cles(key), cible, compter)
+    
     if not sorted_table:
         return -1, 0, 0.0
     
@@ -102,7 +201,51 @@ def recherche_binaire(sorted_table, cible, key):
         milieu = (gauche + droite) // 2
         val_milieu = _get_numeric_value(sorted_table[milieu], key)
         
-        comp += 1   
+        if compter:
+            comp += 1
+        
+        if val_milieu == cible:
+            return milieu, comp, _now() - t0
+        elif val_milieu < cible:
+            gauche = milieu + 1
+        else:
+            droite = milieu - 1
+    
+    return -1, comp, _now() - t0
+
+
+def recherche_binaire_permutation(table, perm, cible, key, compter=True):
+    """
+    Recherche binaire à travers une permutation de tri (tri_*(..., index=True)) :
+    la table n'est pas réordonnée, perm donne l'ordre trié par la clé.
+    
+    Args:
+        table: Liste (ou DatasetColonnes) dans son ordre d'origine
+        perm: Permutation triant table par key (array('I') ou liste)
+        cible: Valeur numérique recherchée
+        key: Clé du dictionnaire à comparer
+    
+    Returns:
+        (rang dans perm | -1, comparaisons, temps) ; l'élément trouvé est
+        table[perm[rang]]
+    """
+    if not len(perm):
+        return -1, 0, 0.0
+    
+    colonne = table.cles(key) if isinstance(table, DatasetColonnes) else None
+    gauche, droite = 0, len(perm) - 1
+    comp = 0
+    t0 = _now()
+    
+    while gauche <= droite:
+        milieu = (gauche + droite) // 2
+        if colonne is not None:
+            val_milieu = colonne[perm[milieu]]
+        else:
+            val_milieu = _get_numeric_value(table[perm[milieu]], key)
+        
+        if compter:
+            comp += 1
         
         if val_milieu == cible:
             return milieu, comp, _now() - t0
@@ -115,51 +258,69 @@ def recherche_binaire(sorted_table, cible, key):
 
 
 # --------------------------------------------------------------------------- #
-def recherche_min_max(table, key):
+def recherche_min_max(table, key, compter=True, moteur="python"):
     """
     Trouve le minimum et maximum en un seul parcours.
-    Optimisé pour faire exactement 2*(n-1) comparaisons.
+    Optimisé pour faire exactement 2*(n-1) comparaisons, n valeurs
+    présentes : les valeurs absentes (ABSENTE) sont ignorées.
+    Accepte une liste ou n'importe quel itérable (ex: iter_biens).
     
     Args:
-        table: Liste d'éléments
+        table: Liste (ou itérable) d'éléments
         key: Clé du dictionnaire à analyser
+        moteur: "python" ou "numpy" (réductions vectorisées, colonne
+            numérique uniquement)
     
     Returns:
         (min_val, max_val, comparaisons, temps)
     """
+    version = _version_moteur(moteur, "recherche_min_max")
+    if version:
+        return version(table, key)
+    
+    if isinstance(table, (list, tuple, DatasetColonnes)):
+        return _recherche_min_max_colonne(_cles_numeriques(table, key), compter)
+    
+    # Itérable parcouru une seule fois (ex: iter_biens) : conversion à la
+    # volée, sans garder toutes les clés en mémoire
     if not table:
         return None, None, 0, 0.0
     
-    if len(table) == 1:
-        val = _get_numeric_value(table[0], key)
-        return val, val, 0, 0.0
-    
     t0 = _now()
+    valeurs = (_get_numeric_value(elt, key) for elt in table)
+    presentes = (val for val in valeurs if val != ABSENTE)
     
+    val_init = next(presentes, None)
+    if val_init is None:
+        return None, None, 0, 0.0
     
-    val_init = _get_numeric_value(table[0], key)
     val_min = val_max = val_init
     comp = 0
     
-   
-    for elt in table[1:]:
-        val_courante = _get_numeric_value(elt, key)
+    seul = True
+    for val_courante in presentes:
+        seul = False
         
        
-        comp += 1
+        if compter:
+            comp += 1
         if val_courante < val_min:
             val_min = val_courante
         
       
-        comp += 1
+        if compter:
+            comp += 1
         if val_courante > val_max:
             val_max = val_courante
     
+    if seul:
+        return val_min, val_max, 0, 0.0
+    
     return val_min, val_max, comp, _now() - t0
 
 
 # --------------------------------------------------------------------------- #
-def recherche_lineaire_multiple(table, key, valeur):
+def recherche_lineaire_multiple(table, key, valeur, compter=True):
     """
     Trouve TOUTES les positions d'une valeur dans le tableau.
     Utile quand il peut y avoir des doublons.
@@ -172,22 +333,14 @@ def recherche_lineaire_multiple(table, key, valeur):
     Returns:
         (liste_positions, comparaisons, temps)
     """
-    if not table:
+    if not len(table):
         return [], 0, 0.0
     
-    positions = []
-    comp = 0
-    t0 = _now()
-    
-    for i, elt in enumerate(table):
-        comp += 1
-        if _get_numeric_value(elt, key) == valeur:
-            positions.append(i)
-    
-    return positions, comp, _now() - t0
+    return _recherche_lineaire_multiple_colonne(_cles_numeriques(table, key), valeur, compter)
 
 
-def recherche_dans_plage(table, key, min_val, max_val):
+def recherche_dans_plage(table, key, min_val, max_val, compter=True, moteur="python",
+                         trie=False):
     """
     Trouve tous les éléments dans une plage de valeurs [min_val, max_val].
     
@@ -196,24 +349,169 @@ def recherche_dans_plage(table, key, min_val, max_val):
         key: Clé du dictionnaire à comparer
         min_val: Valeur minimale (incluse)
         max_val: Valeur maximale (incluse)
+        moteur: "python" ou "numpy" (masque vectorisé)
+        trie: table triée par key ; le moteur numpy borne alors la plage
+            par deux np.searchsorted (le moteur python parcourt tout)
     
     Returns:
         (elements_trouves, comparaisons, temps)
     """
-    if not table:
+    version = _version_moteur(moteur, "recherche_dans_plage")
+    if version:
+        return version(table, key, min_val, max_val, trie)
+    
+    if not len(table):
         return [], 0, 0.0
     
-    resultats = []
+    return _recherche_dans_plage_colonne(table, _cles_numeriques(table, key), min_val, max_val,
+                                         compter)
+
+
+# --------------------------------------------------------------------------- #
+# Statistiques d'ordre : introselect multiple (sans tri complet)
+# --------------------------------------------------------------------------- #
+def _pivot_mediane_des_medianes(cles, bas, haut, compter=True):
+    """
+    Valeur pivot par médiane des médianes (groupes de 5) : garantit une
+    partition équilibrée, donc une sélection en O(n) dans le pire cas.
+    Retourne (valeur, comp).
+    """
+    comp = 0
+    medianes = []
+    for debut in range(bas, haut + 1, 5):
+        groupe = cles[debut:min(debut + 5, haut + 1)]
+        comp += _insertion_cles(groupe, [None] * len(groupe), compter)[0]
+        medianes.append(groupe[len(groupe) // 2])
+    rang = len(medianes) // 2
+    comp += _selection_multiple(medianes, [None] * len(medianes), [rang], True, compter)
+    return medianes[rang], comp
+
+
+def _selection_multiple(cles, perm, rangs, lineaire=False, compter=True):
+    """
+    Introselect multiple : place en position r (ordre croissant) l'élément de
+    rang r pour chaque r de rangs, en une seule descente de partitions 3
+    voies. Une partition n'est poursuivie que du côté où restent des rangs
+    demandés : O(n) en moyenne pour un nombre fixe de rangs.
+    Pivot ninther ; au-delà de 2·log2(n) partitions (ou si lineaire=True),
+    pivot médiane des médianes. Retourne le nombre de comparaisons.
+    """
     comp = 0
+    n = len(cles)
+    pile = [(0, n - 1, sorted(set(rangs)), 0 if lineaire else 2 * (n.bit_length() - 1))]
+
+    while pile:
+        bas, haut, cibles, profondeur = pile.pop()
+        if not cibles:
+            continue
+        if haut - bas + 1 <= SEUIL_INSERTION:
+            comp += _sous_plage(_insertion_cles, cles, perm, bas, haut, compter)[0]
+            continue
+
+        if profondeur > 0:
+            pivot_idx, c = _pivot_ninther(cles, bas, haut)
+            pivot_val = cles[pivot_idx]
+        else:
+            pivot_val, c = _pivot_mediane_des_medianes(cles, bas, haut, compter)
+        lt, gt, c_part, _ = _partition_3_voies(cles, perm, bas, haut, pivot_val, compter)
+        if compter:
+            comp += c + c_part
+
+        # Les rangs dans [lt, gt] tombent sur le pivot : déjà placés
+        pile.append((bas, lt - 1, [r for r in cibles if r < lt], max(0, profondeur - 1)))
+        pile.append((gt + 1, haut, [r for r in cibles if r > gt], max(0, profondeur - 1)))
+
+    return comp
+
+
+def _rang_quantile(q, n):
+    """Rang du quantile q (0 ≤ q ≤ 1) parmi n valeurs : rang inférieur ⌊q·n⌋"""
+    if not 0 <= q <= 1:
+        raise ValueError(f"Quantile hors de [0, 1] : {q}")
+    return min(int(q * n), n - 1)
+
+
+def selection_k(table, key, k, compter=True):
+    """
+    Sélection du k-ième plus petit élément (k = 0 : le minimum) sans trier
+    la table : introselect, O(n) en moyenne et dans le pire cas.
+    
+    Args:
+        table: Liste d'éléments (ou DatasetColonnes)
+        key: Clé du dictionnaire à comparer (ou specs multi-clés)
+        k: Rang recherché, de 0 à len(table) - 1
+    
+    Returns:
+        (élément | None, comparaisons, temps)
+    """
+    if not len(table) or not 0 <= k < len(table):
+        return None, 0, 0.0
+    
     t0 = _now()
+    cles = _cles_tri(table, key)
+    perm = list(range(len(cles)))
+    comp = _selection_multiple(cles, perm, [k], compter=compter)
+    return table[perm[k]], comp, _now() - t0
+
+
+def quantiles(table, key, qs, compter=True):
+    """
+    Plusieurs quantiles en une seule passe de partitionnement : les rangs
+    demandés partagent les mêmes partitions au lieu d'un tri complet.
+    Le quantile q est la valeur de rang ⌊q·n⌋ (q = 1 : le maximum).
     
-    for elt in table:
-        val = _get_numeric_value(elt, key)
-        comp += 2   
-        if min_val <= val <= max_val:
-            resultats.append(elt)
+    Args:
+        table: Liste d'éléments (ou DatasetColonnes)
+        key: Clé du dictionnaire à analyser (ou specs multi-clés)
+        qs: Quantiles recherchés, entre 0 et 1 (ex: [0.25, 0.5, 0.75])
     
-    return resultats, comp, _now() - t0
+    Returns:
+        (valeurs de la colonne dans l'ordre de qs, comparaisons, temps) ;
+        pour des specs multi-clés, un tuple de valeurs par quantile
+    """
+    if not len(table):
+        return [None] * len(qs), 0, 0.0
+    
+    t0 = _now()
+    cles = _cles_tri(table, key)
+    perm = list(range(len(cles)))
+    rangs = [_rang_quantile(q, len(cles)) for q in qs]
+    comp = _selection_multiple(cles, perm, rangs, compter=compter)
+    # Valeurs de la table, pas les clés internes (rangs de collation, opposées, ABSENTE)
+    lignes = [table[perm[r]] for r in rangs]
+    if isinstance(key, str):
+        valeurs = [ligne[key] for ligne in lignes]
+    else:
+        colonnes = [k for k, _ in _normaliser_specs(key)]
+        valeurs = [tuple(ligne[k] for k in colonnes) for ligne in lignes]
+    return valeurs, comp, _now() - t0
+
+
+# --------------------------------------------------------------------------- #
+class IndexValeurs:
+    """
+    Index par valeur exacte d'une clé (ex: commune, type_local).
+    Maintenu incrémentalement via ajouter(biens), par exemple depuis SuiviCSV.
+    """
+
+    def __init__(self, biens, key):
+        self.key = key
+        self.groupes = {}
+        self.ajouter(biens)
+
+    def ajouter(self, biens):
+        """Ajoute des biens à l'index."""
+        for bien in biens:
+            self.groupes.setdefault(bien[self.key], []).append(bien)
+
+    def rechercher(self, valeur):
+        """
+        Retourne (biens_trouvés, comparaisons, temps) : une seule recherche
+        dans la table de hachage au lieu d'un parcours complet.
+        """
+        t0 = _now()
+        trouves = self.groupes.get(valeur, [])
+        return trouves, 1, _now() - t0
 
 
 # --------------------------------------------------------------------------- #
@@ -269,6 +567,7 @@ def analyser_repartition(biens, key):
     """
     Analyse la répartition des valeurs pour une clé donnée.
     Utile pour comprendre les performances des algorithmes.
+    Accepte une liste ou un itérable parcouru une seule fois (ex: iter_biens).
     """
     if not biens:
         return
@@ -276,26 +575,27 @@ def analyser_repartition(biens, key):
     valeurs = []
     for bien in biens:
         val = _get_numeric_value(bien, key)
-        if val > 0:   
+        if 0 < val != ABSENTE:   
             valeurs.append(val)
     
     if not valeurs:
         print(f"Aucune valeur valide pour la clé '{key}'")
         return
     
-    valeurs.sort()
+    # Min, Q1, médiane, Q3 et max en une seule sélection, sans tri complet
     n = len(valeurs)
+    rangs = [_rang_quantile(q, n) for q in (0, 0.25, 0.5, 0.75, 1)]
+    _selection_multiple(valeurs, [None] * n, rangs)
+    minimum, q1, mediane, q3, maximum = [valeurs[r] for r in rangs]
     
     print(f"\n📈 ANALYSE DE RÉPARTITION - {key}")
     print(f"   • Nombre de valeurs : {n}")
-    print(f"   • Minimum : {valeurs[0]:,.0f}")
-    print(f"   • Maximum : {valeurs[-1]:,.0f}")
-    print(f"   • Médiane : {valeurs[n//2]:,.0f}")
-    print(f"   • Étendue : {valeurs[-1] - valeurs[0]:,.0f}")
+    print(f"   • Minimum : {minimum:,.0f}")
+    print(f"   • Maximum : {maximum:,.0f}")
+    print(f"   • Médiane : {mediane:,.0f}")
+    print(f"   • Étendue : {maximum - minimum:,.0f}")
+    
     
-     
-    q1 = valeurs[n//4]
-    q3 = valeurs[3*n//4]
     print(f"   • Q1 : {q1:,.0f}")
     print(f"   • Q3 : {q3:,.0f}")
     
@@ -2,206 +2,1482 @@
 Implémentation complète des 4 algorithmes de tri :
   • Sélection   • Insertion
   • Fusion      • Rapide (pivot aléatoire)
+ainsi que le tri par tas (bonus) et le tri radix sur clés entières.
 
 Chaque fonction renvoie :
     (liste triée, nb_comparaisons, nb_échanges|décalages, temps_sec)
 
+Chaque fonction accepte aussi un DatasetColonnes : le tri s'effectue alors
+directement sur la colonne typée et renvoie un DatasetColonnes réordonné.
+
+La clé `key` est un nom de colonne, ou une liste de specs multi-clés
+[(key, "asc"|"desc"), ...] : l'ordre lexicographique complet est alors
+obtenu en une seule passe de tri (ex. commune, type_local, prix décroissant).
+
+Avec index=True, la liste triée est remplacée par la permutation des
+positions d'origine (array('I'), 4 octets par ligne) : plusieurs ordres du
+même dataset coexistent sans copie des enregistrements (voir
+appliquer_permutation, inverser_permutation, composer_permutations).
+
 Comptage précis de toutes les opérations selon les spécifications.
+Avec compter=False, la même fonction s'exécute sans compter : chaque
+incrément est gardé par `if compter:` (compteurs renvoyés à 0), si bien
+que le temps mesuré est celui de l'algorithme seul.
 """
 
 from time import perf_counter as _now
 from random import randint
+from array import array
+from functools import total_ordering
+from heapq import heappush, heappop, merge
+from concurrent.futures import ProcessPoolExecutor
+import os
+import shutil
+import sys
+import tempfile
+import unicodedata
+
+from utilitaires import (DatasetColonnes, SCHEMA_BIENS, ABSENTE, ouvrir_csv,
+                         parse_csv_line, _message_ligne_ignoree)
+
+
+def _nombre(valeur):
+    """Valeur numérique d'une cellule : ABSENTE si vide, NaN ou non numérique"""
+    if isinstance(valeur, (int, float)):
+        return valeur if valeur == valeur else ABSENTE
+    try:
+        nombre = float(valeur)
+    except (ValueError, TypeError):
+        return ABSENTE
+    return nombre if nombre == nombre else ABSENTE
 
 
 def _get_numeric_value(item, key):
     """
     Extrait et convertit la valeur numérique pour la comparaison.
-    Gère les cas où la valeur est déjà un nombre ou une chaîne.
+    Gère les cas où la valeur est déjà un nombre ou une chaîne ; une valeur
+    absente ou non numérique vaut ABSENTE, comme dans les clés de tri.
     """
-    value = item[key]
-    if isinstance(value, (int, float)):
-        return float(value)
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return 0.0
+    return float(_nombre(item[key]))
 
 
-# --------------------------------------------------------------------------- #
-def tri_selection(lst, key):
+DIRECTIONS = {"asc": False, "desc": True}
+
+
+def _normaliser_specs(specs):
+    """[(key, direction)] ou [key] → [(key, décroissant)]"""
+    normalisees = []
+    for spec in specs:
+        key, direction = (spec, "asc") if isinstance(spec, str) else spec
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Direction de tri inconnue pour {key} : {direction!r} (asc ou desc)")
+        normalisees.append((key, DIRECTIONS[direction]))
+    if not normalisees:
+        raise ValueError("Liste de clés de tri vide")
+    return normalisees
+
+
+def _cle_collation(texte):
+    """Collation des chaînes : sans accents ni casse, puis texte brut pour départager"""
+    decompose = unicodedata.normalize("NFKD", texte)
+    base = "".join(c for c in decompose if not unicodedata.combining(c))
+    return base.casefold(), texte
+
+
+def _composante(valeurs, decroissant, numerique=True):
     """
-    Tri par sélection : trouve le minimum et l'échange avec l'élément courant.
-    Complexité : O(n²) comparaisons, O(n) échanges
+    Composante numérique d'une clé composite pour une colonne : la valeur
+    (opposée si décroissant) pour une colonne numérique, sinon le rang de la
+    chaîne dans l'ordre de collation (opposé si décroissant). Dans une
+    colonne numérique, une cellule absente ou non numérique (None, NaN, "",
+    "N/A") est placée en dernier dans les deux sens.
     """
-    if not lst:
-        return [], 0, 0, 0.0
-    
-    t0 = _now()
-    tab = lst.copy()  
-    n = len(tab)
+    if numerique:
+        nombres = [v if isinstance(v, (int, float)) and v == v else _nombre(v) for v in valeurs]
+        return [v if v == ABSENTE else -v for v in nombres] if decroissant else nombres
+    textes = ["" if v is None else str(v) for v in valeurs]
+    rangs = {texte: rang for rang, texte in enumerate(sorted(set(textes), key=_cle_collation))}
+    signe = -1 if decroissant else 1
+    return [signe * rangs[texte] for texte in textes]
+
+
+def _colonne_numerique(lst, key, valeurs):
+    """
+    Type d'une colonne pour ses clés de tri : celui du schéma (colonnes
+    typées d'un DatasetColonnes, puis SCHEMA_BIENS), sinon celui de la
+    majorité des valeurs présentes. Une cellule isolée ne change pas le type.
+    """
+    if isinstance(lst, DatasetColonnes):
+        return key in lst.absentes
+    if key in SCHEMA_BIENS.colonnes:
+        return SCHEMA_BIENS.type_colonne(key)[0] in (int, float)
+    presentes = [v for v in valeurs if v is not None and v != ""]
+    nombres = sum(1 for v in presentes if _nombre(v) != ABSENTE)
+    return 2 * nombres >= len(presentes)
+
+
+def _valeurs_colonne(lst, key):
+    """
+    Valeurs d'une colonne : codes catégoriels décodés, et ABSENTE pour les
+    valeurs numériques absentes d'un DatasetColonnes.
+    """
+    if isinstance(lst, DatasetColonnes):
+        if key in lst.absentes:
+            return lst.cles(key)
+        colonne = lst.colonne(key)
+        if key in lst.tables:
+            valeurs = lst.tables[key].valeurs
+            return [valeurs[code] for code in colonne]
+        return colonne
+    return [item[key] for item in lst]
+
+
+def _composante_colonne(lst, key, decroissant):
+    """Composante de clé de la colonne key, selon son type"""
+    valeurs = _valeurs_colonne(lst, key)
+    return _composante(valeurs, decroissant, _colonne_numerique(lst, key, valeurs))
+
+
+def _cles_composites(lst, specs):
+    """Clés composites (tuples) calculées une seule fois, colonne par colonne"""
+    composantes = [_composante_colonne(lst, key, decroissant)
+                   for key, decroissant in _normaliser_specs(specs)]
+    return list(zip(*composantes))
+
+
+def _cles_tri(lst, key):
+    """
+    Clés de comparaison de chaque élément pour une clé simple ou multi-clés.
+    Une clé simple suit les règles de _composante : valeurs numériques,
+    absentes en dernier, colonnes texte par rang de collation.
+    """
+    if not isinstance(key, str):
+        return _cles_composites(lst, key)
+    if isinstance(lst, DatasetColonnes) and key in lst.absentes:
+        return list(lst.cles(key))
+    return _composante_colonne(lst, key, False)
+
+
+# --------------------------------------------------------------------------- #
+# Moteurs de tri sur clés précalculées. Chaque clé est extraite une seule
+# fois (_cles_tri ou colonne typée) dans la liste `cles` ; les
+# éléments `perm` (biens ou indices de lignes) suivent exactement les mêmes
+# mouvements. Les compteurs sont ceux des algorithmes décrits dans tri_*.
+# compter=False saute les incréments : une seule définition pour les deux modes.
+# --------------------------------------------------------------------------- #
+def _selection_cles(cles, perm, compter=True):
+    n = len(cles)
     comp = exch = 0
 
     for i in range(n - 1):
         min_idx = i
-        
-        
         for j in range(i + 1, n):
-            comp += 1
-            if _get_numeric_value(tab[j], key) < _get_numeric_value(tab[min_idx], key):
+            if compter:
+                comp += 1
+            if cles[j] < cles[min_idx]:
                 min_idx = j
-        
-         
+
         if min_idx != i:
-            tab[i], tab[min_idx] = tab[min_idx], tab[i]
-            exch += 1
-    
-    return tab, comp, exch, _now() - t0
+            cles[i], cles[min_idx] = cles[min_idx], cles[i]
+            perm[i], perm[min_idx] = perm[min_idx], perm[i]
+            if compter:
+                exch += 1
 
+    return comp, exch
 
-# --------------------------------------------------------------------------- #
-def tri_insertion(lst, key):
-    """
-    Tri par insertion : insère chaque élément à sa place dans la partie triée.
-    Complexité : O(n²) comparaisons, O(n²) décalages
-    """
-    if not lst:
-        return [], 0, 0, 0.0
-    
-    t0 = _now()
-    tab = lst.copy()
+
+def _insertion_cles(cles, perm, compter=True):
     comp = shift = 0
 
-    for i in range(1, len(tab)):
-        pivot = tab[i]
-        pivot_val = _get_numeric_value(pivot, key)
+    for i in range(1, len(cles)):
+        pivot_val = cles[i]
+        pivot_idx = perm[i]
         j = i - 1
-        
-         
+
         while j >= 0:
-            comp += 1   
-            if _get_numeric_value(tab[j], key) > pivot_val:
-                tab[j + 1] = tab[j]
-                shift += 1
+            if compter:
+                comp += 1
+            if cles[j] > pivot_val:
+                cles[j + 1] = cles[j]
+                perm[j + 1] = perm[j]
+                if compter:
+                    shift += 1
                 j -= 1
             else:
                 break
-        
-        
-        if j + 1 != i:   
-            tab[j + 1] = pivot
-            shift += 1
-    
-    return tab, comp, shift, _now() - t0
 
+        if j + 1 != i:
+            cles[j + 1] = pivot_val
+            perm[j + 1] = pivot_idx
+            if compter:
+                shift += 1
 
-# --------------------------------------------------------------------------- #
-def tri_fusion(lst, key):
-    """
-    Tri fusion : divise la liste en deux, trie récursivement, puis fusionne.
-    Complexité : O(n log n) comparaisons, O(n log n) temps
-    """
-    if not lst:
-        return [], 0, 0.0
-    
-    t0 = _now()
-    comp = [0]  
+    return comp, shift
+
+
+def _fusion_cles(cles, perm, compter=True):
+    comp = [0]
 
     def _merge(gauche, droite):
-        """Fusionne deux listes triées."""
         resultat = []
         i = j = 0
-        
-       
         while i < len(gauche) and j < len(droite):
-            comp[0] += 1
-            if _get_numeric_value(gauche[i], key) <= _get_numeric_value(droite[j], key):
+            if compter:
+                comp[0] += 1
+            if cles[gauche[i]] <= cles[droite[j]]:
                 resultat.append(gauche[i])
                 i += 1
             else:
                 resultat.append(droite[j])
                 j += 1
-        
-        
         resultat.extend(gauche[i:])
         resultat.extend(droite[j:])
         return resultat
 
     def _tri_fusion_recursif(tab):
-        """Fonction récursive de tri fusion."""
         if len(tab) <= 1:
             return tab
-        
-      
         milieu = len(tab) // 2
-        gauche = _tri_fusion_recursif(tab[:milieu])
-        droite = _tri_fusion_recursif(tab[milieu:])
-        
-        
-        return _merge(gauche, droite)
+        return _merge(_tri_fusion_recursif(tab[:milieu]), _tri_fusion_recursif(tab[milieu:]))
 
-    resultat = _tri_fusion_recursif(lst.copy())
-    return resultat, comp[0], _now() - t0
+    # Le tri fusion travaille sur les positions : les clés restent en place
+    ordre = _tri_fusion_recursif(list(range(len(cles))))
+    perm[:] = [perm[i] for i in ordre]
+    cles[:] = [cles[i] for i in ordre]
+    return (comp[0],)
 
 
-# --------------------------------------------------------------------------- #
-def tri_rapide(lst, key):
+def _fusion_ascendante_cles(cles, perm, compter=True):
+    n = len(cles)
+    comp = 0
+    # Un seul tampon auxiliaire : chaque passe fusionne les séries de largeur
+    # `largeur` de `src` vers `dst`, puis les rôles s'inversent
+    src_cles, src_perm = cles, perm
+    dst_cles, dst_perm = [None] * n, [None] * n
+
+    largeur = 1
+    while largeur < n:
+        for bas in range(0, n, 2 * largeur):
+            milieu = min(bas + largeur, n)
+            haut = min(bas + 2 * largeur, n)
+            if milieu >= haut:
+                dst_cles[bas:haut] = src_cles[bas:haut]
+                dst_perm[bas:haut] = src_perm[bas:haut]
+                continue
+            i, j, k = bas, milieu, bas
+            cle_g, cle_d = src_cles[i], src_cles[j]
+            while True:
+                if compter:
+                    comp += 1
+                # <= : à clé égale, l'élément de gauche passe en premier (stabilité)
+                if cle_g <= cle_d:
+                    dst_cles[k] = cle_g
+                    dst_perm[k] = src_perm[i]
+                    i += 1
+                    k += 1
+                    if i == milieu:
+                        break
+                    cle_g = src_cles[i]
+                else:
+                    dst_cles[k] = cle_d
+                    dst_perm[k] = src_perm[j]
+                    j += 1
+                    k += 1
+                    if j == haut:
+                        break
+                    cle_d = src_cles[j]
+            # Recopie du reste de la série non épuisée
+            if i < milieu:
+                dst_cles[k:haut] = src_cles[i:milieu]
+                dst_perm[k:haut] = src_perm[i:milieu]
+            else:
+                dst_cles[k:haut] = src_cles[j:haut]
+                dst_perm[k:haut] = src_perm[j:haut]
+        src_cles, dst_cles = dst_cles, src_cles
+        src_perm, dst_perm = dst_perm, src_perm
+        largeur *= 2
+
+    if src_cles is not cles:
+        cles[:] = src_cles
+        perm[:] = src_perm
+    return (comp,)
+
+
+GALOP_MIN = 7   # victoires consécutives d'une série avant de passer au galop
+
+
+def _minrun(n):
+    """Longueur minimale des séries : entre 32 et 64, n / minrun proche d'une puissance de 2"""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _galoper(x, cles, bas, haut, droite, compter=True):
     """
-    Tri rapide avec pivot aléatoire : partitionne autour d'un pivot et trie récursivement.
-    Complexité moyenne : O(n log n), pire cas : O(n²)
+    Recherche exponentielle puis dichotomique dans cles[bas:haut] (trié).
+    droite=True  → premier indice k tel que cles[k] > x
+    droite=False → premier indice k tel que cles[k] >= x
+    Retourne (k, nb_comparaisons).
     """
-    if not lst:
-        return [], 0, 0, 0.0
-    
-    t0 = _now()
-    tab = lst.copy()
-    comp = [0]
-    exch = [0]
+    comp = 0
+    n = haut - bas
+    debut = 0
+    sonde = 0
+    pas = 1
+    while sonde < n:
+        if compter:
+            comp += 1
+        v = cles[bas + sonde]
+        if v <= x if droite else v < x:
+            debut = sonde + 1
+            sonde += pas
+            pas *= 2
+        else:
+            break
+    fin = min(sonde, n)
+    while debut < fin:
+        m = (debut + fin) // 2
+        if compter:
+            comp += 1
+        v = cles[bas + m]
+        if v <= x if droite else v < x:
+            debut = m + 1
+        else:
+            fin = m
+    return bas + debut, comp
+
+
+def _fusion_adaptative_cles(cles, perm, compter=True):
+    n = len(cles)
+    if n < 2:
+        return (0,)
+    comp = 0
+    galop_min = GALOP_MIN
+    series = []   # pile de [début, longueur]
+
+    def _longueur_serie(bas):
+        """Longueur de la série naturelle en bas ; une série strictement décroissante est retournée"""
+        nonlocal comp
+        fin = bas + 1
+        if fin == n:
+            return 1
+        if compter:
+            comp += 1
+        if cles[fin] < cles[bas]:
+            fin += 1
+            while fin < n:
+                if compter:
+                    comp += 1
+                if not cles[fin] < cles[fin - 1]:
+                    break
+                fin += 1
+            # Strictement décroissante : l'inversion ne casse pas la stabilité
+            cles[bas:fin] = cles[bas:fin][::-1]
+            perm[bas:fin] = perm[bas:fin][::-1]
+        else:
+            fin += 1
+            while fin < n:
+                if compter:
+                    comp += 1
+                if cles[fin] < cles[fin - 1]:
+                    break
+                fin += 1
+        return fin - bas
+
+    def _insertion_binaire(bas, debut, fin):
+        """Étend la série triée cles[bas:debut] jusqu'à fin par insertion dichotomique"""
+        nonlocal comp
+        for i in range(debut, fin):
+            cle, elem = cles[i], perm[i]
+            # Dichotomie « à droite » : après les clés égales (stabilité)
+            g, d = bas, i
+            while g < d:
+                m = (g + d) // 2
+                if compter:
+                    comp += 1
+                if cle < cles[m]:
+                    d = m
+                else:
+                    g = m + 1
+            if g != i:
+                cles[g + 1:i + 1] = cles[g:i]
+                perm[g + 1:i + 1] = perm[g:i]
+                cles[g] = cle
+                perm[g] = elem
+
+    def _fusionner(a, b, c):
+        """Fusionne cles[a:b] et cles[b:c] avec galop ; seule la partie gauche utile est copiée"""
+        nonlocal comp, galop_min
+        # Éléments déjà à leur place de part et d'autre
+        a, cmp_ = _galoper(cles[b], cles, a, b, True, compter)
+        comp += cmp_
+        if a == b:
+            return
+        c, cmp_ = _galoper(cles[b - 1], cles, b, c, False, compter)
+        comp += cmp_
+
+        tmp_cles = cles[a:b]
+        tmp_perm = perm[a:b]
+        i, j, k = 0, b, a
+        n1 = b - a
+
+        while i < n1 and j < c:
+            # Mode normal : un élément à la fois
+            gains_g = gains_d = 0
+            while i < n1 and j < c:
+                if compter:
+                    comp += 1
+                if cles[j] < tmp_cles[i]:
+                    cles[k] = cles[j]
+                    perm[k] = perm[j]
+                    j += 1
+                    gains_d += 1
+                    gains_g = 0
+                else:
+                    cles[k] = tmp_cles[i]
+                    perm[k] = tmp_perm[i]
+                    i += 1
+                    gains_g += 1
+                    gains_d = 0
+                k += 1
+                if gains_g >= galop_min or gains_d >= galop_min:
+                    break
+
+            # Mode galop : copie de blocs entiers trouvés par recherche exponentielle
+            while i < n1 and j < c:
+                fin, cmp_ = _galoper(cles[j], tmp_cles, i, n1, True, compter)
+                comp += cmp_
+                gains_g = fin - i
+                cles[k:k + gains_g] = tmp_cles[i:fin]
+                perm[k:k + gains_g] = tmp_perm[i:fin]
+                k += gains_g
+                i = fin
+                if i == n1:
+                    break
+
+                fin, cmp_ = _galoper(tmp_cles[i], cles, j, c, False, compter)
+                comp += cmp_
+                gains_d = fin - j
+                cles[k:k + gains_d] = cles[j:fin]
+                perm[k:k + gains_d] = perm[j:fin]
+                k += gains_d
+                j = fin
+
+                if gains_g < GALOP_MIN and gains_d < GALOP_MIN:
+                    galop_min += 1
+                    break
+                galop_min = max(1, galop_min - 1)
+
+        # Reste de la série gauche (le reste droit est déjà en place)
+        cles[k:k + n1 - i] = tmp_cles[i:]
+        perm[k:k + n1 - i] = tmp_perm[i:]
+
+    def _fusionner_series(i):
+        debut, longueur = series[i]
+        debut_d, longueur_d = series[i + 1]
+        series[i] = [debut, longueur + longueur_d]
+        del series[i + 1]
+        _fusionner(debut, debut_d, debut_d + longueur_d)
+
+    def _equilibrer():
+        """Invariant de pile : |A| > |B| + |C| et |B| > |C| pour les 3 séries du sommet"""
+        while len(series) > 1:
+            i = len(series) - 2
+            if (i > 0 and series[i - 1][1] <= series[i][1] + series[i + 1][1]) or \
+               (i > 1 and series[i - 2][1] <= series[i - 1][1] + series[i][1]):
+                if series[i - 1][1] < series[i + 1][1]:
+                    i -= 1
+            elif series[i][1] > series[i + 1][1]:
+                break
+            _fusionner_series(i)
+
+    minrun = _minrun(n)
+    bas = 0
+    while bas < n:
+        longueur = _longueur_serie(bas)
+        if longueur < minrun:
+            force = min(minrun, n - bas)
+            _insertion_binaire(bas, bas + longueur, bas + force)
+            longueur = force
+        series.append([bas, longueur])
+        _equilibrer()
+        bas += longueur
+
+    while len(series) > 1:
+        i = len(series) - 2
+        if i > 0 and series[i - 1][1] < series[i + 1][1]:
+            i -= 1
+        _fusionner_series(i)
+
+    return (comp,)
+
+
+def _rapide_cles(cles, perm, compter=True):
+    comp = exch = 0
+    # Pile explicite : évite la limite de récursion sur les grandes colonnes
+    pile = [(0, len(cles) - 1)]
+
+    while pile:
+        bas, haut = pile.pop()
+        if bas >= haut:
+            continue
 
-    def _partition(bas, haut):
-        """
-        Partitionne le tableau autour d'un pivot aléatoire.
-        Retourne l'index final du pivot.
-        """
-         
         pivot_idx = randint(bas, haut)
         if pivot_idx != haut:
-            tab[pivot_idx], tab[haut] = tab[haut], tab[pivot_idx]
-            exch[0] += 1
-
-        pivot_val = _get_numeric_value(tab[haut], key)
-        i = bas - 1   
+            cles[pivot_idx], cles[haut] = cles[haut], cles[pivot_idx]
+            perm[pivot_idx], perm[haut] = perm[haut], perm[pivot_idx]
+            if compter:
+                exch += 1
 
-        
+        pivot_val = cles[haut]
+        i = bas - 1
         for j in range(bas, haut):
-            comp[0] += 1
-            if _get_numeric_value(tab[j], key) <= pivot_val:
+            if compter:
+                comp += 1
+            if cles[j] <= pivot_val:
                 i += 1
                 if i != j:
-                    tab[i], tab[j] = tab[j], tab[i]
-                    exch[0] += 1
+                    cles[i], cles[j] = cles[j], cles[i]
+                    perm[i], perm[j] = perm[j], perm[i]
+                    if compter:
+                        exch += 1
 
-        
         if i + 1 != haut:
-            tab[i + 1], tab[haut] = tab[haut], tab[i + 1]
+            cles[i + 1], cles[haut] = cles[haut], cles[i + 1]
+            perm[i + 1], perm[haut] = perm[haut], perm[i + 1]
+            if compter:
+                exch += 1
+
+        pile.append((i + 2, haut))
+        pile.append((bas, i))
+
+    return comp, exch
+
+
+def _radix_cles(cles, perm, compter=True):
+    # Clés entières uniquement (int, float exact ou rang de collation d'une
+    # colonne texte) ; sinon (réels, clés composites) repli sur le tri
+    # fusion ascendant, stable
+    entiers = []
+    for cle in cles:
+        if isinstance(cle, float) and cle.is_integer() and abs(cle) < 2 ** 53:
+            cle = int(cle)
+        elif not isinstance(cle, int):
+            return _fusion_ascendante_cles(cles, perm, compter) + (0,)
+        entiers.append(cle)
+    if not entiers:
+        return 0, 0
+
+    # Décalage par le minimum : les clés deviennent positives
+    minimum = min(entiers)
+    if minimum:
+        entiers = [cle - minimum for cle in entiers]
+
+    passes = mouvements = 0
+    ordre = list(range(len(entiers)))
+    decalage = 0
+    maximum = max(entiers)
+    while maximum >> decalage:
+        # Passe stable sur un octet : 256 seaux parcourus dans l'ordre
+        seaux = [[] for _ in range(256)]
+        for i in ordre:
+            seaux[(entiers[i] >> decalage) & 0xFF].append(i)
+        # Un seul seau plein : l'octet est constant, la passe ne change rien
+        if len(ordre) not in map(len, seaux):
+            ordre = [i for seau in seaux for i in seau]
+            if compter:
+                passes += 1
+                mouvements += len(ordre)
+        decalage += 8
+
+    perm[:] = [perm[i] for i in ordre]
+    cles[:] = [cles[i] for i in ordre]
+    return passes, mouvements
+
+
+SEUIL_INSERTION = 16   # plages plus courtes finies par tri par insertion
+SEUIL_NINTHER = 40     # au-delà, pivot « ninther » (médiane de 3 médianes)
+
+
+def _mediane3(cles, a, b, c):
+    """Indice de la médiane de cles[a], cles[b], cles[c] (3 comparaisons au plus)"""
+    if cles[a] < cles[b]:
+        if cles[b] < cles[c]:
+            return b, 2
+        return (c, 3) if cles[a] < cles[c] else (a, 3)
+    if cles[a] < cles[c]:
+        return a, 2
+    return (c, 3) if cles[b] < cles[c] else (b, 3)
+
+
+def _sous_plage(moteur, cles, perm, bas, haut, compter=True):
+    """Applique un moteur à la plage [bas, haut] et recopie le résultat en place"""
+    sous_cles = cles[bas:haut + 1]
+    sous_perm = perm[bas:haut + 1]
+    compteurs = moteur(sous_cles, sous_perm, compter)
+    cles[bas:haut + 1] = sous_cles
+    perm[bas:haut + 1] = sous_perm
+    return compteurs
+
+
+def _pivot_ninther(cles, bas, haut):
+    """Indice du pivot : médiane de 3, ou ninther sur les grandes plages. Retourne (indice, comp)"""
+    milieu = (bas + haut) // 2
+    if haut - bas + 1 < SEUIL_NINTHER:
+        return _mediane3(cles, bas, milieu, haut)
+    comp = 0
+    pas = (haut - bas + 1) // 8
+    medianes = []
+    for centre in (bas + pas, milieu, haut - pas):
+        idx, c = _mediane3(cles, centre - pas, centre, centre + pas)
+        comp += c
+        medianes.append(idx)
+    pivot_idx, c = _mediane3(cles, *medianes)
+    return pivot_idx, comp + c
+
+
+def _partition_3_voies(cles, perm, bas, haut, pivot_val, compter=True):
+    """
+    Partition 3 voies (drapeau hollandais) de [bas, haut] :
+    [bas, lt[ < pivot, [lt, gt] == pivot, ]gt, haut] > pivot.
+    Retourne (lt, gt, comp, exch).
+    """
+    comp = exch = 0
+    lt, i, gt = bas, bas, haut
+    while i <= gt:
+        valeur = cles[i]
+        if compter:
+            comp += 1
+        if valeur < pivot_val:
+            if lt != i:
+                cles[lt], cles[i] = valeur, cles[lt]
+                perm[lt], perm[i] = perm[i], perm[lt]
+                if compter:
+                    exch += 1
+            lt += 1
+            i += 1
+        else:
+            if compter:
+                comp += 1
+            if valeur > pivot_val:
+                cles[gt], cles[i] = valeur, cles[gt]
+                perm[gt], perm[i] = perm[i], perm[gt]
+                if compter:
+                    exch += 1
+                gt -= 1
+            else:
+                i += 1
+    return lt, gt, comp, exch
+
+
+def _introsort_cles(cles, perm, compter=True):
+    comp = exch = 0
+    n = len(cles)
+    # Au-delà de 2·log2(n) partitions imbriquées, la plage est finie par tas
+    pile = [(0, n - 1, 2 * (n.bit_length() - 1))]
+
+    while pile:
+        bas, haut, profondeur = pile.pop()
+
+        while haut - bas + 1 > SEUIL_INSERTION:
+            if profondeur == 0:
+                c, e = _sous_plage(_tas_cles, cles, perm, bas, haut, compter)
+                comp += c
+                exch += e
+                break
+            profondeur -= 1
+
+            pivot_idx, c = _pivot_ninther(cles, bas, haut)
+            lt, gt, c_part, e = _partition_3_voies(cles, perm, bas, haut, cles[pivot_idx], compter)
+            if compter:
+                comp += c + c_part
+            exch += e
+
+            # Les égaux au pivot sont placés : on empile le plus grand côté et
+            # on continue sur le plus petit (pile bornée par log2(n))
+            if lt - bas < haut - gt:
+                pile.append((gt + 1, haut, profondeur))
+                haut = lt - 1
+            else:
+                pile.append((bas, lt - 1, profondeur))
+                bas = gt + 1
+        else:
+            if haut > bas:
+                c, d = _sous_plage(_insertion_cles, cles, perm, bas, haut, compter)
+                comp += c
+                exch += d
+
+    return comp, exch
+
+
+def _tas_cles(cles, perm, compter=True):
+    comp = exch = 0
+
+    def _heapify(n, i):
+        nonlocal comp, exch
+        while True:
+            largest = i
+            left = 2 * i + 1
+            right = 2 * i + 2
+            if left < n:
+                if compter:
+                    comp += 1
+                if cles[left] > cles[largest]:
+                    largest = left
+            if right < n:
+                if compter:
+                    comp += 1
+                if cles[right] > cles[largest]:
+                    largest = right
+            if largest == i:
+                return
+            cles[i], cles[largest] = cles[largest], cles[i]
+            perm[i], perm[largest] = perm[largest], perm[i]
+            if compter:
+                exch += 1
+            i = largest
+
+    n = len(cles)
+    for i in range(n // 2 - 1, -1, -1):
+        _heapify(n, i)
+
+    for i in range(n - 1, 0, -1):
+        cles[0], cles[i] = cles[i], cles[0]
+        perm[0], perm[i] = perm[i], perm[0]
+        if compter:
+            exch += 1
+        _heapify(i, 0)
+
+    return comp, exch
+
+
+def _tas_recursif_cles(cles, perm, compter=True):
+    # Version d'origine (heapify récursif), conservée comme référence
+    comp = [0]
+    exch = [0]
+
+    def _heapify(n, i):
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+        if left < n:
+            if compter:
+                comp[0] += 1
+            if cles[left] > cles[largest]:
+                largest = left
+        if right < n:
+            if compter:
+                comp[0] += 1
+            if cles[right] > cles[largest]:
+                largest = right
+        if largest != i:
+            cles[i], cles[largest] = cles[largest], cles[i]
+            perm[i], perm[largest] = perm[largest], perm[i]
+            if compter:
+                exch[0] += 1
+            _heapify(n, largest)
+
+    n = len(cles)
+    for i in range(n // 2 - 1, -1, -1):
+        _heapify(n, i)
+
+    for i in range(n - 1, 0, -1):
+        cles[0], cles[i] = cles[i], cles[0]
+        perm[0], perm[i] = perm[i], perm[0]
+        if compter:
             exch[0] += 1
+        _heapify(i, 0)
 
-        return i + 1
+    return comp[0], exch[0]
 
-    def _tri_rapide_recursif(bas, haut):
-        """Fonction récursive de tri rapide."""
-        if bas < haut:
-            
-            pivot_pos = _partition(bas, haut)
-            
-            
-            _tri_rapide_recursif(bas, pivot_pos - 1)
-            _tri_rapide_recursif(pivot_pos + 1, haut)
 
-    
-    if len(tab) > 1:
-        _tri_rapide_recursif(0, len(tab) - 1)
-    
-    return tab, comp[0], exch[0], _now() - t0
+def _tas_floyd_cles(cles, perm, compter=True):
+    comp = exch = 0
+
+    def _placer(i, n, cle, elem):
+        """
+        Place (cle, elem) dans le trou i d'un tas de taille n (Floyd) :
+        descente jusqu'à une feuille en suivant le plus grand enfant (une
+        comparaison par niveau), puis remontée de la clé, qui s'arrête vite
+        car l'élément placé vient du bas du tas.
+        """
+        nonlocal comp, exch
+        trou = i
+        enfant = 2 * trou + 1
+        while enfant < n:
+            if enfant + 1 < n:
+                if compter:
+                    comp += 1
+                if cles[enfant + 1] > cles[enfant]:
+                    enfant += 1
+            cles[trou] = cles[enfant]
+            perm[trou] = perm[enfant]
+            if compter:
+                exch += 1
+            trou = enfant
+            enfant = 2 * trou + 1
+
+        while trou > i:
+            parent = (trou - 1) // 2
+            if compter:
+                comp += 1
+            if not cles[parent] < cle:
+                break
+            cles[trou] = cles[parent]
+            perm[trou] = perm[parent]
+            if compter:
+                exch += 1
+            trou = parent
+        cles[trou] = cle
+        perm[trou] = elem
+
+    n = len(cles)
+    for i in range(n // 2 - 1, -1, -1):
+        _placer(i, n, cles[i], perm[i])
+
+    for fin in range(n - 1, 0, -1):
+        cle, elem = cles[fin], perm[fin]
+        cles[fin] = cles[0]
+        perm[fin] = perm[0]
+        if compter:
+            exch += 1
+        _placer(0, fin, cle, elem)
+
+    return comp, exch
+
+
+def _tas_d_aire_cles(cles, perm, compter=True, d=4):
+    comp = exch = 0
+
+    def _descendre(i, n):
+        """Descente par trou dans un tas d-aire : enfants de i en d·i+1 … d·i+d"""
+        nonlocal comp, exch
+        cle, elem = cles[i], perm[i]
+        while True:
+            premier = d * i + 1
+            if premier >= n:
+                break
+            plus_grand = premier
+            for enfant in range(premier + 1, min(premier + d, n)):
+                if compter:
+                    comp += 1
+                if cles[enfant] > cles[plus_grand]:
+                    plus_grand = enfant
+            if compter:
+                comp += 1
+            if not cles[plus_grand] > cle:
+                break
+            cles[i] = cles[plus_grand]
+            perm[i] = perm[plus_grand]
+            if compter:
+                exch += 1
+            i = plus_grand
+        cles[i] = cle
+        perm[i] = elem
+
+    n = len(cles)
+    for i in range((n - 2) // d, -1, -1):
+        _descendre(i, n)
+
+    for fin in range(n - 1, 0, -1):
+        cles[0], cles[fin] = cles[fin], cles[0]
+        perm[0], perm[fin] = perm[fin], perm[0]
+        if compter:
+            exch += 1
+        _descendre(0, fin)
+
+    return comp, exch
+
+
+def _version_moteur(moteur, nom):
+    """
+    Fonction nom du moteur choisi : None pour "python" (l'implémentation
+    appelante), celle de algorithmes_numpy pour "numpy" (importé à la
+    demande, compteurs estimés).
+    """
+    if moteur == "python":
+        return None
+    if moteur == "numpy":
+        import algorithmes_numpy
+        return getattr(algorithmes_numpy, nom)
+    raise ValueError(f"Moteur inconnu : {moteur!r}")
+
+
+def _resultat_vide(lst, index):
+    if index:
+        return array('I')
+    return lst if isinstance(lst, DatasetColonnes) else []
+
+
+def _trier(lst, key, moteur, index=False, compter=True):
+    """
+    Décore / trie / dédécore : calcule les clés une fois, trie avec le
+    moteur donné, puis renvoie le même tuple que la fonction tri_*.
+    Un DatasetColonnes est trié sur sa colonne et renvoyé réordonné.
+    index=True : renvoie la permutation array('I') au lieu des éléments.
+    compter=False : le moteur s'exécute sans compteurs (renvoyés à 0).
+    """
+    if not len(lst):
+        return (_resultat_vide(lst, index),) + moteur([], []) + (0.0,)
+
+    t0 = _now()
+    cles = _cles_tri(lst, key)
+    if index or isinstance(lst, DatasetColonnes):
+        perm = list(range(len(cles)))
+        compteurs = moteur(cles, perm, compter)
+        resultat = array('I', perm) if index else lst.permuter(perm)
+    else:
+        resultat = lst.copy()
+        compteurs = moteur(cles, resultat, compter)
+
+    return (resultat,) + compteurs + (_now() - t0,)
+
+
+# --------------------------------------------------------------------------- #
+def tri_selection(lst, key, index=False, compter=True):
+    """
+    Tri par sélection : trouve le minimum et l'échange avec l'élément courant.
+    Complexité : O(n²) comparaisons, O(n) échanges
+    """
+    return _trier(lst, key, _selection_cles, index, compter)
+
+
+# --------------------------------------------------------------------------- #
+def tri_insertion(lst, key, index=False, compter=True):
+    """
+    Tri par insertion : insère chaque élément à sa place dans la partie triée.
+    Complexité : O(n²) comparaisons, O(n²) décalages
+    """
+    return _trier(lst, key, _insertion_cles, index, compter)
+
+
+# --------------------------------------------------------------------------- #
+def tri_fusion(lst, key, variante="recursive", index=False, compter=True, moteur="python"):
+    """
+    Tri fusion stable.
+      • variante="recursive" (défaut) : divise la liste en deux, trie
+        récursivement, puis fusionne (une nouvelle liste par niveau)
+      • variante="ascendante" : fusions itératives de séries de largeur 1, 2,
+        4… en alternant entre la liste et un seul tampon de n
+      • variante="adaptative" : détecte les séries déjà triées (ou strictement
+        décroissantes), les allonge à minrun par insertion dichotomique puis
+        les fusionne en galopant (type Timsort) : ~n comparaisons sur une
+        entrée déjà triée
+    Les variantes ascendante et récursive font O(n log n) comparaisons ;
+    leurs nombres exacts diffèrent quand n n'est pas une puissance de 2 (sur
+    les prix du dataset : 8696 en récursif, 8731 en ascendant). Le défaut
+    reste donc la version récursive, référence des rapports.
+    moteur="numpy" : np.argsort(kind="stable") (voir algorithmes_numpy).
+    """
+    version = _version_moteur(moteur, "tri_fusion")
+    if version:
+        return version(lst, key, variante, index)
+    moteurs = {
+        "ascendante": _fusion_ascendante_cles,
+        "recursive": _fusion_cles,
+        "adaptative": _fusion_adaptative_cles,
+    }
+    if variante not in moteurs:
+        raise ValueError(f"Variante de tri fusion inconnue : {variante!r}")
+    return _trier(lst, key, moteurs[variante], index, compter)
+
+
+# --------------------------------------------------------------------------- #
+def tri_rapide(lst, key, variante="aleatoire", index=False, compter=True, moteur="python"):
+    """
+    Tri rapide.
+      • variante="aleatoire" (défaut) : partition de Lomuto autour d'un pivot
+        aléatoire. Complexité moyenne : O(n log n), pire cas : O(n²)
+      • variante="introsort" : pivot médiane de 3 / ninther, partition 3 voies
+        (les doublons ne sont plus re-partitionnés), insertion sous 16 éléments
+        et repli sur le tri par tas au-delà de 2·log2(n) niveaux : O(n log n)
+        garanti. Les échanges comptent aussi les décalages de l'insertion.
+    moteur="numpy" : np.argsort(kind="quicksort") (voir algorithmes_numpy).
+    """
+    version = _version_moteur(moteur, "tri_rapide")
+    if version:
+        return version(lst, key, variante, index)
+    moteurs = {"aleatoire": _rapide_cles, "introsort": _introsort_cles}
+    if variante not in moteurs:
+        raise ValueError(f"Variante de tri rapide inconnue : {variante!r}")
+    return _trier(lst, key, moteurs[variante], index, compter)
+
+
+# --------------------------------------------------------------------------- #
+def tri_radix(lst, key, index=False, compter=True, moteur="python"):
+    """
+    Tri radix LSD (stable) sur clés entières : une passe de répartition en
+    256 seaux par octet de la clé, de l'octet faible vers l'octet fort.
+    Les entiers négatifs sont décalés par le minimum.
+    Complexité : O(n·w), w = nombre d'octets de (max - min)
+
+    Retourne (liste triée, nb_passes, nb_mouvements_seaux, temps_sec).
+    Si une clé n'est pas entière (float, texte), repli sur le tri fusion
+    ascendant : retourne alors (liste triée, nb_comparaisons, 0, temps_sec).
+    moteur="numpy" : np.argsort(kind="stable") (voir algorithmes_numpy).
+    """
+    version = _version_moteur(moteur, "tri_radix")
+    if version:
+        return version(lst, key, index)
+    return _trier(lst, key, _radix_cles, index, compter)
+
+
+# --------------------------------------------------------------------------- #
+def _absente_en_dernier(cle):
+    """Clé pour top_k(largest=True) : une valeur absente devient la plus petite"""
+    if isinstance(cle, tuple):
+        return tuple(-ABSENTE if v == ABSENTE else v for v in cle)
+    return -ABSENTE if cle == ABSENTE else cle
+
+
+def top_k(lst, key, k, largest=True, index=False, compter=True):
+    """
+    Les k meilleurs éléments en O(n log k), sans trier toute la liste : un
+    tas borné à k éléments garde les k meilleurs vus, sa racine étant le
+    moins bon (premier éjecté). largest=True : les k plus grands, du plus
+    grand au plus petit ; largest=False : les k plus petits, du plus petit
+    au plus grand. À clé égale, l'élément le plus ancien passe en premier.
+    Les valeurs absentes sont classées en dernier dans les deux sens.
+
+    Retourne (k éléments triés, nb_comparaisons, nb_échanges, temps_sec).
+    """
+    t0 = _now()
+    cles = _cles_tri(lst, key) if len(lst) else []
+    if largest:
+        cles = [_absente_en_dernier(cle) for cle in cles]
+    k = max(0, min(k, len(cles)))
+    comp = exch = 0
+
+    def _pire(a, b):
+        """a est-il moins bon que b ? (positions ; départage par l'indice)"""
+        nonlocal comp
+        if compter:
+            comp += 1
+        if largest:
+            return cles[a] < cles[b] or (cles[a] == cles[b] and a > b)
+        return (cles[a], a) > (cles[b], b)
+
+    def _descendre(tas, i, n):
+        nonlocal exch
+        while True:
+            pire = i
+            for enfant in (2 * i + 1, 2 * i + 2):
+                if enfant < n and _pire(tas[enfant], tas[pire]):
+                    pire = enfant
+            if pire == i:
+                return
+            tas[i], tas[pire] = tas[pire], tas[i]
+            if compter:
+                exch += 1
+            i = pire
+
+    tas = list(range(k))
+    for i in range(k // 2 - 1, -1, -1):
+        _descendre(tas, i, k)
+
+    # Un nouvel élément n'entre que s'il bat strictement la racine : à clé
+    # égale, il est plus récent donc moins bon
+    for i in range(k, len(cles) if k else 0):
+        if compter:
+            comp += 1
+        if (cles[i] > cles[tas[0]]) if largest else (cles[i] < cles[tas[0]]):
+            tas[0] = i
+            if compter:
+                exch += 1
+            _descendre(tas, 0, k)
+
+    # Extraction : le moins bon part en fin de tas, les meilleurs remontent
+    for fin in range(k - 1, 0, -1):
+        tas[0], tas[fin] = tas[fin], tas[0]
+        if compter:
+            exch += 1
+        _descendre(tas, 0, fin)
+
+    if index:
+        resultat = array('I', tas)
+    elif isinstance(lst, DatasetColonnes):
+        resultat = lst.permuter(tas)
+    else:
+        resultat = [lst[i] for i in tas]
+    return resultat, comp, exch, _now() - t0
+
+
+def tri_partiel(lst, key, k, index=False, compter=True):
+    """
+    Tri partiel : les k premiers éléments de l'ordre croissant, triés, en
+    O(n log k) (tas borné de top_k). Même résultat que tri_fusion(lst, key)[0][:k].
+    Retourne (k éléments triés, nb_comparaisons, nb_échanges, temps_sec).
+    """
+    return top_k(lst, key, k, largest=False, index=index, compter=compter)
+
+
+# --------------------------------------------------------------------------- #
+# Tri parallèle : partitions triées dans des processus, fusion k voies
+# --------------------------------------------------------------------------- #
+MOTEURS_PARALLELES = {"fusion": _fusion_ascendante_cles, "rapide": _rapide_cles}
+SEUIL_PARALLELE = 50000   # en dessous, le pool de processus coûte plus qu'il ne rapporte
+
+
+def _trier_partition(cles, debut, algo, compter=True):
+    """
+    Trie une partition de clés (exécuté dans un processus fils). Seules les
+    clés circulent entre processus ; retourne (positions globales dans
+    l'ordre trié, compteurs du moteur).
+    """
+    cles = list(cles)
+    perm = list(range(debut, debut + len(cles)))
+    compteurs = MOTEURS_PARALLELES[algo](cles, perm, compter)
+    return perm, compteurs
+
+
+def _fusion_k_voies(cles, partitions):
+    """
+    Fusionne k listes de positions triées par un tas binaire de (clé, numéro
+    de partition) : à clé égale la partition la plus à gauche passe en
+    premier, la fusion est stable. Retourne (ordre, nb_comparaisons).
+    """
+    if len(partitions) == 1:
+        return list(partitions[0]), 0
+
+    comp = 0
+    tetes = [0] * len(partitions)
+    tas = [(cles[p[0]], k) for k, p in enumerate(partitions) if p]
+
+    # Construction du tas min (descente depuis le dernier parent)
+    def _descendre(i):
+        nonlocal comp
+        n = len(tas)
+        while True:
+            plus_petit = i
+            for enfant in (2 * i + 1, 2 * i + 2):
+                if enfant < n:
+                    comp += 1
+                    if tas[enfant] < tas[plus_petit]:
+                        plus_petit = enfant
+            if plus_petit == i:
+                return
+            tas[i], tas[plus_petit] = tas[plus_petit], tas[i]
+            i = plus_petit
+
+    for i in range(len(tas) // 2 - 1, -1, -1):
+        _descendre(i)
+
+    ordre = []
+    while tas:
+        k = tas[0][1]
+        partition = partitions[k]
+        ordre.append(partition[tetes[k]])
+        tetes[k] += 1
+        if tetes[k] < len(partition):
+            tas[0] = (cles[partition[tetes[k]]], k)
+        else:
+            dernier = tas.pop()
+            if not tas:
+                break
+            tas[0] = dernier
+        _descendre(0)
+
+    return ordre, comp
+
+
+def tri_parallele(lst, key, workers=None, algo="fusion", index=False, compter=True,
+                  seuil=SEUIL_PARALLELE):
+    """
+    Tri parallèle multi-processus :
+      1. les clés sont calculées une fois puis découpées en `workers`
+         partitions contiguës ;
+      2. chaque partition est triée dans un processus par le moteur du tri
+         fusion (ascendant) ou du tri rapide, sur les seules clés ; seules
+         les positions triées reviennent au processus principal ;
+      3. les partitions triées sont fusionnées par un tas de k entrées.
+    workers=None : un processus par cœur. algo="fusion" donne un tri stable.
+    Sous `seuil` éléments, tout est trié dans le processus courant.
+    compter=False : moteurs sans compteurs, fusion par heapq.merge sur les
+    positions (clé cles[i], à clé égale la partition la plus à gauche).
+
+    Retourne le tuple de l'algorithme choisi, compteurs agrégés sur tous les
+    processus (comparaisons de fusion incluses) :
+        fusion : (liste triée, nb_comparaisons, temps_sec)
+        rapide : (liste triée, nb_comparaisons, nb_échanges, temps_sec)
+    """
+    if algo not in MOTEURS_PARALLELES:
+        raise ValueError(f"Algorithme parallèle inconnu : {algo!r} (fusion ou rapide)")
+    nb_compteurs = len(MOTEURS_PARALLELES[algo]([], []))
+    if not len(lst):
+        return (_resultat_vide(lst, index),) + (0,) * nb_compteurs + (0.0,)
+
+    t0 = _now()
+    cles = _cles_tri(lst, key)
+    n = len(cles)
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    if n < seuil:
+        workers = 1
+    bornes = [n * i // workers for i in range(workers + 1)]
+
+    if workers == 1:
+        resultats = [_trier_partition(cles, 0, algo, compter)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultats = list(executor.map(
+                _trier_partition,
+                [cles[bornes[i]:bornes[i + 1]] for i in range(workers)],
+                bornes[:-1],
+                [algo] * workers,
+                [compter] * workers,
+            ))
+
+    compteurs = [sum(c[i] for _, c in resultats) for i in range(nb_compteurs)]
+    partitions = [perm for perm, _ in resultats]
+    if len(partitions) == 1:
+        ordre = partitions[0]
+    elif compter:
+        ordre, comp_fusion = _fusion_k_voies(cles, partitions)
+        compteurs[0] += comp_fusion
+    else:
+        ordre = list(merge(*partitions, key=cles.__getitem__))
+
+    if index:
+        resultat = array('I', ordre)
+    elif isinstance(lst, DatasetColonnes):
+        resultat = lst.permuter(ordre)
+    else:
+        resultat = [lst[i] for i in ordre]
+    return (resultat,) + tuple(compteurs) + (_now() - t0,)
+
+
+# --------------------------------------------------------------------------- #
+# Tri externe : séries triées en mémoire, déversées sur disque, fusion k voies
+# --------------------------------------------------------------------------- #
+BUDGET_MEMOIRE_DEFAUT = 64 << 20   # octets par série en mémoire
+ORDRE_FUSION = 16                  # fichiers fusionnés simultanément
+
+
+@total_ordering
+class _Decroissant:
+    """Inverse l'ordre d'une clé non numérique (chaîne) pour les specs desc"""
+    __slots__ = ("valeur",)
+
+    def __init__(self, valeur):
+        self.valeur = valeur
+
+    def __eq__(self, autre):
+        return self.valeur == autre.valeur
+
+    def __lt__(self, autre):
+        return autre.valeur < self.valeur
+
+
+def _fonction_cle_ligne(header, key, schema=SCHEMA_BIENS):
+    """
+    Fonction ligne CSV → clé de tri, comparable d'une série à l'autre.
+    Seules les colonnes de la clé sont converties. Pour des specs
+    multi-clés, les colonnes texte sont comparées par collation (et non par
+    rang, propre à chaque série). Une valeur numérique absente vaut ABSENTE
+    et reste en dernier dans les deux sens, comme dans le tri en mémoire.
+    """
+    specs = [(key, False)] if isinstance(key, str) else _normaliser_specs(key)
+    convertisseur = schema.compiler(header, colonnes=[k for k, _ in specs])
+
+    if isinstance(key, str) and schema.type_colonne(key)[0] in (int, float):
+        def cle(vals):
+            return _get_numeric_value(convertisseur.convertir(vals), key)
+        return cle
+    if isinstance(key, str):
+        def cle(vals):
+            valeur = convertisseur.convertir(vals)[key]
+            return _cle_collation("" if valeur is None else str(valeur))
+        return cle
+
+    numeriques = {k: schema.type_colonne(k)[0] in (int, float) for k, _ in specs}
+
+    def cle(vals):
+        bien = convertisseur.convertir(vals)
+        composantes = []
+        for k, decroissant in specs:
+            if numeriques[k]:
+                valeur = _get_numeric_value(bien, k)
+                composantes.append(-valeur if decroissant and valeur != ABSENTE else valeur)
+            else:
+                texte = "" if bien[k] is None else str(bien[k])
+                valeur = _cle_collation(texte)
+                composantes.append(_Decroissant(valeur) if decroissant else valeur)
+        return tuple(composantes)
+    return cle
+
+
+def _ecrire_serie(chemin, lignes):
+    """Écrit une série de lignes ; retourne le nombre d'octets écrits"""
+    octets = 0
+    with open(chemin, "w", encoding="utf-8") as f:
+        for ligne in lignes:
+            f.write(ligne)
+            f.write("\n")
+            octets += len(ligne.encode("utf-8")) + 1
+    return octets
+
+
+def _fusionner_series(chemins, sortie, cle_ligne):
+    """
+    Fusion k voies des séries triées vers le fichier ouvert `sortie` avec un
+    tas (clé, numéro de série, ligne) : à clé égale, la série la plus ancienne
+    passe en premier, la fusion est stable. Retourne (octets lus, octets écrits).
+    """
+    lus = ecrits = 0
+    fichiers = [open(chemin, encoding="utf-8") for chemin in chemins]
+    try:
+        tas = []
+        for numero, f in enumerate(fichiers):
+            ligne = f.readline()
+            if ligne:
+                lus += len(ligne.encode("utf-8"))
+                ligne = ligne.rstrip("\n")
+                heappush(tas, (cle_ligne(parse_csv_line(ligne)), numero, ligne))
+
+        while tas:
+            _, numero, ligne = heappop(tas)
+            sortie.write(ligne)
+            sortie.write("\n")
+            ecrits += len(ligne.encode("utf-8")) + 1
+
+            suivante = fichiers[numero].readline()
+            if suivante:
+                lus += len(suivante.encode("utf-8"))
+                suivante = suivante.rstrip("\n")
+                heappush(tas, (cle_ligne(parse_csv_line(suivante)), numero, suivante))
+    finally:
+        for f in fichiers:
+            f.close()
+    return lus, ecrits
+
+
+def tri_externe(path_in, path_out, key, memory_budget=BUDGET_MEMOIRE_DEFAUT,
+                ordre_fusion=ORDRE_FUSION):
+    """
+    Tri externe d'un CSV plus grand que la mémoire :
+      1. lecture en séries dont la taille estimée tient dans memory_budget
+         (octets), chacune triée par le tri fusion ascendant (stable) ;
+      2. déversement des séries dans des fichiers temporaires ;
+      3. fusion k voies par tas, ordre_fusion fichiers à la fois, en autant
+         de passes que nécessaire, jusqu'au fichier path_out.
+    L'en-tête et le texte des lignes sont recopiés à l'identique ; les lignes
+    au nombre de colonnes incorrect sont ignorées comme dans iter_biens.
+    Une entrée qui tient en une seule série est écrite sans fusion.
+
+    Retourne (nb_lignes, octets_io, nb_passes_fusion, temps_sec), où
+    octets_io cumule les octets lus et écrits (entrée, séries, sortie).
+    """
+    t0 = _now()
+    try:
+        f = ouvrir_csv(path_in)
+    except FileNotFoundError:
+        print(f"Erreur : fichier {path_in} non trouvé")
+        return 0, 0, 0, 0.0
+
+    dossier = tempfile.mkdtemp(prefix="tri_externe_")
+    octets = passes = nb_lignes = 0
+    try:
+        with f:
+            entete = f.readline()
+            octets += len(entete.encode("utf-8"))
+            entete = entete.strip()
+            header = entete.split(',')
+            cle_ligne = _fonction_cle_ligne(header, key)
+
+            series = []
+            cles, lignes, taille = [], [], 0
+
+            def _vider():
+                # Trie la série courante en mémoire et la déverse sur disque
+                nonlocal octets
+                _fusion_ascendante_cles(cles, lignes, False)
+                chemin = os.path.join(dossier, f"serie_{len(series)}.csv")
+                octets += _ecrire_serie(chemin, lignes)
+                series.append(chemin)
+
+            for i, ligne in enumerate(f, 1):
+                octets += len(ligne.encode("utf-8"))
+                ligne = ligne.strip()
+                if not ligne:
+                    continue
+                vals = parse_csv_line(ligne)
+                if len(vals) != len(header):
+                    print(_message_ligne_ignoree(i + 1, len(vals), len(header)))
+                    continue
+
+                cle = cle_ligne(vals)
+                cles.append(cle)
+                lignes.append(ligne)
+                nb_lignes += 1
+                # Estimation : objets ligne et clé, plus deux emplacements de liste
+                taille += sys.getsizeof(ligne) + sys.getsizeof(cle) + 16
+                if taille >= memory_budget:
+                    _vider()
+                    cles, lignes, taille = [], [], 0
+
+        if not series:
+            # Tout tient en mémoire : une seule série, écrite directement
+            _fusion_ascendante_cles(cles, lignes, False)
+            octets += _ecrire_serie(path_out, [entete] + lignes)
+            return nb_lignes, octets, 0, _now() - t0
+
+        if lignes:
+            _vider()
+
+        # Passes intermédiaires tant qu'il reste plus de ordre_fusion séries
+        while len(series) > ordre_fusion:
+            suivantes = []
+            for debut in range(0, len(series), ordre_fusion):
+                chemin = os.path.join(dossier, f"passe_{passes}_{len(suivantes)}.csv")
+                with open(chemin, "w", encoding="utf-8") as sortie:
+                    lus, ecrits = _fusionner_series(series[debut:debut + ordre_fusion],
+                                                    sortie, cle_ligne)
+                octets += lus + ecrits
+                suivantes.append(chemin)
+            series = suivantes
+            passes += 1
+
+        with open(path_out, "w", encoding="utf-8") as sortie:
+            sortie.write(entete + "\n")
+            octets += len(entete.encode("utf-8")) + 1
+            lus, ecrits = _fusionner_series(series, sortie, cle_ligne)
+        octets += lus + ecrits
+        passes += 1
+    finally:
+        shutil.rmtree(dossier, ignore_errors=True)
+
+    return nb_lignes, octets, passes, _now() - t0
+
+
+# --------------------------------------------------------------------------- #
+# Permutations (mode index=True)
+# --------------------------------------------------------------------------- #
+def appliquer_permutation(lst, perm):
+    """Éléments de lst dans l'ordre de perm : résultat[i] = lst[perm[i]]"""
+    if isinstance(lst, DatasetColonnes):
+        return lst.permuter(perm)
+    return [lst[i] for i in perm]
+
+
+def inverser_permutation(perm):
+    """
+    Permutation inverse : inverse[perm[i]] = i, soit le rang dans l'ordre
+    trié de chaque ligne d'origine.
+    """
+    inverse = array('I', [0]) * len(perm)
+    for rang, position in enumerate(perm):
+        inverse[position] = rang
+    return inverse
+
+
+def composer_permutations(p, q):
+    """
+    Composition : appliquer p puis q équivaut à appliquer le résultat r,
+    r[i] = p[q[i]]. Ex : q trie une vue déjà ordonnée par p.
+    """
+    return array('I', [p[i] for i in q])
 
 
 # --------------------------------------------------------------------------- #
@@ -214,15 +1490,20 @@ def valider_tri(original, trie, key):
         return False, "Tailles différentes"
     
     
-    for i in range(len(trie) - 1):
-        val_courante = _get_numeric_value(trie[i], key)
-        val_suivante = _get_numeric_value(trie[i + 1], key)
-        if val_courante > val_suivante:
+    cles = _cles_tri(trie, key)
+    for i in range(len(cles) - 1):
+        if cles[i] > cles[i + 1]:
             return False, f"Ordre incorrect à l'index {i}"
     
    
-    ids_original = sorted([id(item) for item in original])
-    ids_trie = sorted([id(item) for item in trie])
+    if isinstance(original, DatasetColonnes) and isinstance(trie, DatasetColonnes):
+        # Les lignes d'un dataset en colonnes n'ont pas d'identité propre :
+        # on compare le contenu complet des lignes
+        ids_original = sorted(original.ligne(i) for i in range(len(original)))
+        ids_trie = sorted(trie.ligne(i) for i in range(len(trie)))
+    else:
+        ids_original = sorted([id(item) for item in original])
+        ids_trie = sorted([id(item) for item in trie])
     
     if ids_original != ids_trie:
         return False, "Éléments manquants ou en double"
@@ -270,7 +1551,7 @@ def comparer_algorithmes_tri(biens, key, taille_echantillon=None):
 # =========================
 # 🏆 BONUS : TRI PAR TAS (HEAP SORT)
 # =========================
-def tri_tas(lst, key):
+def tri_tas(lst, key, variante="binaire", index=False, compter=True, moteur="python"):
     """
     🏆 BONUS : Tri par tas (Heap Sort)
     Complexité : O(n log n) dans TOUS les cas (garantie)
@@ -278,64 +1559,29 @@ def tri_tas(lst, key):
     - Tri in-place (pas de mémoire supplémentaire)
     - Performance stable indépendamment des données
     - Algorithme avancé démontrant la maîtrise des structures de données
-    """
-    if not lst:
-        return [], 0, 0, 0.0
-    
-    t0 = _now()
-    tab = lst.copy()
-    n = len(tab)
-    comp = [0]
-    exch = [0]
-
-    def _heapify(arr, n, i):
-        """
-        Transforme un sous-arbre en tas max.
-        Assure que la propriété du tas est respectée.
-        """
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-
-        # Vérifier si l'enfant gauche existe et est plus grand
-        if left < n:
-            comp[0] += 1
-            if _get_numeric_value(arr[left], key) > _get_numeric_value(arr[largest], key):
-                largest = left
-
-        # Vérifier si l'enfant droit existe et est plus grand
-        if right < n:
-            comp[0] += 1
-            if _get_numeric_value(arr[right], key) > _get_numeric_value(arr[largest], key):
-                largest = right
-
-        # Si le plus grand n'est pas la racine, échanger et réorganiser
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            exch[0] += 1
-            _heapify(arr, n, largest)
-
-    def _build_heap(arr, n):
-        """
-        Construit un tas max à partir du tableau.
-        Commence par les nœuds non-feuilles et remonte vers la racine.
-        """
-        for i in range(n // 2 - 1, -1, -1):
-            _heapify(arr, n, i)
-
-    # ÉTAPE 1 : Construire le tas max
-    _build_heap(tab, n)
 
-    # ÉTAPE 2 : Extraire les éléments un par un
-    for i in range(n - 1, 0, -1):
-        # Échanger la racine (max) avec le dernier élément
-        tab[0], tab[i] = tab[i], tab[0]
-        exch[0] += 1
-        
-        # Réorganiser le tas sur la partie non triée
-        _heapify(tab, i, 0)
-
-    return tab, comp[0], exch[0], _now() - t0
+    Variantes :
+      • "binaire" (défaut) : tas binaire, descente itérative (2 comparaisons
+        par niveau, un échange par niveau)
+      • "recursive" : même algorithme avec heapify récursif (référence)
+      • "floyd" : extraction de Floyd, descente jusqu'à une feuille puis
+        remontée (~1 comparaison par niveau, environ deux fois moins)
+      • "4-aire" : tas 4-aire (enfants contigus, arbre deux fois moins haut)
+    Pour floyd et 4-aire, les échanges comptent les déplacements d'éléments.
+    moteur="numpy" : np.argsort(kind="heapsort") (voir algorithmes_numpy).
+    """
+    version = _version_moteur(moteur, "tri_tas")
+    if version:
+        return version(lst, key, variante, index)
+    moteurs = {
+        "binaire": _tas_cles,
+        "recursive": _tas_recursif_cles,
+        "floyd": _tas_floyd_cles,
+        "4-aire": _tas_d_aire_cles,
+    }
+    if variante not in moteurs:
+        raise ValueError(f"Variante de tri par tas inconnue : {variante!r}")
+    return _trier(lst, key, moteurs[variante], index, compter)
 
 
 def comparer_tous_algorithmes_avec_bonus(biens, key, taille_echantillon=None):
@@ -373,4 +1619,80 @@ def comparer_tous_algorithmes_avec_bonus(biens, key, taille_echantillon=None):
         if not valide:
             print(f"❌ ERREUR dans {nom}: {msg}")
     
-    return resultats
\ No newline at end of file
+    return resultats
+
+
+# =========================
+# VUE TRIÉE INCRÉMENTALE
+# =========================
+class VueTriee:
+    """
+    Vue d'un ensemble de biens maintenue triée selon key.
+    Le tri initial est celui de tri_fusion, dont les clés sont conservées ;
+    chaque lot d'ajouts ultérieurs (par exemple depuis SuiviCSV) est trié
+    seul puis fusionné avec la vue en un seul parcours, O(n + m) par lot au
+    lieu d'une insertion O(n) par bien.
+    À clé égale, les biens déjà présents restent devant : la vue est stable.
+    """
+
+    def __init__(self, biens, key):
+        self.key = key
+        self.numerique = None
+        self.elements = list(biens)
+        self.cles = self._cles(self.elements)
+        _fusion_cles(self.cles, self.elements, False)
+
+    def _cles(self, biens):
+        """
+        Clés de tri des biens, comparables d'un lot à l'autre : celles de
+        _composante pour une colonne numérique (absentes en dernier), la
+        clé de collation pour une colonne texte. Le type est fixé au
+        premier lot non vide.
+        """
+        valeurs = [bien[self.key] for bien in biens]
+        if not valeurs:
+            return []
+        if self.numerique is None:
+            self.numerique = _colonne_numerique(biens, self.key, valeurs)
+        if self.numerique:
+            return _composante(valeurs, False)
+        return [_cle_collation("" if v is None else str(v)) for v in valeurs]
+
+    def ajouter(self, biens):
+        """Insère de nouveaux biens à leur place."""
+        lot = list(biens)
+        if not lot:
+            return
+        cles_lot = self._cles(lot)
+        _fusion_ascendante_cles(cles_lot, lot, False)
+
+        cles, elements = self.cles, self.elements
+        if not cles or cles[-1] <= cles_lot[0]:
+            # Lot entièrement après la vue (cas courant d'un flux croissant)
+            cles.extend(cles_lot)
+            elements.extend(lot)
+            return
+
+        fusion_cles, fusion_elements = [], []
+        i = j = 0
+        while i < len(cles) and j < len(cles_lot):
+            if cles[i] <= cles_lot[j]:
+                fusion_cles.append(cles[i])
+                fusion_elements.append(elements[i])
+                i += 1
+            else:
+                fusion_cles.append(cles_lot[j])
+                fusion_elements.append(lot[j])
+                j += 1
+        fusion_cles.extend(cles[i:] or cles_lot[j:])
+        fusion_elements.extend(elements[i:] or lot[j:])
+        self.cles, self.elements = fusion_cles, fusion_elements
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __getitem__(self, index):
+        return self.elements[index]
+
+    def __iter__(self):
+        return iter(self.elements)
@@ -0,0 +1,559 @@
+"""
+⚡ BENCHMARKS DES OPTIMISATIONS
+Micro-benchmarks comparant les versions optimisées aux implémentations d'origine
+"""
+
+from utilitaires import lire_csv_biens, iter_biens, parse_csv_line, _parse_csv_line_caractere
+from algorithmes_tri import (tri_selection, tri_insertion, tri_fusion, tri_rapide, tri_tas,
+                             tri_radix, tri_externe, tri_parallele, top_k, valider_tri)
+from algorithmes_recherche import (recherche_lineaire_position, recherche_binaire,
+                                   recherche_min_max, recherche_dans_plage, quantiles)
+import algorithmes_numpy
+from contextlib import redirect_stdout
+from time import perf_counter
+import io
+import os
+import random
+import shutil
+import tempfile
+import tracemalloc
+
+CHEMIN_CSV = "transactions_immobilieres.csv"
+
+
+def _mesurer(fonction, *args, repetitions=1):
+    """Retourne le meilleur temps (en secondes) sur plusieurs répétitions"""
+    meilleur = float('inf')
+    for _ in range(repetitions):
+        t0 = perf_counter()
+        fonction(*args)
+        meilleur = min(meilleur, perf_counter() - t0)
+    return meilleur
+
+
+def _lignes_donnees(chemin_csv=CHEMIN_CSV):
+    """Lignes de données du CSV (sans l'en-tête)"""
+    with open(chemin_csv, encoding="utf-8") as f:
+        return [ligne.strip() for ligne in f.readlines()[1:] if ligne.strip()]
+
+
+def benchmark_tokenizer(chemin_csv=CHEMIN_CSV, repetitions=5):
+    """Débit (lignes/s) du tokenizer CSV comparé à l'ancien parseur caractère par caractère"""
+    print("\n🔤 BENCHMARK DU TOKENIZER CSV")
+    print("=" * 60)
+
+    lignes = _lignes_donnees(chemin_csv)
+    # Même données avec des champs entre guillemets (chemin lent)
+    lignes_guillemets = ['"' + ligne.replace(',', '","') + '"' for ligne in lignes]
+
+    def _parser_tout(parseur, lignes):
+        for ligne in lignes:
+            parseur(ligne)
+
+    print(f"{'Jeu de lignes':<22} {'Parseur':<22} {'Lignes/s':>12} {'Gain':>8}")
+    print("-" * 68)
+
+    for nom_jeu, jeu in [("Sans guillemets", lignes), ("Avec guillemets", lignes_guillemets)]:
+        temps_ref = _mesurer(_parser_tout, _parse_csv_line_caractere, jeu, repetitions=repetitions)
+        temps_new = _mesurer(_parser_tout, parse_csv_line, jeu, repetitions=repetitions)
+
+        debit_ref = len(jeu) / temps_ref if temps_ref > 0 else 0
+        debit_new = len(jeu) / temps_new if temps_new > 0 else 0
+        gain = temps_ref / temps_new if temps_new > 0 else 0
+
+        print(f"{nom_jeu:<22} {'caractère/caractère':<22} {debit_ref:>12,.0f} {'':>8}")
+        print(f"{'':<22} {'parse_csv_line':<22} {debit_new:>12,.0f} {gain:>7.1f}x")
+
+
+def _charger_silencieux(*args, **kwargs):
+    """Charge le CSV sans les messages de lire_csv_biens"""
+    with redirect_stdout(io.StringIO()):
+        return lire_csv_biens(*args, **kwargs)
+
+
+def benchmark_records(chemin_csv=CHEMIN_CSV, repetitions=3):
+    """Compare les enregistrements dict et Bien (__slots__) : chargement, mémoire, tris, validation"""
+    print("\n🧱 BENCHMARK DES ENREGISTREMENTS (dict vs __slots__)")
+    print("=" * 60)
+
+    print(f"{'Mesure':<22} {'dict':>12} {'slots':>12} {'Gain':>8}")
+    print("-" * 58)
+
+    def _ligne(nom, val_dict, val_slots, format_val):
+        gain = val_dict / val_slots if val_slots > 0 else 0
+        print(f"{nom:<22} {format_val(val_dict):>12} {format_val(val_slots):>12} {gain:>7.1f}x")
+
+    en_ms = lambda t: f"{t * 1000:.2f}ms"
+
+    # Chargement
+    temps = {}
+    memoire = {}
+    biens = {}
+    for record in ("dict", "slots"):
+        temps[record] = _mesurer(lambda: _charger_silencieux(chemin_csv, record=record),
+                                 repetitions=repetitions)
+        tracemalloc.start()
+        biens[record] = _charger_silencieux(chemin_csv, record=record)
+        memoire[record] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    _ligne("Chargement", temps["dict"], temps["slots"], en_ms)
+    _ligne("Mémoire (Ko)", memoire["dict"] / 1024, memoire["slots"] / 1024, lambda m: f"{m:,.0f}")
+
+    # Tris et validation
+    for nom, algo in [("Tri fusion", tri_fusion), ("Tri rapide", tri_rapide), ("Tri par tas", tri_tas)]:
+        t_dict = _mesurer(algo, biens["dict"], "prix", repetitions=repetitions)
+        t_slots = _mesurer(algo, biens["slots"], "prix", repetitions=repetitions)
+        _ligne(nom, t_dict, t_slots, en_ms)
+
+    tries = {record: tri_fusion(biens[record], "prix")[0] for record in biens}
+    t_dict = _mesurer(valider_tri, biens["dict"], tries["dict"], "prix", repetitions=repetitions)
+    t_slots = _mesurer(valider_tri, biens["slots"], tries["slots"], "prix", repetitions=repetitions)
+    _ligne("valider_tri", t_dict, t_slots, en_ms)
+
+
+def benchmark_compression(chemin_csv=CHEMIN_CSV, copies=20, repetitions=3):
+    """Débit décompression + parsing de iter_biens pour chaque format compressé"""
+    print("\n🗜️  BENCHMARK DES FORMATS COMPRESSÉS")
+    print("=" * 60)
+
+    with open(chemin_csv, "rb") as f:
+        entete = f.readline()
+        donnees = f.read()
+    if not donnees.endswith(b"\n"):
+        donnees += b"\n"
+    contenu = entete + donnees * copies
+
+    codecs = [("csv", None, open)]
+    for nom, module in (("gzip", "gzip"), ("bz2", "bz2"), ("xz", "lzma")):
+        try:
+            codecs.append((nom, module, __import__(module).open))
+        except ImportError:
+            print(f"⚠️  Module {module} indisponible : format {nom} ignoré")
+
+    print(f"{'Format':<8} {'Taille (Ko)':>12} {'Temps':>10} {'Mo/s':>8} {'Lignes/s':>12}")
+    print("-" * 54)
+
+    dossier = tempfile.mkdtemp()
+    try:
+        for nom, module, ouvrir in codecs:
+            chemin = os.path.join(dossier, "biens.csv" + ("" if module is None else "." + nom))
+            with ouvrir(chemin, "wb") as f:
+                f.write(contenu)
+
+            nb_biens = [0]
+
+            def _lire():
+                with redirect_stdout(io.StringIO()):
+                    nb_biens[0] = sum(1 for _ in iter_biens(chemin))
+
+            temps = _mesurer(_lire, repetitions=repetitions)
+            taille = os.path.getsize(chemin)
+            debit = len(contenu) / temps / 1e6 if temps > 0 else 0
+            lignes = nb_biens[0] / temps if temps > 0 else 0
+            print(f"{nom:<8} {taille / 1024:>12,.0f} {temps * 1000:>8.1f}ms {debit:>8.1f} {lignes:>12,.0f}")
+    finally:
+        shutil.rmtree(dossier)
+
+    print(f"\nMo/s : volume décompressé ({len(contenu) / 1e6:.1f} Mo) lu et parsé par seconde")
+
+
+def benchmark_tri_fusion(chemin_csv=CHEMIN_CSV, tailles=(1000, 10000, 50000), repetitions=3):
+    """Tri fusion ascendant (un seul tampon) contre la version récursive : temps et pic mémoire"""
+    print("\n🔀 BENCHMARK DU TRI FUSION (ascendant vs récursif)")
+    print("=" * 60)
+
+    biens = _charger_silencieux(chemin_csv)
+
+    print(f"{'Taille':>8} {'Variante':<12} {'Temps':>10} {'Pic (Ko)':>10} {'Comparaisons':>14} {'Gain':>7}")
+    print("-" * 66)
+
+    for taille in tailles:
+        # Jeu agrandi en répétant les biens (les doublons exercent la stabilité)
+        donnees = (biens * (taille // len(biens) + 1))[:taille]
+        mesures = {}
+        for variante in ("recursive", "ascendante"):
+            temps = _mesurer(tri_fusion, donnees, "prix", variante, repetitions=repetitions)
+            tracemalloc.start()
+            comp = tri_fusion(donnees, "prix", variante)[1]
+            pic = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            mesures[variante] = (temps, pic, comp)
+
+        temps_ref = mesures["recursive"][0]
+        for variante, (temps, pic, comp) in mesures.items():
+            gain = f"{temps_ref / temps:.1f}x" if variante == "ascendante" and temps > 0 else ""
+            print(f"{taille:>8} {variante:<12} {temps * 1000:>8.1f}ms {pic / 1024:>10,.0f} {comp:>14,} {gain:>7}")
+
+
+def benchmark_introsort(chemin_csv=CHEMIN_CSV, taille=20000, repetitions=3):
+    """Tri rapide aléatoire (Lomuto) contre introsort sur données réelles, doublons et entrées triées"""
+    print("\n🎯 BENCHMARK DU TRI RAPIDE (Lomuto aléatoire vs introsort)")
+    print("=" * 60)
+
+    biens = _charger_silencieux(chemin_csv)
+    # Prix ronds fortement dupliqués, comme dans les exports réels
+    prix_ronds = [50000 * (1 + i % 10) for i in range(taille)]
+    jeux = [
+        ("CSV x" + str(taille // len(biens)), (biens * (taille // len(biens) + 1))[:taille]),
+        ("Prix ronds", [{"prix": p} for p in prix_ronds]),
+        ("Déjà trié", [{"prix": i} for i in range(taille)]),
+    ]
+
+    print(f"{'Données':<14} {'Variante':<11} {'Temps':>10} {'Comparaisons':>14} {'Échanges':>12} {'Gain':>7}")
+    print("-" * 72)
+
+    for nom, donnees in jeux:
+        temps_ref = None
+        for variante in ("aleatoire", "introsort"):
+            temps = _mesurer(tri_rapide, donnees, "prix", variante, repetitions=repetitions)
+            _, comp, exch, _ = tri_rapide(donnees, "prix", variante)
+            gain = f"{temps_ref / temps:.1f}x" if temps_ref and temps > 0 else ""
+            print(f"{nom:<14} {variante:<11} {temps * 1000:>8.1f}ms {comp:>14,} {exch:>12,} {gain:>7}")
+            temps_ref = temps
+
+
+def benchmark_tri_adaptatif(chemin_csv=CHEMIN_CSV, taille=50000, repetitions=3):
+    """Tri fusion adaptatif (séries naturelles + galop) contre le tri fusion ascendant"""
+    print("\n🏃 BENCHMARK DU TRI FUSION ADAPTATIF (séries naturelles)")
+    print("=" * 60)
+
+    biens = _charger_silencieux(chemin_csv)
+    aleatoire = (biens * (taille // len(biens) + 1))[:taille]
+    trie = tri_fusion(aleatoire, "prix")[0]
+    # Export par lots : chaque lot de 1000 biens est trié, les lots se suivent
+    par_lots = []
+    for debut in range(0, taille, 1000):
+        par_lots.extend(tri_fusion(aleatoire[debut:debut + 1000], "prix")[0])
+    presque = trie.copy()
+    for i in range(0, taille - 1, 100):
+        presque[i], presque[i + 1] = presque[i + 1], presque[i]
+
+    jeux = [("Aléatoire", aleatoire), ("Trié", trie), ("Inversé", trie[::-1]),
+            ("Presque trié", presque), ("Lots triés", par_lots)]
+
+    print(f"{'Données':<14} {'Variante':<11} {'Temps':>10} {'Comparaisons':>14} {'Gain':>7}")
+    print("-" * 60)
+
+    for nom, donnees in jeux:
+        temps_ref = None
+        for variante in ("ascendante", "adaptative"):
+            temps = _mesurer(tri_fusion, donnees, "prix", variante, repetitions=repetitions)
+            comp = tri_fusion(donnees, "prix", variante)[1]
+            gain = f"{temps_ref / temps:.1f}x" if temps_ref and temps > 0 else ""
+            print(f"{nom:<14} {variante:<11} {temps * 1000:>8.1f}ms {comp:>14,} {gain:>7}")
+            temps_ref = temps
+
+
+def benchmark_tri_radix(tailles=(10000, 100000, 1000000), repetitions=1):
+    """Tri radix LSD contre les tris par comparaisons O(n log n) sur des prix entiers"""
+    print("\n🔢 BENCHMARK DU TRI RADIX (clés entières)")
+    print("=" * 60)
+
+    random.seed(0)
+    algorithmes = [
+        ("Radix LSD", tri_radix),
+        ("Fusion", tri_fusion),
+        ("Rapide introsort", lambda lst, key: tri_rapide(lst, key, "introsort")),
+        ("Tas", tri_tas),
+    ]
+
+    print(f"{'Taille':>9} {'Algorithme':<18} {'Temps':>11} {'Opérations':>14} {'Gain radix':>11}")
+    print("-" * 67)
+
+    for taille in tailles:
+        donnees = [{"prix": random.randint(10000, 2000000)} for _ in range(taille)]
+        temps_radix = None
+        for nom, algo in algorithmes:
+            temps = _mesurer(algo, donnees, "prix", repetitions=repetitions)
+            operations = algo(donnees, "prix")[1]
+            if temps_radix is None:
+                temps_radix = temps
+                gain = ""
+            else:
+                gain = f"{temps / temps_radix:.1f}x" if temps_radix > 0 else ""
+            print(f"{taille:>9,} {nom:<18} {temps * 1000:>9.1f}ms {operations:>14,} {gain:>11}")
+
+    print("\nOpérations : passes pour le radix, comparaisons pour les autres tris")
+
+
+def benchmark_tri_externe(chemin_csv=CHEMIN_CSV, copies=50, budgets=(1 << 30, 4 << 20, 1 << 20, 256 << 10)):
+    """Tri externe selon le budget mémoire : séries, passes de fusion, E/S et pic mémoire"""
+    print("\n💾 BENCHMARK DU TRI EXTERNE")
+    print("=" * 60)
+
+    with open(chemin_csv, "rb") as f:
+        entete = f.readline()
+        donnees = f.read()
+    if not donnees.endswith(b"\n"):
+        donnees += b"\n"
+
+    dossier = tempfile.mkdtemp()
+    try:
+        entree = os.path.join(dossier, "biens.csv")
+        sortie = os.path.join(dossier, "tries.csv")
+        with open(entree, "wb") as f:
+            f.write(entete + donnees * copies)
+        print(f"Entrée : {os.path.getsize(entree) / 1e6:.1f} Mo\n")
+
+        print(f"{'Budget':>10} {'Passes':>7} {'E/S (Mo)':>10} {'Temps':>10} {'Pic (Ko)':>10}")
+        print("-" * 52)
+        for budget in budgets:
+            with redirect_stdout(io.StringIO()):
+                nb, octets, passes, temps = tri_externe(entree, sortie, "prix", budget)
+                # Mesure du pic à part : tracemalloc ralentit fortement le tri
+                tracemalloc.start()
+                tri_externe(entree, sortie, "prix", budget)
+                pic = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            print(f"{budget / 1024:>8,.0f}Ko {passes:>7} {octets / 1e6:>10.1f} "
+                  f"{temps * 1000:>8.0f}ms {pic / 1024:>10,.0f}")
+    finally:
+        shutil.rmtree(dossier)
+
+
+def benchmark_tri_parallele(tailles=(200000, 1000000), repetitions=1):
+    """Tri parallèle multi-processus : accélération par rapport au tri fusion séquentiel"""
+    print("\n🧵 BENCHMARK DU TRI PARALLÈLE")
+    print("=" * 60)
+
+    coeurs = os.cpu_count() or 1
+    print(f"Cœurs disponibles : {coeurs}\n")
+    nb_workers = sorted({1, 2, 4, coeurs})
+
+    print(f"{'Taille':>9} {'Processus':<11} {'Temps':>10} {'Comparaisons':>14} {'Accélération':>13}")
+    print("-" * 62)
+
+    random.seed(0)
+    for taille in tailles:
+        donnees = [{"prix": random.randint(10000, 2000000)} for _ in range(taille)]
+        # Même moteur que les partitions de tri_parallele ; temps sans compteurs
+        temps_seq = _mesurer(lambda: tri_fusion(donnees, "prix", "ascendante", compter=False),
+                             repetitions=repetitions)
+        comp = tri_fusion(donnees, "prix", "ascendante")[1]
+        print(f"{taille:>9,} {'séquentiel':<11} {temps_seq * 1000:>8.0f}ms {comp:>14,} {'1.0x':>13}")
+        for workers in nb_workers:
+            temps = _mesurer(lambda: tri_parallele(donnees, "prix", workers=workers, compter=False),
+                             repetitions=repetitions)
+            comp = tri_parallele(donnees, "prix", workers=workers)[1]
+            acceleration = temps_seq / temps if temps > 0 else 0
+            print(f"{'':>9} {workers:<11} {temps * 1000:>8.0f}ms {comp:>14,} {acceleration:>12.1f}x")
+
+
+def benchmark_top_k(tailles=(10000, 100000), ks=(5, 100, 1000), repetitions=3):
+    """Top-k par tas borné contre le tri complet (tri par tas) suivi d'une tranche"""
+    print("\n🥇 BENCHMARK DU TOP-K (tas borné vs tri complet)")
+    print("=" * 60)
+
+    print(f"{'Taille':>9} {'k':>6} {'Tri complet':>12} {'top_k':>10} {'Comparaisons':>14} {'Gain':>7}")
+    print("-" * 64)
+
+    random.seed(0)
+    for taille in tailles:
+        donnees = [{"prix": random.randint(10000, 2000000)} for _ in range(taille)]
+        temps_tri = _mesurer(lambda: tri_tas(donnees, "prix")[0][-1:], repetitions=repetitions)
+        for k in ks:
+            temps = _mesurer(top_k, donnees, "prix", k, repetitions=repetitions)
+            comp = top_k(donnees, "prix", k)[1]
+            gain = temps_tri / temps if temps > 0 else 0
+            print(f"{taille:>9,} {k:>6} {temps_tri * 1000:>10.1f}ms {temps * 1000:>8.1f}ms "
+                  f"{comp:>14,} {gain:>6.1f}x")
+
+
+def benchmark_quantiles(tailles=(10000, 100000), repetitions=3):
+    """Quantiles par introselect multiple contre un tri complet suivi de lectures"""
+    print("\n📐 BENCHMARK DES QUANTILES (sélection vs tri complet)")
+    print("=" * 60)
+
+    qs = [0, 0.25, 0.5, 0.75, 1]
+    print(f"{'Taille':>9} {'Méthode':<20} {'Temps':>10} {'Comparaisons':>14} {'Gain':>7}")
+    print("-" * 64)
+
+    random.seed(0)
+    for taille in tailles:
+        donnees = [{"prix": random.randint(10000, 2000000)} for _ in range(taille)]
+        temps_tri = _mesurer(tri_fusion, donnees, "prix", repetitions=repetitions)
+        comp_tri = tri_fusion(donnees, "prix")[1]
+        temps = _mesurer(quantiles, donnees, "prix", qs, repetitions=repetitions)
+        comp = quantiles(donnees, "prix", qs)[1]
+        gain = temps_tri / temps if temps > 0 else 0
+        print(f"{taille:>9,} {'tri fusion complet':<20} {temps_tri * 1000:>8.1f}ms {comp_tri:>14,} {'':>7}")
+        print(f"{'':>9} {'quantiles (5 rangs)':<20} {temps * 1000:>8.1f}ms {comp:>14,} {gain:>6.1f}x")
+
+
+def benchmark_permutations(chemin_csv=CHEMIN_CSV, copies=100):
+    """Mémoire de plusieurs vues triées : listes réordonnées contre permutations array('I')"""
+    print("\n🗂️  BENCHMARK DES VUES TRIÉES (listes vs permutations)")
+    print("=" * 60)
+
+    biens = _charger_silencieux(chemin_csv) * copies
+    cles = ("prix", "surface", "prix_m2")
+    print(f"{len(biens):,} biens, une vue triée par clé : {', '.join(cles)}\n")
+
+    print(f"{'Mode':<16} {'Mémoire (Ko)':>14} {'Octets/ligne/vue':>18} {'Temps':>10}")
+    print("-" * 62)
+
+    mesures = {}
+    for mode, index in (("listes", False), ("permutations", True)):
+        temps = _mesurer(lambda: [tri_radix(biens, key, index=index) for key in cles])
+        tracemalloc.start()
+        vues = [tri_radix(biens, key, index=index)[0] for key in cles]
+        memoire = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        mesures[mode] = memoire
+        par_ligne = memoire / len(biens) / len(vues)
+        print(f"{mode:<16} {memoire / 1024:>14,.0f} {par_ligne:>18.1f} {temps * 1000:>8.0f}ms")
+
+    gain = mesures["listes"] / mesures["permutations"] if mesures["permutations"] else 0
+    print(f"\nLes permutations occupent {gain:.1f}x moins de mémoire")
+
+
+def benchmark_tri_tas(tailles=(10000, 100000), repetitions=3):
+    """Variantes du tri par tas : binaire récursif (d'origine), binaire itératif, Floyd, 4-aire"""
+    print("\n🏔️  BENCHMARK DU TRI PAR TAS (variantes)")
+    print("=" * 60)
+
+    variantes = ("recursive", "binaire", "floyd", "4-aire")
+    print(f"{'Taille':>9} {'Variante':<10} {'Temps':>10} {'Comparaisons':>14} {'Échanges':>12} {'Gain':>7}")
+    print("-" * 68)
+
+    random.seed(0)
+    for taille in tailles:
+        donnees = [{"prix": random.randint(10000, 2000000)} for _ in range(taille)]
+        temps_ref = None
+        for variante in variantes:
+            temps = _mesurer(tri_tas, donnees, "prix", variante, repetitions=repetitions)
+            _, comp, exch, _ = tri_tas(donnees, "prix", variante)
+            temps_ref = temps_ref or temps
+            gain = temps_ref / temps if temps > 0 else 0
+            print(f"{taille:>9,} {variante:<10} {temps * 1000:>8.1f}ms {comp:>14,} {exch:>12,} {gain:>6.1f}x")
+
+    print("\nÉchanges : déplacements d'éléments pour floyd et 4-aire")
+
+
+def benchmark_compteurs(chemin_csv=CHEMIN_CSV, taille=1000, repetitions=5):
+    """Temps de chaque algorithme avec ses compteurs et dans sa variante sans compteurs"""
+    print("\n⏱️  BENCHMARK DU COÛT DES COMPTEURS")
+    print("=" * 60)
+
+    biens = _charger_silencieux(chemin_csv, n_max=taille)
+    biens_tries = tri_fusion(biens, "prix")[0]
+    prix_median = biens_tries[len(biens_tries) // 2]["prix"]
+    algorithmes = [
+        ("Tri sélection", tri_selection, (biens, "prix")),
+        ("Tri insertion", tri_insertion, (biens, "prix")),
+        ("Tri fusion", tri_fusion, (biens, "prix")),
+        ("Tri rapide", tri_rapide, (biens, "prix")),
+        ("Introsort", tri_rapide, (biens, "prix", "introsort")),
+        ("Tri par tas", tri_tas, (biens, "prix")),
+        ("Tri radix", tri_radix, (biens, "prix")),
+        ("Top-10", top_k, (biens, "prix", 10)),
+        ("Rech. linéaire", recherche_lineaire_position, (biens, -1, "prix")),
+        ("Rech. binaire", recherche_binaire, (biens_tries, prix_median, "prix")),
+        ("Min/Max", recherche_min_max, (biens, "prix")),
+        ("Rech. plage", recherche_dans_plage, (biens, "prix", 100000, 300000)),
+        ("Quartiles", quantiles, (biens, "prix", (0.25, 0.5, 0.75))),
+    ]
+
+    print(f"{len(biens)} biens, meilleur temps sur {repetitions} répétitions")
+    print(f"{'Algorithme':<16} {'Avec compteurs':>15} {'Sans compteurs':>15} {'Surcoût':>9} {'Opérations':>12}")
+    print("-" * 71)
+    for nom, algo, args in algorithmes:
+        temps = _mesurer(lambda: algo(*args), repetitions=repetitions)
+        temps_brut = _mesurer(lambda: algo(*args, compter=False), repetitions=repetitions)
+        resultat = algo(*args)
+        operations = sum(resultat[2:-1] if algo is recherche_min_max else resultat[1:-1])
+        surcout = (temps / temps_brut - 1) * 100 if temps_brut > 0 else 0
+        print(f"{nom:<16} {temps * 1000:>13.3f}ms {temps_brut * 1000:>13.3f}ms "
+              f"{surcout:>8.0f}% {operations:>12,}")
+
+    print("\nSans compteurs : même source, incréments sautés (compter=False)")
+
+
+def benchmark_numpy(tailles=(10000, 100000), repetitions=3):
+    """Moteur NumPy optionnel comparé aux implémentations Python sans compteurs"""
+    print("\n🧮 BENCHMARK DU MOTEUR NUMPY")
+    print("=" * 60)
+
+    if not algorithmes_numpy.NUMPY_DISPONIBLE:
+        print("⚠️  NumPy non installé : benchmark ignoré (pip install numpy)")
+        return
+
+    operations = [
+        ("Tri fusion", tri_fusion, algorithmes_numpy.tri_fusion, ("prix",)),
+        ("Tri rapide", tri_rapide, algorithmes_numpy.tri_rapide, ("prix",)),
+        ("Tri par tas", tri_tas, algorithmes_numpy.tri_tas, ("prix",)),
+        ("Tri radix", tri_radix, algorithmes_numpy.tri_radix, ("prix",)),
+        ("Min/Max", recherche_min_max, algorithmes_numpy.recherche_min_max, ("prix",)),
+        ("Rech. plage", recherche_dans_plage, algorithmes_numpy.recherche_dans_plage,
+         ("prix", 100000, 300000)),
+    ]
+
+    print(f"{'Taille':>9} {'Opération':<13} {'Python':>11} {'NumPy':>11} {'Gain':>8} {'Opérations':>14}")
+    print("-" * 70)
+
+    random.seed(0)
+    for taille in tailles:
+        donnees = [{"prix": random.randint(10000, 2000000)} for _ in range(taille)]
+        for nom, version_python, version_numpy, args in operations:
+            temps_python = _mesurer(lambda: version_python(donnees, *args, compter=False),
+                                    repetitions=repetitions)
+            temps_numpy = _mesurer(version_numpy, donnees, *args, repetitions=repetitions)
+            resultat = version_numpy(donnees, *args)
+            compteurs = resultat[2:-1] if version_numpy is algorithmes_numpy.recherche_min_max \
+                else resultat[1:-1]
+            gain = temps_python / temps_numpy if temps_numpy > 0 else 0
+            print(f"{taille:>9,} {nom:<13} {temps_python * 1000:>9.1f}ms {temps_numpy * 1000:>9.1f}ms "
+                  f"{gain:>7.1f}x {'≈' + format(sum(compteurs), ','):>14}")
+
+    print("\nOpérations NumPy : estimations analytiques (≈), non comptées")
+
+
+BENCHMARKS = [
+    ("🔤 Tokenizer CSV", benchmark_tokenizer),
+    ("🧱 Enregistrements dict vs __slots__", benchmark_records),
+    ("🗜️  Formats compressés", benchmark_compression),
+    ("🔀 Tri fusion ascendant vs récursif", benchmark_tri_fusion),
+    ("🎯 Tri rapide Lomuto vs introsort", benchmark_introsort),
+    ("🏃 Tri fusion adaptatif (séries naturelles)", benchmark_tri_adaptatif),
+    ("🔢 Tri radix vs tris par comparaisons", benchmark_tri_radix),
+    ("💾 Tri externe selon le budget mémoire", benchmark_tri_externe),
+    ("🧵 Tri parallèle multi-processus", benchmark_tri_parallele),
+    ("🥇 Top-k par tas borné", benchmark_top_k),
+    ("📐 Quantiles par sélection", benchmark_quantiles),
+    ("🗂️  Vues triées par permutation", benchmark_permutations),
+    ("🏔️  Variantes du tri par tas", benchmark_tri_tas),
+    ("⏱️  Coût des compteurs d'opérations", benchmark_compteurs),
+    ("🧮 Moteur NumPy optionnel", benchmark_numpy),
+]
+
+
+def main():
+    """Menu des benchmarks d'optimisation"""
+    print("⚡ BENCHMARKS DES OPTIMISATIONS")
+    print("=" * 40)
+
+    while True:
+        print("\nBenchmarks disponibles :")
+        for i, (nom, _) in enumerate(BENCHMARKS, 1):
+            print(f"{i}. {nom}")
+        print("A. ▶️  Tous les benchmarks")
+        print("0. ❌ Retour")
+
+        choix = input(f"\nVotre choix (0-{len(BENCHMARKS)}, A) : ").strip().upper()
+
+        if choix == "0":
+            break
+        elif choix == "A":
+            for _, benchmark in BENCHMARKS:
+                benchmark()
+        elif choix.isdigit() and 1 <= int(choix) <= len(BENCHMARKS):
+            BENCHMARKS[int(choix) - 1][1]()
+        else:
+            print("❌ Choix invalide")
+
+        input("\nAppuyez sur Entrée pour continuer...")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,10 @@ Interface utilisateur complète avec fonctionnalités avancées
 
 from utilitaires import lire_csv_biens
 from algorithmes_tri import (
-    tri_selection, tri_insertion, tri_fusion, tri_rapide, tri_tas,
+    tri_selection, tri_insertion, tri_fusion, tri_rapide, tri_tas, top_k,
     comparer_tous_algorithmes_avec_bonus, valider_tri
 )
-from algorithmes_recherche import recherche_lineaire, recherche_binaire, recherche_min_max
+from algorithmes_recherche import recherche_lineaire, recherche_binaire, recherche_min_max, selection_k
 import time
 import random
 
@@ -39,7 +39,7 @@ def comparaison_complete_avec_bonus():
     
     for taille in tailles:
         print(f"\n--- Tests sur {taille} éléments ---")
-        biens = lire_csv_biens(chemin_csv, n_max=taille)
+        biens = lire_csv_biens(chemin_csv, n_max=taille, cache=True)
         
         # Tests par prix
         print(f"\n📈 TRI PAR PRIX ({taille} éléments):")
@@ -55,7 +55,7 @@ def test_detaille_tri_tas():
     print("="*60)
     
     chemin_csv = "transactions_immobilieres.csv"
-    biens = lire_csv_biens(chemin_csv, n_max=100)
+    biens = lire_csv_biens(chemin_csv, n_max=100, cache=True)
     
     print("📋 Principe du tri par tas :")
     print("  1. 🏗️  Construction du tas max à partir du tableau")
@@ -99,7 +99,7 @@ def benchmark_statistiques_avancees():
     print("-" * 80)
     
     for taille in tailles:
-        biens = lire_csv_biens(chemin_csv, n_max=taille)
+        biens = lire_csv_biens(chemin_csv, n_max=taille, cache=True)
         print(f"\n{taille:>4} éléments:")
         
         temps_min = float('inf')
@@ -156,7 +156,10 @@ def test_donnees_aleatoires():
     # Statistiques
     print(f"  📊 Prix min : {prix_tries[0]:,}€")
     print(f"  📊 Prix max : {prix_tries[-1]:,}€")
-    print(f"  📊 Prix médian : {prix_tries[len(prix_tries)//2]:,}€")
+    
+    # Médiane par sélection (introselect), sans s'appuyer sur le tri
+    median, nb_comp, temps = selection_k(donnees_aleatoires, "prix", len(donnees_aleatoires) // 2)
+    print(f"  📊 Prix médian : {int(median['prix']):,}€ (sélection : {nb_comp} comparaisons)")
 
 def analyse_complexite_theorique_pratique():
     """Analyse théorique vs pratique de la complexité"""
@@ -175,7 +178,7 @@ def analyse_complexite_theorique_pratique():
     tailles = [100, 500, 1000]
     
     for taille in tailles:
-        biens = lire_csv_biens(chemin_csv, n_max=taille)
+        biens = lire_csv_biens(chemin_csv, n_max=taille, cache=True)
         print(f"\n  {taille} éléments :")
         
         # Tri par tas
@@ -195,32 +198,37 @@ def tests_donnees_specifiques():
     print("="*60)
     
     chemin_csv = "transactions_immobilieres.csv"
-    biens = lire_csv_biens(chemin_csv, n_max=200)
+    # Échantillon des 200 premières lignes ; seules les colonnes utiles sont converties
+    biens = lire_csv_biens(
+        chemin_csv, n_max=200,
+        columns=['type_local', 'commune', 'prix', 'surface', 'nb_pieces', 'prix_m2']
+    )
     
     # Filtrer les maisons à Paris
     maisons_paris = [b for b in biens if b['type_local'] == 'Maison' and b['commune'] == 'PARIS']
     print(f"🏠 Maisons à Paris trouvées : {len(maisons_paris)}")
     
     if maisons_paris:
-        print("\n📊 Tri des maisons parisiennes par prix (tri par tas) :")
-        tab_trie, nb_comp, nb_ech, temps = tri_tas(maisons_paris, "prix")
+        print("\n📊 Sélection des maisons parisiennes les plus chères (tas borné à 5) :")
+        top, nb_comp, nb_ech, temps = top_k(maisons_paris, "prix", 5)
         print(f"  Temps : {temps:.4f}s | {nb_comp} comparaisons | {nb_ech} échanges")
         
         print("\n🏆 Top 5 des maisons les plus chères à Paris :")
-        for i, maison in enumerate(tab_trie[-5:], 1):
+        for i, maison in enumerate(top, 1):
             print(f"  {i}. {maison['prix']}€ - {maison['surface']}m² - {maison['nb_pieces']} pièces")
     
     # Filtrer les appartements de luxe (> 800k€)
-    appart_luxe = [b for b in biens if b['type_local'] == 'Appartement' and int(b['prix']) > 800000]
+    appart_luxe = [b for b in biens if b['type_local'] == 'Appartement'
+                   and b['prix'] is not None and b['prix'] > 800000]
     print(f"\n🏢 Appartements de luxe (>800k€) trouvés : {len(appart_luxe)}")
     
     if appart_luxe:
-        print("\n📊 Tri des appartements de luxe par prix au m² :")
-        tab_trie, nb_comp, nb_ech, temps = tri_tas(appart_luxe, "prix_m2")
+        print("\n📊 Sélection des appartements de luxe les plus chers au m² (tas borné à 3) :")
+        top, nb_comp, nb_ech, temps = top_k(appart_luxe, "prix_m2", 3)
         print(f"  Temps : {temps:.4f}s | {nb_comp} comparaisons | {nb_ech} échanges")
         
         print("\n💎 Top 3 des appartements les plus chers au m² :")
-        for i, appart in enumerate(tab_trie[-3:], 1):
+        for i, appart in enumerate(top, 1):
             print(f"  {i}. {appart['prix_m2']}€/m² - {appart['prix']}€ - {appart['surface']}m²")
 
 def mode_competition():
@@ -229,7 +237,7 @@ def mode_competition():
     print("="*65)
     
     chemin_csv = "transactions_immobilieres.csv"
-    biens = lire_csv_biens(chemin_csv, n_max=500)
+    biens = lire_csv_biens(chemin_csv, n_max=500, cache=True)
     
     algorithmes = [
         ("Sélection", tri_selection),
@@ -300,7 +308,7 @@ def rapport_performance_complet():
     print("="*55)
     
     chemin_csv = "transactions_immobilieres.csv"
-    biens = lire_csv_biens(chemin_csv, n_max=1000)
+    biens = lire_csv_biens(chemin_csv, n_max=1000, cache=True)
     
     print("📊 Résumé des performances sur 1000 éléments :")
     print("-" * 55)
@@ -35,6 +35,10 @@ ALGORITHMES_TRI = [
     (tri_fusion, "FUSION"),
     (tri_rapide, "RAPIDE")
 ]
+# Moteur des tris fusion/rapide et des recherches : "python" (compteurs
+# exacts) ou "numpy" (algorithmes_numpy, compteurs estimés)
+MOTEUR = "python"
+ALGORITHMES_MOTEUR = ("FUSION", "RAPIDE")
 
 
 def executer_tests_tri(biens_base, taille, critere_key, critere_nom):
@@ -47,15 +51,16 @@ def executer_tests_tri(biens_base, taille, critere_key, critere_nom):
     print(f"\n=== TRI PAR {critere_nom} ({taille} éléments) ===")
     
     for algo_func, algo_nom in ALGORITHMES_TRI:
+        options = {"moteur": MOTEUR} if algo_nom in ALGORITHMES_MOTEUR else {}
         try:
             if algo_nom == "FUSION":
                 # Tri fusion retourne (liste, comparaisons, temps)
-                trie, comparaisons, temps = algo_func(echantillon, critere_key)
+                trie, comparaisons, temps = algo_func(echantillon, critere_key, **options)
                 operations = 0  
                 type_ops = ""
             else:
              
-                trie, comparaisons, operations, temps = algo_func(echantillon, critere_key)
+                trie, comparaisons, operations, temps = algo_func(echantillon, critere_key, **options)
                 type_ops = "décalages" if algo_nom == "INSERTION" else "échanges"
             
          
@@ -64,17 +69,20 @@ def executer_tests_tri(biens_base, taille, critere_key, critere_nom):
                 print(f"❌ ERREUR - {algo_nom}: {msg}")
                 continue
             
-         
+            # Même algorithme sans compteurs : temps de l'algorithme seul
+            temps_brut = algo_func(echantillon, critere_key, compter=False, **options)[-1]
+            
             if type_ops:
-                print(f"Tri {algo_nom:<10} : {temps:>8.6f}s | {comparaisons:>6} comparaisons | {operations:>6} {type_ops}")
+                print(f"Tri {algo_nom:<10} : {temps:>8.6f}s | {comparaisons:>6} comparaisons | {operations:>6} {type_ops} | sans compteurs {temps_brut:.6f}s")
             else:
-                print(f"Tri {algo_nom:<10} : {temps:>8.6f}s | {comparaisons:>6} comparaisons")
+                print(f"Tri {algo_nom:<10} : {temps:>8.6f}s | {comparaisons:>6} comparaisons | sans compteurs {temps_brut:.6f}s")
             
             resultats.append({
                 'algorithme': algo_nom,
                 'taille': taille,
                 'critere': critere_nom,
                 'temps': temps,
+                'temps_brut': temps_brut,
                 'comparaisons': comparaisons,
                 'operations': operations,
                 'type_operations': type_ops,
@@ -98,46 +106,59 @@ def executer_tests_recherche(biens_base, taille):
     
     try:
         
-        biens_tries_prix, _, _ = tri_fusion(echantillon, "prix")
+        biens_tries_prix, _, _ = tri_fusion(echantillon, "prix", moteur=MOTEUR)
         
         # Test 1: Recherche linéaire - Maisons à Paris
         nb_maisons, comp_maisons, temps_maisons = recherche_lineaire(
             echantillon,
             lambda x: x.get("type_local") == "Maison" and x.get("commune") == "PARIS"
         )
-        print(f"Recherche linéaire MAISONS PARIS ({taille:>4}) : {temps_maisons:>8.6f}s | {comp_maisons:>4} cmp | {nb_maisons:>2} trouvées")
+        brut_maisons = recherche_lineaire(
+            echantillon,
+            lambda x: x.get("type_local") == "Maison" and x.get("commune") == "PARIS",
+            compter=False
+        )[-1]
+        print(f"Recherche linéaire MAISONS PARIS ({taille:>4}) : {temps_maisons:>8.6f}s | {comp_maisons:>4} cmp | {nb_maisons:>2} trouvées | sans compteurs {brut_maisons:.6f}s")
         
         resultats.append({
             'type': 'Recherche linéaire',
             'cible': 'Maisons Paris',
             'taille': taille,
             'temps': temps_maisons,
+            'temps_brut': brut_maisons,
             'comparaisons': comp_maisons,
             'resultats': nb_maisons
         })
         
         # Test 2: Recherche binaire - Prix 350000€
-        pos_prix, comp_prix, temps_prix = recherche_binaire(biens_tries_prix, 350000, "prix")
-        print(f"Recherche binaire 350000€ ({taille:>4})        : {temps_prix:>8.6f}s | {comp_prix:>4} cmp | pos {pos_prix}")
+        pos_prix, comp_prix, temps_prix = recherche_binaire(biens_tries_prix, 350000, "prix",
+                                                            moteur=MOTEUR)
+        brut_prix = recherche_binaire(biens_tries_prix, 350000, "prix", compter=False,
+                                      moteur=MOTEUR)[-1]
+        print(f"Recherche binaire 350000€ ({taille:>4})        : {temps_prix:>8.6f}s | {comp_prix:>4} cmp | pos {pos_prix} | sans compteurs {brut_prix:.6f}s")
         
         resultats.append({
             'type': 'Recherche binaire',
             'cible': '350000€',
             'taille': taille,
             'temps': temps_prix,
+            'temps_brut': brut_prix,
             'comparaisons': comp_prix,
             'resultats': pos_prix
         })
         
         # Test 3: Min/Max - Prix au m²
-        min_prix_m2, max_prix_m2, comp_minmax, temps_minmax = recherche_min_max(echantillon, "prix_m2")
-        print(f"Min/Max PRIX_M2 ({taille:>4})               : {temps_minmax:>8.6f}s | {comp_minmax:>4} cmp | {min_prix_m2:.0f} – {max_prix_m2:.0f} €/m²")
+        min_prix_m2, max_prix_m2, comp_minmax, temps_minmax = recherche_min_max(
+            echantillon, "prix_m2", moteur=MOTEUR)
+        brut_minmax = recherche_min_max(echantillon, "prix_m2", compter=False, moteur=MOTEUR)[-1]
+        print(f"Min/Max PRIX_M2 ({taille:>4})               : {temps_minmax:>8.6f}s | {comp_minmax:>4} cmp | {min_prix_m2:.0f} – {max_prix_m2:.0f} €/m² | sans compteurs {brut_minmax:.6f}s")
         
         resultats.append({
             'type': 'Min/Max',
             'cible': 'Prix/m²',
             'taille': taille,
             'temps': temps_minmax,
+            'temps_brut': brut_minmax,
             'comparaisons': comp_minmax,
             'resultats': f"{min_prix_m2:.0f}-{max_prix_m2:.0f}"
         })
@@ -147,13 +168,19 @@ def executer_tests_recherche(biens_base, taille):
             echantillon,
             lambda x: x.get("type_local") == "Appartement" and str(x.get("nb_pieces")) == "3"
         )
-        print(f"Recherche APPART 3P ({taille:>4})            : {temps_appart3p:>8.6f}s | {comp_appart3p:>4} cmp | {nb_appart3p:>2} trouvés")
+        brut_appart3p = recherche_lineaire(
+            echantillon,
+            lambda x: x.get("type_local") == "Appartement" and str(x.get("nb_pieces")) == "3",
+            compter=False
+        )[-1]
+        print(f"Recherche APPART 3P ({taille:>4})            : {temps_appart3p:>8.6f}s | {comp_appart3p:>4} cmp | {nb_appart3p:>2} trouvés | sans compteurs {brut_appart3p:.6f}s")
         
         resultats.append({
             'type': 'Recherche linéaire',
             'cible': 'Appartements 3P',
             'taille': taille,
             'temps': temps_appart3p,
+            'temps_brut': brut_appart3p,
             'comparaisons': comp_appart3p,
             'resultats': nb_appart3p
         })
@@ -334,7 +361,7 @@ def main():
     # Chargement des données
     print("\n📂 CHARGEMENT DES DONNÉES")
     print("-" * 30)
-    biens_complets = lire_csv_biens(CSV_FILE)
+    biens_complets = lire_csv_biens(CSV_FILE, cache=True)
     
     if not biens_complets:
         print("❌ Aucune donnée chargée ! Vérifiez le fichier CSV.")
@@ -392,10 +419,12 @@ def main():
                         if r['type_operations']:
                             f.write(f"Tri {r['algorithme']} : {r['temps']:.6f}s | "
                                    f"{r['comparaisons']} comparaisons | "
-                                   f"{r['operations']} {r['type_operations']}\n")
+                                   f"{r['operations']} {r['type_operations']} | "
+                                   f"sans compteurs {r['temps_brut']:.6f}s\n")
                         else:
                             f.write(f"Tri {r['algorithme']} : {r['temps']:.6f}s | "
-                                   f"{r['comparaisons']} comparaisons\n")
+                                   f"{r['comparaisons']} comparaisons | "
+                                   f"sans compteurs {r['temps_brut']:.6f}s\n")
                     f.write("\n")
             
             f.write("🔍 TESTS DES ALGORITHMES DE RECHERCHE\n")
@@ -407,13 +436,13 @@ def main():
                 resultats_rech = [r for r in tous_resultats_recherche if r['taille'] == taille]
                 for r in resultats_rech:
                     if r['type'] == 'Recherche linéaire' and 'Maisons' in r['cible']:
-                        f.write(f"Recherche linéaire MAISONS PARIS ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | {r['resultats']} trouvées\n")
+                        f.write(f"Recherche linéaire MAISONS PARIS ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | {r['resultats']} trouvées | sans compteurs {r['temps_brut']:.6f}s\n")
                     elif r['type'] == 'Recherche binaire':
-                        f.write(f"Recherche binaire 350000€ ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | pos {r['resultats']}\n")
+                        f.write(f"Recherche binaire 350000€ ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | pos {r['resultats']} | sans compteurs {r['temps_brut']:.6f}s\n")
                     elif r['type'] == 'Min/Max':
-                        f.write(f"Min/Max PRIX_M2 ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | {r['resultats']} €/m²\n")
+                        f.write(f"Min/Max PRIX_M2 ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | {r['resultats']} €/m² | sans compteurs {r['temps_brut']:.6f}s\n")
                     elif r['type'] == 'Recherche linéaire' and 'Appartements' in r['cible']:
-                        f.write(f"Recherche APPART 3P ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | {r['resultats']} trouvés\n")
+                        f.write(f"Recherche APPART 3P ({taille}) : {r['temps']:.6f}s | {r['comparaisons']} cmp | {r['resultats']} trouvés | sans compteurs {r['temps_brut']:.6f}s\n")
                 f.write("\n")
             
             f.write("=== FIN DES RÉSULTATS ===\n")
@@ -59,6 +59,67 @@ def test_lecture_csv():
         return False
 
 
+def test_tokenizer_csv():
+    """Test du tokenizer CSV (chemin rapide et champs entre guillemets)."""
+    print("\n🧪 TEST : Tokenizer CSV")
+    
+    try:
+        from utilitaires import parse_csv_line, _parse_csv_line_caractere
+        
+        with open("transactions_immobilieres.csv", encoding="utf-8") as f:
+            for ligne in f:
+                ligne = ligne.strip()
+                assert parse_csv_line(ligne) == _parse_csv_line_caractere(ligne), f"Différence sur : {ligne}"
+        
+        assert parse_csv_line('a,"b,c",d') == ['a', 'b,c', 'd']
+        assert parse_csv_line('"SAINT-DENIS, 93",Maison') == ['SAINT-DENIS, 93', 'Maison']
+        assert parse_csv_line('"le ""Grand"" Paris",1') == ['le "Grand" Paris', '1']
+        assert parse_csv_line('x,"",y') == ['x', '', 'y']
+        assert parse_csv_line(' a , b ,') == ['a', 'b', '']
+        print("   ✅ Tokenizer : OK (guillemets, virgules et \"\" échappés)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tokenizer: {e}")
+        return False
+
+
+def test_schema_csv():
+    """Test du schéma compilé (conversions positionnelles et bilan agrégé)."""
+    print("\n🧪 TEST : Schéma des colonnes")
+    
+    try:
+        import io
+        from contextlib import redirect_stdout
+        from utilitaires import SCHEMA_BIENS
+        
+        header = ["date_mutation", "prix", "surface", "commune", "type_local", "nb_pieces", "code_postal", "prix_m2"]
+        convertisseur = SCHEMA_BIENS.compiler(header)
+        
+        bien = convertisseur.convertir(["2023-01-15", "250000", "65.0", "PARIS", "Maison", "", "75001", "3846.5"])
+        assert bien["prix"] == 250000 and bien["surface"] == 65, "Conversion entière incorrecte"
+        assert bien["prix_m2"] == 3846.5, "Conversion réelle incorrecte"
+        assert bien["nb_pieces"] is None, "Valeur vide nullable incorrecte"
+        
+        bien = convertisseur.convertir(["2023-01-15", "abc", "", "PARIS", "Maison", "3", "75001", "n/a"])
+        assert bien["prix"] is None and bien["prix_m2"] is None, "Valeur invalide conservée en chaîne"
+        assert convertisseur.invalides == {"prix": 1, "prix_m2": 1}, f"Décompte invalide : {convertisseur.invalides}"
+        assert convertisseur.manquantes == {"surface": 1}, f"Décompte manquant : {convertisseur.manquantes}"
+        
+        sortie = io.StringIO()
+        with redirect_stdout(sortie):
+            convertisseur.afficher_rapport()
+        assert "prix (1)" in sortie.getvalue(), "Bilan agrégé non affiché"
+        print("   ✅ Schéma : OK (conversions, défauts, bilan des erreurs)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur schéma: {e}")
+        return False
+
+
 def test_algorithmes_tri():
     """Test des 4 algorithmes de tri."""
     print("\n🧪 TEST : Algorithmes de tri")
@@ -146,6 +207,11 @@ def test_algorithmes_recherche():
         min_prix, max_prix, comp, temps = recherche_min_max(biens_test, "prix")
         assert min_prix == 150, f"Prix minimum incorrect: {min_prix} != 150"
         assert max_prix == 350, f"Prix maximum incorrect: {max_prix} != 350"
+        
+        # Le même objet en première et dernière position n'est pas un singleton
+        b, c = biens_test[0], biens_test[1]
+        assert recherche_min_max([b, c, b], "prix")[2] == 4, "Comparaisons incorrectes (doublon)"
+        assert recherche_min_max([b], "prix")[2] == 0, "Comparaisons incorrectes (un élément)"
         print(f"   ✅ Min/Max : OK ({min_prix}-{max_prix}, {comp} comparaisons)")
         
         return True
@@ -190,6 +256,962 @@ def test_fichier_csv():
         return False
 
 
+def test_lecture_streaming():
+    """Test du mode streaming (générateur iter_biens)."""
+    print("\n🧪 TEST : Lecture CSV en streaming")
+    
+    try:
+        from utilitaires import lire_csv_biens, iter_biens
+        from algorithmes_recherche import recherche_lineaire, recherche_min_max
+        
+        chemin = "transactions_immobilieres.csv"
+        
+        flux = lire_csv_biens(chemin, n_max=20, stream=True)
+        assert not isinstance(flux, list), "stream=True doit retourner un générateur"
+        assert list(flux) == lire_csv_biens(chemin, n_max=20), "Streaming différent du chargement complet"
+        
+        nb, comp, _ = recherche_lineaire(iter_biens(chemin, n_max=50), lambda x: x["commune"] == "PARIS")
+        assert comp == 50, f"Nombre de comparaisons incorrect: {comp} != 50"
+        
+        min_prix, max_prix, comp, _ = recherche_min_max(iter_biens(chemin, n_max=50), "prix")
+        biens = lire_csv_biens(chemin, n_max=50)
+        assert (min_prix, max_prix) == (min(b["prix"] for b in biens), max(b["prix"] for b in biens))
+        assert comp == 2 * 49, f"Nombre de comparaisons incorrect: {comp} != 98"
+        print(f"   ✅ Streaming : OK ({nb} biens à Paris, min/max {min_prix:.0f}-{max_prix:.0f})")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur streaming: {e}")
+        return False
+
+
+def test_projection_filtre():
+    """Test de la projection de colonnes et du filtre appliqué à la lecture."""
+    print("\n🧪 TEST : Projection et filtre à la lecture")
+    
+    try:
+        from utilitaires import lire_csv_biens
+        
+        chemin = "transactions_immobilieres.csv"
+        tous = lire_csv_biens(chemin)
+        
+        maisons = lire_csv_biens(chemin, columns=["prix", "surface"],
+                                 where={"type_local": "Maison", "commune": "PARIS"})
+        attendu = [{"prix": b["prix"], "surface": b["surface"]} for b in tous
+                   if b["type_local"] == "Maison" and b["commune"] == "PARIS"]
+        assert maisons == attendu, "Projection/filtre d'égalité incorrect"
+        
+        luxe = lire_csv_biens(chemin, columns=["prix"], where={"prix": lambda prix: prix > 800000})
+        assert len(luxe) == sum(1 for b in tous if b["prix"] > 800000), "Filtre par fonction incorrect"
+        
+        villes = lire_csv_biens(chemin, n_max=5, where={"commune": {"LYON", "NICE"}})
+        assert len(villes) == 5 and all(b["commune"] in ("LYON", "NICE") for b in villes)
+        
+        assert lire_csv_biens(chemin, columns=["inconnue"]) == [], "Colonne inconnue acceptée"
+        print(f"   ✅ Projection et filtre : OK ({len(maisons)} maisons à Paris)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur projection/filtre: {e}")
+        return False
+
+
+def test_suivi_csv():
+    """Test du suivi incrémental d'un CSV et de la mise à jour des vues."""
+    print("\n🧪 TEST : Suivi incrémental du CSV")
+    
+    try:
+        import os
+        import tempfile
+        from utilitaires import SuiviCSV
+        from algorithmes_tri import VueTriee, valider_tri
+        from algorithmes_recherche import IndexValeurs
+        
+        with open("transactions_immobilieres.csv", encoding="utf-8") as f:
+            lignes = f.readlines()[:51]
+        
+        fd, chemin = tempfile.mkstemp(suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(lignes[:21])
+            
+            suivi = SuiviCSV(chemin)
+            biens = suivi.interroger()
+            assert len(biens) == 20, f"Lecture initiale incorrecte : {len(biens)}"
+            vue = suivi.abonner(VueTriee(biens, "prix"))
+            index = suivi.abonner(IndexValeurs(biens, "commune"))
+            assert suivi.interroger() == [], "Aucune ligne ne devait être relue"
+            
+            with open(chemin, "a", encoding="utf-8") as f:
+                f.writelines(lignes[21:])
+                f.write("2024-01-01,99000")  # ligne incomplète
+            nouveaux = suivi.interroger()
+            assert len(nouveaux) == 30, f"Nouvelles lignes incorrectes : {len(nouveaux)}"
+            
+            with open(chemin, "a", encoding="utf-8") as f:
+                f.write(",40,PARIS,Maison,2,75001,2475\n")
+            assert [b["prix"] for b in suivi.interroger()] == [99000], "Ligne complétée non lue"
+            
+            # Réécriture sur place à taille égale : le suivi doit repartir du début
+            suivi_seul = SuiviCSV(chemin)
+            suivi_seul.interroger()
+            with open(chemin, "r+b") as f:
+                contenu = f.read()
+                f.seek(0)
+                f.write(contenu.replace(b"PARIS", b"LYONS"))
+            os.utime(chemin, ns=(0, 0))
+            relus = suivi_seul.interroger()
+            assert len(relus) == 51 and not any(b["commune"] == "PARIS" for b in relus), \
+                "Réécriture à taille égale non détectée"
+        finally:
+            os.remove(chemin)
+        
+        tous = biens + nouveaux
+        assert len(vue) == 51, "Vue triée non mise à jour"
+        assert [b["prix"] for b in vue] == sorted(b["prix"] for b in vue), "Vue triée désordonnée"
+        
+        # Valeur absente : reste en dernier après un ajout ; lot passé en générateur
+        troue = VueTriee([{"prix": 5}, {"prix": None}, {"prix": 3}], "prix")
+        troue.ajouter(b for b in [{"prix": 4}])
+        assert [b["prix"] for b in troue] == [3, 4, 5, None], "Vue avec valeur absente désordonnée"
+        villes = VueTriee([{"commune": "Évry"}, {"commune": "abbeville"}], "commune")
+        villes.ajouter([{"commune": "EVREUX"}])
+        assert [b["commune"] for b in villes] == ["abbeville", "EVREUX", "Évry"], "Vue texte désordonnée"
+        paris, comp, _ = index.rechercher("PARIS")
+        assert len(paris) == sum(1 for b in tous if b["commune"] == "PARIS") + 1, "Index non mis à jour"
+        print(f"   ✅ Suivi incrémental : OK ({len(vue)} biens dans la vue triée)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur suivi CSV: {e}")
+        return False
+
+
+def test_records_slots():
+    """Test des enregistrements compacts Bien (record="slots")."""
+    print("\n🧪 TEST : Enregistrements __slots__")
+    
+    try:
+        from utilitaires import lire_csv_biens, Bien
+        from algorithmes_tri import tri_fusion, tri_tas, valider_tri
+        from algorithmes_recherche import recherche_lineaire, recherche_binaire
+        
+        dicts = lire_csv_biens("transactions_immobilieres.csv", n_max=100)
+        biens = lire_csv_biens("transactions_immobilieres.csv", n_max=100, record="slots")
+        assert all(isinstance(b, Bien) for b in biens), "Type d'enregistrement incorrect"
+        assert not hasattr(biens[0], "__dict__"), "Bien ne doit pas avoir de __dict__"
+        assert [[b[k] for k in b.keys()] for b in biens] == [list(d.values()) for d in dicts]
+        
+        for algo in (tri_fusion, tri_tas):
+            trie = algo(biens, "prix")[0]
+            valide, msg = valider_tri(biens, trie, "prix")
+            assert valide, f"{algo.__name__} : {msg}"
+        
+        nb, _, _ = recherche_lineaire(biens, lambda x: x.get("commune") == "PARIS")
+        assert nb == sum(1 for d in dicts if d["commune"] == "PARIS"), "Recherche linéaire incorrecte"
+        pos, _, _ = recherche_binaire(trie, trie[10]["prix"], "prix")
+        assert trie[pos]["prix"] == trie[10]["prix"], "Recherche binaire incorrecte"
+        print(f"   ✅ Enregistrements __slots__ : OK ({len(biens)} biens)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur enregistrements __slots__: {e}")
+        return False
+
+
+def test_colonnes_categorielles():
+    """Test de l'internement des valeurs catégorielles au chargement."""
+    print("\n🧪 TEST : Colonnes catégorielles")
+    
+    try:
+        import sys
+        from utilitaires import lire_csv_biens
+        
+        paris = sys.intern("PARIS")
+        for record, workers in (("dict", None), ("slots", None), ("dict", 2)):
+            biens = lire_csv_biens("transactions_immobilieres.csv", record=record, workers=workers)
+            for colonne in ("commune", "type_local", "date_mutation"):
+                for bien in biens:
+                    valeur = bien[colonne]
+                    assert valeur is sys.intern(valeur), f"{colonne} non internée ({record}, {workers})"
+            nb_paris = sum(1 for bien in biens if bien["commune"] is paris)
+            assert nb_paris and nb_paris == sum(1 for bien in biens if bien["commune"] == "PARIS"), \
+                "Égalité par identité incorrecte"
+        
+        filtres = lire_csv_biens("transactions_immobilieres.csv", where={"commune": "PARIS"})
+        assert len(filtres) == nb_paris and all(b["commune"] is paris for b in filtres), \
+            "Filtre d'égalité incorrect"
+        print(f"   ✅ Colonnes catégorielles : OK ({nb_paris} biens à PARIS, comparés par identité)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur colonnes catégorielles: {e}")
+        return False
+
+
+def test_dataset_colonnes():
+    """Test du dataset en colonnes typées (tris et recherches sur colonne)."""
+    print("\n🧪 TEST : Dataset en colonnes")
+    
+    try:
+        import random
+        from utilitaires import lire_csv_biens, DatasetColonnes, ABSENTE
+        from algorithmes_tri import tri_selection, tri_fusion, tri_rapide, valider_tri
+        from algorithmes_recherche import (recherche_binaire, recherche_min_max,
+                                           valider_recherche_binaire)
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv", n_max=200)
+        dataset = DatasetColonnes.depuis_biens(biens)
+        assert len(dataset) == len(biens), "Taille du dataset incorrecte"
+        assert dataset[3]["commune"] == biens[3]["commune"], "Vue ligne incorrecte"
+        assert dataset.colonne("prix").typecode == "q", "Colonne prix non typée"
+        
+        for algo in (tri_selection, tri_fusion, tri_rapide):
+            random.seed(0)
+            attendu = algo(biens, "prix")
+            random.seed(0)
+            obtenu = algo(dataset, "prix")
+            assert attendu[1:-1] == obtenu[1:-1], f"Compteurs différents pour {algo.__name__}"
+            assert list(obtenu[0].colonne("prix")) == [b["prix"] for b in attendu[0]]
+            valide, msg = valider_tri(dataset, obtenu[0], "prix")
+            assert valide, msg
+        
+        # Colonnes catégorielles encodées en codes entiers
+        assert dataset.colonne("commune").typecode == "I", "Colonne commune non encodée"
+        assert len(dataset.tables["type_local"]) < 10, "Table de codes trop grande"
+        positions = dataset.positions_egales("commune", "PARIS")
+        assert positions == [i for i, b in enumerate(biens) if b["commune"] == "PARIS"]
+        assert dataset.positions_egales("commune", "ATLANTIS") == []
+        
+        trie = tri_fusion(dataset, "prix")[0]
+        assert trie[0]["commune"] in dataset.tables["commune"].codes, "Décodage après tri incorrect"
+        pos, comp, _ = recherche_binaire(trie, trie[50]["prix"], "prix")
+        assert trie[pos]["prix"] == trie[50]["prix"], "Recherche binaire sur colonne incorrecte"
+        assert recherche_min_max(dataset, "prix")[:3] == recherche_min_max(biens, "prix")[:3]
+        
+        # Valeur absente : relue None, clé ABSENTE, triée après les vrais zéros
+        incomplet = DatasetColonnes.depuis_biens([dict(biens[0], prix=None), dict(biens[1], prix=0)])
+        assert incomplet[0]["prix"] is None and incomplet.cles("prix")[0] == ABSENTE
+        trie = tri_fusion(incomplet, "prix")[0]
+        assert [trie[0]["prix"], trie[1]["prix"]] == [0, None], "Valeur absente triée comme zéro"
+        
+        # Même règle dans les recherches : absente après toutes les valeurs, ignorée par min/max
+        troues = [{"prix": None}, {"prix": 5}, {"prix": 3}, {"prix": 1}]
+        for table in (troues, DatasetColonnes.depuis_biens([dict(biens[0], **b) for b in troues])):
+            trie = tri_fusion(table, "prix")[0]
+            assert [trie[i]["prix"] for i in range(4)] == [1, 3, 5, None]
+            assert recherche_binaire(trie, 5, "prix")[0] == 2, "Recherche binaire avec valeur absente"
+            assert recherche_min_max(table, "prix")[:3] == (1.0, 5.0, 4), "Min/max avec valeur absente"
+        assert valider_recherche_binaire(tri_fusion(troues, "prix")[0], "prix")[0]
+        print(f"   ✅ Dataset en colonnes : OK ({len(dataset)} lignes)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur dataset colonnes: {e}")
+        return False
+
+
+def test_tri_fusion_ascendant():
+    """Test du tri fusion ascendant (un seul tampon) contre la version récursive."""
+    print("\n🧪 TEST : Tri fusion ascendant")
+    
+    try:
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import tri_fusion, valider_tri
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv", n_max=300)
+        for n in (0, 1, 2, 7, 64, 300):
+            trie, comp, temps = tri_fusion(biens[:n], "prix", variante="ascendante")
+            attendu = tri_fusion(biens[:n], "prix")[0]
+            assert trie == attendu, f"Ordre différent de la version récursive (n={n})"
+            valide, msg = valider_tri(biens[:n], trie, "prix")
+            assert valide, msg
+        
+        # Stabilité : à nombre de pièces égal, l'ordre d'origine est conservé
+        positions = {id(bien): i for i, bien in enumerate(biens)}
+        par_pieces = tri_fusion(biens, "nb_pieces", variante="ascendante")[0]
+        for a, b in zip(par_pieces, par_pieces[1:]):
+            if a["nb_pieces"] == b["nb_pieces"]:
+                assert positions[id(a)] < positions[id(b)], "Tri fusion ascendant instable"
+        
+        try:
+            tri_fusion(biens, "prix", variante="inconnue")
+            assert False, "Variante inconnue acceptée"
+        except ValueError:
+            pass
+        print(f"   ✅ Tri fusion ascendant : OK ({comp} comparaisons sur {len(biens)} biens)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri fusion ascendant: {e}")
+        return False
+
+
+def test_tri_introsort():
+    """Test du mode introsort de tri_rapide (doublons, entrée triée, petites plages)."""
+    print("\n🧪 TEST : Tri rapide introsort")
+    
+    try:
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import tri_rapide, valider_tri
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        jeux = {
+            "CSV": biens,
+            "petits": biens[:15],
+            "doublons": [{"prix": 250000 if i % 3 else 180000} for i in range(2000)],
+            "trié": [{"prix": i} for i in range(20000)],
+        }
+        for nom, jeu in jeux.items():
+            trie, comp, exch, temps = tri_rapide(jeu, "prix", variante="introsort")
+            valide, msg = valider_tri(jeu, trie, "prix")
+            assert valide, f"{nom} : {msg}"
+        
+        # Partition 3 voies : deux valeurs distinctes → une seule partition
+        _, comp_doublons, _, _ = tri_rapide(jeux["doublons"], "prix", variante="introsort")
+        assert comp_doublons < 3 * len(jeux["doublons"]), "Doublons re-partitionnés"
+        print(f"   ✅ Tri rapide introsort : OK ({comp_doublons} comparaisons sur 2000 doublons)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri introsort: {e}")
+        return False
+
+
+def test_tri_fusion_adaptatif():
+    """Test du tri fusion adaptatif (séries naturelles, galop) : stabilité et entrées presque triées."""
+    print("\n🧪 TEST : Tri fusion adaptatif")
+    
+    try:
+        import random
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import tri_fusion, valider_tri
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        positions = {id(bien): i for i, bien in enumerate(biens)}
+        trie, comp, temps = tri_fusion(biens, "nb_pieces", variante="adaptative")
+        valide, msg = valider_tri(biens, trie, "nb_pieces")
+        assert valide, msg
+        for a, b in zip(trie, trie[1:]):
+            if a["nb_pieces"] == b["nb_pieces"]:
+                assert positions[id(a)] < positions[id(b)], "Tri fusion adaptatif instable"
+        
+        # Entrées triées, inversées et presque triées : temps quasi linéaire
+        n = 20000
+        random.seed(1)
+        presque = [{"prix": i + random.randint(0, 3) * (i % 97 == 0)} for i in range(n)]
+        for nom, jeu in [("trié", [{"prix": i} for i in range(n)]),
+                         ("inversé", [{"prix": -i} for i in range(n)]),
+                         ("presque trié", presque)]:
+            trie, comp, _ = tri_fusion(jeu, "prix", variante="adaptative")
+            valide, msg = valider_tri(jeu, trie, "prix")
+            assert valide, f"{nom} : {msg}"
+            assert comp < 2 * n, f"{nom} : {comp} comparaisons, entrée non exploitée"
+        print(f"   ✅ Tri fusion adaptatif : OK ({comp} comparaisons sur {n} biens presque triés)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri fusion adaptatif: {e}")
+        return False
+
+
+def test_tri_radix():
+    """Test du tri radix LSD : stabilité, clés négatives et repli sur clés réelles."""
+    print("\n🧪 TEST : Tri radix")
+    
+    try:
+        from utilitaires import lire_csv_biens, DatasetColonnes
+        from algorithmes_tri import tri_radix, tri_fusion, valider_tri
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        for key in ("prix", "surface", "nb_pieces", "code_postal"):
+            trie, passes, mouvements, temps = tri_radix(biens, key)
+            # Stable : même ordre que le tri fusion (stable lui aussi)
+            assert trie == tri_fusion(biens, key)[0], f"Tri radix incorrect ou instable sur {key}"
+            assert mouvements == passes * len(biens), "Mouvements de seaux incorrects"
+        
+        negatifs = [{"prix": v} for v in (5, -300, 70000, 0, -1)]
+        assert [b["prix"] for b in tri_radix(negatifs, "prix")[0]] == [-300, -1, 0, 5, 70000]
+        
+        # Clés réelles : repli sur un tri par comparaisons
+        reels = [{"prix_m2": b["prix"] / b["surface"]} for b in biens if b["surface"]]
+        trie, comp, mouvements, _ = tri_radix(reels, "prix_m2")
+        valide, msg = valider_tri(reels, trie, "prix_m2")
+        assert valide and mouvements == 0, f"Repli incorrect : {msg}"
+        
+        dataset = DatasetColonnes.depuis_biens(biens)
+        trie_colonnes = tri_radix(dataset, "prix")[0]
+        assert list(trie_colonnes.colonne("prix")) == sorted(b["prix"] for b in biens)
+        print(f"   ✅ Tri radix : OK ({passes} passes sur code_postal)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri radix: {e}")
+        return False
+
+
+def test_tri_multi_cles():
+    """Test des tris multi-clés [(key, direction)] avec collation des chaînes."""
+    print("\n🧪 TEST : Tri multi-clés")
+    
+    try:
+        from utilitaires import lire_csv_biens, DatasetColonnes
+        from algorithmes_tri import (tri_selection, tri_insertion, tri_fusion,
+                                     tri_rapide, tri_tas, tri_radix, valider_tri)
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv", n_max=300)
+        specs = [("commune", "asc"), ("type_local", "asc"), ("prix", "desc")]
+        colonnes = lambda lst: [(b["commune"], b["type_local"], b["prix"]) for b in lst]
+        attendu = colonnes(sorted(biens, key=lambda b: (b["commune"], b["type_local"], -b["prix"])))
+        
+        for algo in (tri_selection, tri_insertion, tri_fusion, tri_rapide, tri_tas, tri_radix):
+            trie = algo(biens, specs)[0]
+            assert colonnes(trie) == attendu, f"Ordre multi-clés incorrect pour {algo.__name__}"
+            valide, msg = valider_tri(biens, trie, specs)
+            assert valide, msg
+        
+        trie = tri_fusion(DatasetColonnes.depuis_biens(biens), specs)[0]
+        assert colonnes(trie) == attendu, "Ordre multi-clés incorrect sur DatasetColonnes"
+        
+        # Collation : ni la casse ni les accents ne séparent les communes
+        villes = [{"commune": c} for c in ("Évry", "EVREUX", "Fontaine", "abbeville")]
+        ordre = [b["commune"] for b in tri_fusion(villes, [("commune", "asc")])[0]]
+        assert ordre == ["abbeville", "EVREUX", "Évry", "Fontaine"], f"Collation incorrecte : {ordre}"
+        
+        # Clé simple sur une colonne texte : même collation, pas de clés à 0
+        for algo in (tri_fusion, tri_rapide, tri_tas, tri_radix):
+            ordre = [b["commune"] for b in algo(villes, "commune")[0]]
+            assert ordre == ["abbeville", "EVREUX", "Évry", "Fontaine"], \
+                f"Clé texte simple incorrecte pour {algo.__name__} : {ordre}"
+        communes = [b["commune"] for b in tri_fusion(DatasetColonnes.depuis_biens(biens), "commune")[0]]
+        assert communes == sorted(b["commune"] for b in biens), "Clé texte simple incorrecte sur DatasetColonnes"
+        
+        # Colonne numérique avec une cellule non numérique : absente, en dernier
+        for cle in ("prix", "inconnue"):
+            mixte = [{cle: 100}, {cle: 20}, {cle: "N/A"}, {cle: "3"}]
+            ordre = [b[cle] for b in tri_fusion(mixte, cle)[0]]
+            assert ordre == ["3", 20, 100, "N/A"], f"Colonne mixte {cle} triée comme du texte : {ordre}"
+            ordre = [b[cle] for b in tri_fusion(mixte, [(cle, "desc")])[0]]
+            assert ordre == [100, 20, "3", "N/A"], f"Colonne mixte {cle} décroissante : {ordre}"
+        print(f"   ✅ Tri multi-clés : OK ({len(biens)} biens, {len(specs)} clés)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri multi-clés: {e}")
+        return False
+
+
+def test_tri_externe():
+    """Test du tri externe (séries sur disque, fusion k voies en plusieurs passes)."""
+    print("\n🧪 TEST : Tri externe")
+    
+    try:
+        import os
+        import tempfile
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import tri_externe, tri_fusion
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "tries.csv")
+            for key in ("prix", [("commune", "asc"), ("prix", "desc")]):
+                # Petit budget : ~10 séries, fusionnées 4 par 4 → 2 passes
+                nb, octets, passes, temps = tri_externe(
+                    "transactions_immobilieres.csv", sortie, key,
+                    memory_budget=20000, ordre_fusion=4)
+                assert nb == len(biens), "Nombre de lignes incorrect"
+                assert passes == 2, f"{passes} passes de fusion au lieu de 2"
+                assert octets > 3 * os.path.getsize(sortie), "Octets d'E/S non comptés"
+                # Même ordre (stable) que le tri fusion en mémoire
+                assert lire_csv_biens(sortie) == tri_fusion(biens, key)[0], f"Ordre incorrect ({key})"
+            
+            nb, _, passes, _ = tri_externe("transactions_immobilieres.csv", sortie, "prix")
+            assert nb == len(biens) and passes == 0, "Une seule série ne doit pas être fusionnée"
+            
+            # Prix vide : en dernier, comme le tri en mémoire du même fichier
+            troue = os.path.join(dossier, "troue.csv")
+            with open("transactions_immobilieres.csv", encoding="utf-8") as f:
+                lignes = f.readlines()[:4]
+            with open(troue, "w", encoding="utf-8") as f:
+                f.write(lignes[0] + lignes[1] + lignes[2].replace(lignes[2].split(",")[1], "", 1) + lignes[3])
+            en_memoire = lire_csv_biens(troue)
+            for key in ("prix", [("prix", "desc")]):
+                tri_externe(troue, sortie, key, memory_budget=100)
+                trie = lire_csv_biens(sortie)
+                assert trie == tri_fusion(en_memoire, key)[0] and trie[-1]["prix"] is None, \
+                    f"Prix vide mal placé par le tri externe ({key})"
+        print(f"   ✅ Tri externe : OK ({nb} lignes, {octets} octets d'E/S)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri externe: {e}")
+        return False
+
+
+def test_tri_parallele():
+    """Test du tri parallèle multi-processus (partitions + fusion k voies)."""
+    print("\n🧪 TEST : Tri parallèle")
+    
+    try:
+        from utilitaires import lire_csv_biens, DatasetColonnes
+        from algorithmes_tri import tri_parallele, tri_fusion, valider_tri
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        attendu = tri_fusion(biens, "prix")[0]
+        # seuil=0 : le pool est utilisé malgré la petite taille du dataset
+        for workers in (1, 3):
+            trie, comp, temps = tri_parallele(biens, "prix", workers=workers, seuil=0)
+            assert trie == attendu, f"Ordre incorrect ou instable ({workers} processus)"
+            assert comp > 0, "Comparaisons non agrégées"
+        trie = tri_parallele(biens, "prix", workers=3, compter=False, seuil=0)[0]
+        assert trie == attendu, "Ordre incorrect ou instable (fusion heapq.merge)"
+        assert tri_parallele(biens, "prix", workers=3)[0] == attendu, "Ordre incorrect sous le seuil"
+        
+        trie, comp, exch, temps = tri_parallele(biens, "surface", workers=2, algo="rapide", seuil=0)
+        valide, msg = valider_tri(biens, trie, "surface")
+        assert valide, msg
+        
+        dataset = DatasetColonnes.depuis_biens(biens)
+        specs = [("commune", "asc"), ("prix", "desc")]
+        trie = tri_parallele(dataset, specs, workers=2, seuil=0)[0]
+        valide, msg = valider_tri(dataset, trie, specs)
+        assert valide, msg
+        print(f"   ✅ Tri parallèle : OK ({comp} comparaisons agrégées)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri parallèle: {e}")
+        return False
+
+
+def test_top_k():
+    """Test du top-k et du tri partiel par tas borné."""
+    print("\n🧪 TEST : Top-k et tri partiel")
+    
+    try:
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import top_k, tri_partiel, tri_fusion
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        croissant = tri_fusion(biens, "prix")[0]
+        decroissant = tri_fusion(biens, [("prix", "desc")])[0]
+        
+        for k in (0, 1, 5, len(biens), len(biens) + 10):
+            assert tri_partiel(biens, "prix", k)[0] == croissant[:k], f"Tri partiel incorrect (k={k})"
+            assert top_k(biens, "prix", k)[0] == decroissant[:k], f"Top-k incorrect (k={k})"
+            assert top_k(biens, "prix", k, largest=False)[0] == croissant[:k]
+        
+        # Valeur absente : classée en dernier dans les deux sens
+        troues = [{"prix": 5}, {"prix": None}, {"prix": 9}, {"prix": 1}]
+        assert [b["prix"] for b in top_k(troues, "prix", 2)[0]] == [9, 5], "Prix absent classé le plus cher"
+        assert [b["prix"] for b in top_k(troues, "prix", 4)[0]] == [9, 5, 1, None]
+        assert [b["prix"] for b in top_k(troues, "prix", 4, largest=False)[0]] == [1, 5, 9, None]
+        assert [b["prix"] for b in top_k(troues, [("prix", "desc")], 4)[0]] == [1, 5, 9, None]
+        
+        # O(n log k) : bien moins de comparaisons qu'un tri complet
+        top, comp, exch, temps = top_k(biens, "prix", 5)
+        assert comp < tri_fusion(biens, "prix")[1] / 4, f"Trop de comparaisons : {comp}"
+        print(f"   ✅ Top-k : OK (top 5 en {comp} comparaisons sur {len(biens)} biens)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur top-k: {e}")
+        return False
+
+
+def test_selection_quantiles():
+    """Test de la sélection du k-ième élément et des quantiles (introselect)."""
+    print("\n🧪 TEST : Sélection et quantiles")
+    
+    try:
+        from utilitaires import lire_csv_biens, DatasetColonnes
+        from algorithmes_recherche import selection_k, quantiles, _selection_multiple
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        valeurs = sorted(float(b["prix"]) for b in biens)
+        n = len(valeurs)
+        
+        for k in (0, 1, n // 4, n // 2, n - 1):
+            element, comp, temps = selection_k(biens, "prix", k)
+            assert element["prix"] == valeurs[k], f"Sélection incorrecte (k={k})"
+        assert selection_k(biens, "prix", n)[0] is None, "Rang hors limites accepté"
+        
+        qs = [0, 0.25, 0.5, 0.75, 1]
+        resultats, comp, temps = quantiles(biens, "prix", qs)
+        assert resultats == [valeurs[min(int(q * n), n - 1)] for q in qs], "Quantiles incorrects"
+        assert comp < 10 * n, f"Trop de comparaisons pour une sélection : {comp}"
+        assert quantiles(DatasetColonnes.depuis_biens(biens), "prix", qs)[0] == resultats
+        
+        # Valeurs de la colonne, pas les clés internes de tri
+        communes = sorted({b["commune"] for b in biens})
+        assert quantiles(biens, "commune", [0, 1])[0] == [communes[0], communes[-1]], "Rangs de collation renvoyés"
+        troues = [{"prix": 3, "commune": "B"}, {"prix": None, "commune": "A"}, {"prix": 2, "commune": "C"}]
+        assert quantiles(troues, "prix", [0, 1])[0] == [2, None], "Valeur absente renvoyée comme inf"
+        assert quantiles(troues, [("prix", "desc"), "commune"], [0])[0] == [(3, "B")]
+        
+        # Pivot médiane des médianes (pire cas linéaire garanti)
+        cles = [float(b["prix"]) for b in biens]
+        _selection_multiple(cles, [None] * n, [n // 2], lineaire=True)
+        assert cles[n // 2] == valeurs[n // 2], "Médiane des médianes incorrecte"
+        print(f"   ✅ Sélection et quantiles : OK (5 quantiles en {comp} comparaisons)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur sélection et quantiles: {e}")
+        return False
+
+
+def test_tri_index():
+    """Test du mode index=True (permutations array('I')) et des helpers de permutation."""
+    print("\n🧪 TEST : Tri par permutation")
+    
+    try:
+        import random
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import (tri_selection, tri_insertion, tri_fusion, tri_rapide,
+                                     tri_tas, tri_radix, appliquer_permutation,
+                                     inverser_permutation, composer_permutations)
+        from algorithmes_recherche import recherche_binaire_permutation
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv", n_max=300)
+        for algo in (tri_selection, tri_insertion, tri_fusion, tri_rapide, tri_tas, tri_radix):
+            random.seed(0)
+            attendu = algo(biens, "prix")
+            random.seed(0)
+            obtenu = algo(biens, "prix", index=True)
+            assert obtenu[0].typecode == "I", f"{algo.__name__} : permutation non compacte"
+            assert appliquer_permutation(biens, obtenu[0]) == attendu[0], f"{algo.__name__} : ordre différent"
+            assert obtenu[1:-1] == attendu[1:-1], f"{algo.__name__} : compteurs différents"
+        
+        par_prix = tri_fusion(biens, "prix", index=True)[0]
+        inverse = inverser_permutation(par_prix)
+        assert all(par_prix[inverse[i]] == i for i in range(len(biens))), "Inverse incorrecte"
+        
+        vue = appliquer_permutation(biens, par_prix)
+        par_surface = tri_fusion(vue, "surface", index=True)[0]
+        compose = composer_permutations(par_prix, par_surface)
+        assert appliquer_permutation(biens, compose) == appliquer_permutation(vue, par_surface)
+        
+        cible = biens[42]["prix"]
+        rang, comp, temps = recherche_binaire_permutation(biens, par_prix, cible, "prix")
+        assert biens[par_prix[rang]]["prix"] == cible, "Recherche à travers la permutation incorrecte"
+        print(f"   ✅ Tri par permutation : OK ({par_prix.itemsize} octets par ligne)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur tri par permutation: {e}")
+        return False
+
+
+def test_tri_tas_variantes():
+    """Test des variantes du tri par tas (Floyd, 4-aire) contre la version binaire."""
+    print("\n🧪 TEST : Variantes du tri par tas")
+    
+    try:
+        from utilitaires import lire_csv_biens
+        from algorithmes_tri import tri_tas, valider_tri
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        _, comp_binaire, exch_binaire, _ = tri_tas(biens, "prix")
+        assert tri_tas(biens, "prix", "recursive")[1:3] == (comp_binaire, exch_binaire), \
+            "Compteurs binaire itératif / récursif différents"
+        
+        for variante in ("floyd", "4-aire"):
+            for jeu in (biens, biens[:1], biens[:2], biens[:37]):
+                trie = tri_tas(jeu, "prix", variante)[0]
+                valide, msg = valider_tri(jeu, trie, "prix")
+                assert valide, f"{variante} : {msg}"
+        
+        comp_floyd = tri_tas(biens, "prix", "floyd")[1]
+        assert comp_floyd < 0.75 * comp_binaire, f"Floyd : {comp_floyd} vs {comp_binaire} comparaisons"
+        print(f"   ✅ Variantes du tri par tas : OK (Floyd {comp_floyd} vs {comp_binaire} comparaisons)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur variantes du tri par tas: {e}")
+        return False
+
+
+def test_sans_compteurs():
+    """Test du mode compter=False : mêmes résultats, compteurs à zéro."""
+    print("\n🧪 TEST : Mode sans compteurs")
+    
+    try:
+        from utilitaires import lire_csv_biens, DatasetColonnes
+        from algorithmes_tri import (tri_selection, tri_insertion, tri_fusion, tri_rapide,
+                                     tri_tas, tri_radix, top_k)
+        from algorithmes_recherche import (recherche_binaire, recherche_min_max, quantiles,
+                                           selection_k)
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        dataset = DatasetColonnes.depuis_biens(biens)
+        for algo, args in [(tri_selection, ()), (tri_insertion, ()), (tri_radix, ()),
+                           (tri_fusion, ()), (tri_fusion, ("ascendante",)),
+                           (tri_fusion, ("adaptative",)), (tri_rapide, ("introsort",)),
+                           (tri_tas, ()), (tri_tas, ("recursive",)), (tri_tas, ("floyd",)),
+                           (tri_tas, ("4-aire",))]:
+            avec = algo(biens, "prix", *args)
+            sans = algo(biens, "prix", *args, compter=False)
+            assert sans[0] == avec[0], f"{algo.__name__} {args} : résultat différent"
+            assert len(sans) == len(avec) and not any(sans[1:-1]), f"{algo.__name__} : {sans[1:-1]}"
+        sans = tri_rapide(dataset, "prix", compter=False)
+        assert list(sans[0].colonne("prix")) == sorted(dataset.colonne("prix")) and not any(sans[1:-1])
+        
+        assert top_k(biens, "prix", 5, compter=False)[0] == top_k(biens, "prix", 5)[0]
+        trie = tri_fusion(biens, "prix")[0]
+        assert recherche_binaire(trie, 350000, "prix", compter=False)[:2] == \
+            (recherche_binaire(trie, 350000, "prix")[0], 0)
+        assert recherche_min_max(biens, "prix", compter=False)[:3] == \
+            recherche_min_max(biens, "prix")[:2] + (0,)
+        assert quantiles(biens, "prix", [0.5], compter=False)[0] == quantiles(biens, "prix", [0.5])[0]
+        assert selection_k(dataset, "prix", 10, compter=False)[1] == 0
+        
+        temps = min(tri_insertion(biens, "prix")[-1] for _ in range(3))
+        temps_brut = min(tri_insertion(biens, "prix", compter=False)[-1] for _ in range(3))
+        print(f"   ✅ Mode sans compteurs : OK (insertion {temps:.4f}s → {temps_brut:.4f}s)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur mode sans compteurs: {e}")
+        return False
+
+
+def test_moteur_numpy():
+    """Test du moteur NumPy optionnel : mêmes tuples, compteurs estimés."""
+    print("\n🧪 TEST : Moteur NumPy")
+    
+    try:
+        from utilitaires import lire_csv_biens, DatasetColonnes
+        from algorithmes_tri import tri_fusion as tri_fusion_python
+        from algorithmes_recherche import recherche_binaire, recherche_min_max, recherche_dans_plage
+        import algorithmes_numpy as moteur
+        
+        biens = lire_csv_biens("transactions_immobilieres.csv")
+        colonnes = DatasetColonnes.depuis_biens(biens)
+        reference = [b["prix"] for b in tri_fusion_python(biens, "prix")[0]]
+        for algo, nb_compteurs in [(moteur.tri_fusion, 1), (moteur.tri_rapide, 2),
+                                   (moteur.tri_tas, 2), (moteur.tri_radix, 2)]:
+            resultat = algo(biens, "prix")
+            assert len(resultat) == nb_compteurs + 2, f"{algo.__name__} : tuple {len(resultat)}"
+            assert [b["prix"] for b in resultat[0]] == reference, f"{algo.__name__} : ordre incorrect"
+            assert list(algo(colonnes, "prix")[0].colonne("prix")) == reference
+        
+        # Clé texte : même ordre de collation que le moteur Python
+        communes = [b["commune"] for b in tri_fusion_python(biens, "commune")[0]]
+        assert [b["commune"] for b in moteur.tri_fusion(biens, "commune")[0]] == communes
+        
+        # Moteur sélectionnable depuis les fonctions d'origine
+        trie = tri_fusion_python(biens, "prix", moteur="numpy")[0]
+        assert [b["prix"] for b in trie] == reference
+        try:
+            tri_fusion_python(biens, "prix", moteur="fortran")
+            assert False, "moteur inconnu accepté"
+        except ValueError:
+            pass
+        
+        # Dichotomie sur une liste : même position et mêmes comparaisons que le moteur Python
+        attendu = recherche_binaire(trie, 350000, "prix")[:2]
+        assert moteur.recherche_binaire(trie, 350000, "prix")[:2] == attendu
+        assert recherche_binaire(trie, 350000, "prix", moteur="numpy")[:2] == attendu
+        assert recherche_min_max(biens, "prix", moteur="numpy")[:2] == (min(reference), max(reference))
+        assert moteur.recherche_min_max(biens, "prix")[:2] == (min(reference), max(reference))
+        dans_plage = [b["prix"] for b in moteur.recherche_dans_plage(trie, "prix", 1e5, 2e5, trie=True)[0]]
+        assert dans_plage == [p for p in reference if 1e5 <= p <= 2e5]
+        plage = recherche_dans_plage(trie, "prix", 1e5, 2e5, moteur="numpy", trie=True)[0]
+        assert [b["prix"] for b in plage] == dans_plage
+        
+        # Colonne typée : np.searchsorted sur une vue sans copie (première occurrence)
+        trie_colonnes = tri_fusion_python(colonnes, "prix")[0]
+        position = recherche_binaire(trie_colonnes, 350000, "prix", moteur="numpy")[0]
+        assert trie_colonnes[position]["prix"] == 350000
+        if moteur.NUMPY_DISPONIBLE:
+            assert position == list(trie_colonnes.colonne("prix")).index(350000)
+        
+        # Valeurs absentes : même règle que le moteur Python (hors plage, en dernier)
+        troues = [{"prix": None}, {"prix": 0}, {"prix": 5}, {"prix": 3}]
+        trie_troues = tri_fusion_python(troues, "prix")[0]
+        for table, tri in ((troues, False), (trie_troues, True)):
+            trouves = moteur.recherche_dans_plage(table, "prix", 0, 4, trie=tri)[0]
+            assert trouves == recherche_dans_plage(table, "prix", 0, 4)[0], "Valeur absente dans la plage"
+        nb = moteur.recherche_lineaire(biens, {"type_local": "Maison", "commune": "PARIS"})[0]
+        assert nb == sum(1 for b in biens if b["type_local"] == "Maison" and b["commune"] == "PARIS")
+        
+        comp = moteur.tri_tas(biens, "prix")[1]
+        if moteur.NUMPY_DISPONIBLE:
+            assert moteur.est_estimation(comp)
+            for table in (biens, colonnes):
+                try:
+                    moteur.recherche_min_max(table, "commune")
+                    assert False, "clé non numérique acceptée par recherche_min_max"
+                except ValueError:
+                    pass
+            print("   ✅ Moteur NumPy : OK (compteurs estimés)")
+        else:
+            assert not moteur.est_estimation(comp)
+            print("   ✅ Moteur NumPy : NumPy absent, repli sur les implémentations Python OK")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur moteur NumPy: {e}")
+        return False
+
+
+def test_lecture_compressee():
+    """Test de la lecture des CSV compressés (gzip, bz2, xz)."""
+    print("\n🧪 TEST : Lecture CSV compressé")
+    
+    try:
+        import os
+        import shutil
+        import tempfile
+        from utilitaires import lire_csv_biens, iter_biens, format_compression
+        
+        reference = lire_csv_biens("transactions_immobilieres.csv")
+        with open("transactions_immobilieres.csv", "rb") as f:
+            contenu = f.read()
+        
+        formats = []
+        dossier = tempfile.mkdtemp()
+        try:
+            for nom, module in (("gzip", "gzip"), ("bz2", "bz2"), ("xz", "lzma")):
+                try:
+                    ouvrir = __import__(module).open
+                except ImportError:
+                    continue
+                # Extension volontairement neutre : détection par les octets
+                chemin = os.path.join(dossier, f"biens_{nom}.dat")
+                with ouvrir(chemin, "wb") as f:
+                    f.write(contenu)
+                
+                assert format_compression(chemin) == nom, f"Format {nom} non détecté"
+                assert lire_csv_biens(chemin) == reference, f"Lecture {nom} incorrecte"
+                assert list(iter_biens(chemin, n_max=5)) == reference[:5], f"Streaming {nom} incorrect"
+                formats.append(nom)
+        finally:
+            shutil.rmtree(dossier)
+        
+        assert format_compression("transactions_immobilieres.csv") is None
+        print(f"   ✅ Lecture compressée : OK ({', '.join(formats)})")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur lecture compressée: {e}")
+        return False
+
+
+def test_snapshot_cache():
+    """Test du snapshot binaire du dataset et de son invalidation."""
+    print("\n🧪 TEST : Snapshot du dataset")
+    
+    try:
+        import os
+        import shutil
+        import tempfile
+        from utilitaires import lire_csv_biens
+        
+        dossier = tempfile.mkdtemp()
+        try:
+            chemin = os.path.join(dossier, "biens.csv")
+            shutil.copy("transactions_immobilieres.csv", chemin)
+            
+            reference = lire_csv_biens(chemin, n_max=30)
+            assert lire_csv_biens(chemin, n_max=30, cache=True) == reference, "Snapshot différent du CSV"
+            assert os.path.exists(chemin + ".snapshot"), "Snapshot non créé"
+            assert lire_csv_biens(chemin, n_max=30, cache=True) == reference, "Relecture du snapshot incorrecte"
+            
+            # Fichier étranger (ex: pickle) : rejeté par l'en-tête, jamais désérialisé
+            import pickle
+            with open(chemin + ".snapshot", "wb") as f:
+                pickle.dump(("pas", "un", "snapshot"), f)
+            assert lire_csv_biens(chemin, n_max=30, cache=True) == reference, "Snapshot étranger accepté"
+            
+            # Même contenu, date modifiée : l'empreinte revalide le snapshot
+            os.utime(chemin, ns=(0, 0))
+            assert lire_csv_biens(chemin, n_max=30, cache=True) == reference, "Revalidation incorrecte"
+            
+            with open(chemin, "a", encoding="utf-8") as f:
+                f.write("2024-01-01,123456,50,PARIS,Maison,3,75001,2469\n")
+            biens = lire_csv_biens(chemin, cache=True)
+            assert biens[-1]["prix"] == 123456, "Snapshot non invalidé après modification"
+        finally:
+            shutil.rmtree(dossier)
+        
+        print("   ✅ Snapshot : OK (création, relecture, invalidation)")
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur snapshot: {e}")
+        return False
+
+
+def test_lecture_parallele():
+    """Test de la lecture parallèle par tranches (workers=N)."""
+    print("\n🧪 TEST : Lecture CSV parallèle")
+    
+    try:
+        import io
+        import os
+        import tempfile
+        from contextlib import redirect_stdout
+        from utilitaires import lire_csv_biens
+        
+        with open("transactions_immobilieres.csv", encoding="utf-8") as f:
+            lignes = f.read().splitlines()
+        # Séparateurs Unicode dans un champ : pas des fins de ligne
+        for position in (3, 400, 900):
+            champs = lignes[position].split(",")
+            champs[3] = champs[3][:2] + "\u2028\x85\x0c\x1e" + champs[3][2:]
+            lignes[position] = ",".join(champs)
+        # Lignes invalides réparties dans tout le fichier
+        for position in (10, 400, 1500, 2900):
+            lignes.insert(position, "ligne,invalide")
+        lignes = lignes[:1] + lignes[1:] * 3
+        
+        fd, chemin = tempfile.mkstemp(suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lignes))
+            
+            sortie_seq, sortie_par = io.StringIO(), io.StringIO()
+            with redirect_stdout(sortie_seq):
+                sequentiel = lire_csv_biens(chemin)
+            with redirect_stdout(sortie_par):
+                parallele = lire_csv_biens(chemin, workers=4)
+        finally:
+            os.remove(chemin)
+        
+        assert parallele == sequentiel, "Résultat parallèle différent du séquentiel"
+        assert sortie_par.getvalue() == sortie_seq.getvalue(), "Messages de lignes ignorées différents"
+        assert sum("\u2028" in b["commune"] for b in parallele) == 9, "Ligne coupée sur U+2028"
+        print(f"   ✅ Lecture parallèle : OK ({len(parallele)} biens, 4 processus)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"   ❌ Erreur lecture parallèle: {e}")
+        return False
+
+
 def test_conformite_cahier_charges():
     """Test de conformité avec le cahier des charges."""
     print("\n🧪 TEST : Conformité cahier des charges")
@@ -252,9 +1274,33 @@ def executer_tous_les_tests():
     tests = [
         ("Imports des modules", test_imports),
         ("Lecture CSV", test_lecture_csv),
+        ("Tokenizer CSV", test_tokenizer_csv),
+        ("Schéma des colonnes", test_schema_csv),
         ("Algorithmes de tri", test_algorithmes_tri),
+        ("Tri fusion ascendant", test_tri_fusion_ascendant),
+        ("Tri rapide introsort", test_tri_introsort),
+        ("Tri fusion adaptatif", test_tri_fusion_adaptatif),
+        ("Tri radix", test_tri_radix),
+        ("Tri multi-clés", test_tri_multi_cles),
+        ("Tri externe", test_tri_externe),
+        ("Tri parallèle", test_tri_parallele),
+        ("Top-k et tri partiel", test_top_k),
+        ("Sélection et quantiles", test_selection_quantiles),
+        ("Tri par permutation", test_tri_index),
+        ("Variantes du tri par tas", test_tri_tas_variantes),
+        ("Mode sans compteurs", test_sans_compteurs),
+        ("Moteur NumPy", test_moteur_numpy),
         ("Algorithmes de recherche", test_algorithmes_recherche),
         ("Fichier CSV", test_fichier_csv),
+        ("Lecture streaming", test_lecture_streaming),
+        ("Projection et filtre", test_projection_filtre),
+        ("Suivi incrémental", test_suivi_csv),
+        ("Enregistrements __slots__", test_records_slots),
+        ("Colonnes catégorielles", test_colonnes_categorielles),
+        ("Dataset en colonnes", test_dataset_colonnes),
+        ("Lecture compressée", test_lecture_compressee),
+        ("Snapshot du dataset", test_snapshot_cache),
+        ("Lecture parallèle", test_lecture_parallele),
         ("Conformité cahier charges", test_conformite_cahier_charges),
     ]
     
@@ -4,58 +4,691 @@ Gère les virgules dans les données et la conversion des types.
 Aucune bibliothèque externe.
 """
 
-def lire_csv_biens(path, n_max=None):
+import hashlib
+import io
+import json
+import marshal
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Colonnes numériques et type de stockage associé
+COLONNES_ENTIERES = ("prix", "surface", "nb_pieces", "code_postal")
+COLONNES_REELLES = ("prix_m2",)
+
+# Colonnes catégorielles (peu de valeurs distinctes) : chaînes partagées via
+# une table de valeurs au chargement, codes entiers dans DatasetColonnes
+COLONNES_CATEGORIELLES = ("date_mutation", "commune", "type_local")
+CATEGORIE = "categorie"
+
+# Clé d'une valeur numérique absente (vide, NaN, non numérique) : après
+# toutes les autres dans les tris et recherches, ignorée par min/max
+ABSENTE = float("inf")
+
+# Formats compressés reconnus par leurs premiers octets (nombre magique)
+NOMBRES_MAGIQUES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+TAILLE_TAMPON_LECTURE = 1 << 20
+
+# Snapshot binaire du dataset converti, stocké à côté du CSV
+EXTENSION_SNAPSHOT = ".snapshot"
+VERSION_SNAPSHOT = 4
+
+
+def lire_csv_biens(path, n_max=None, stream=False, cache=False, workers=None, record="dict",
+                   columns=None, where=None):
     """
     Lit le fichier CSV et retourne une liste de dictionnaires.
     Gère correctement les virgules dans les données.
+    Avec stream=True, retourne le générateur iter_biens (un seul passage,
+    mémoire constante) au lieu de la liste complète.
+    Avec cache=True, le dataset converti est relu depuis un snapshot binaire
+    (reconstruit automatiquement si le CSV a changé).
+    Avec workers=N (N > 1), le fichier est découpé en tranches parsées par
+    N processus ; le résultat et les messages sont identiques à la lecture
+    séquentielle.
+    Avec record="slots", chaque bien est un objet Bien (__slots__) au lieu
+    d'un dictionnaire.
+    Avec columns=[...], seules ces colonnes sont converties et conservées.
+    Avec where={colonne: valeur | ensemble | fonction}, les lignes qui ne
+    satisfont pas le filtre sont écartées avant la conversion des autres
+    colonnes (n_max compte alors les biens retenus). Une projection ou un
+    filtre désactive le snapshot.
     """
-    biens = []
-    
+    if stream:
+        return iter_biens(path, n_max, record=record, columns=columns, where=where)
+
     try:
-        with open(path, encoding="utf-8") as f:
-            lignes = f.readlines()
+        if cache and columns is None and where is None:
+            biens = charger_snapshot(path, n_max, workers, record)
+        else:
+            biens = _lire_biens(path, n_max, workers, record=record, columns=columns, where=where)
     except FileNotFoundError:
         print(f"Erreur : fichier {path} non trouvé")
-        return biens
+        return []
     except Exception as e:
         print(f"Erreur lors de la lecture du fichier : {e}")
-        return biens
+        return []
 
-    if not lignes:
-        return biens
+    print(f"✅ {len(biens)} biens immobiliers chargés depuis {path}")
+    return biens
 
-  
-    header = lignes[0].strip().split(',')
-    
-    for i, line in enumerate(lignes[1:], 1):
-        if n_max is not None and len(biens) >= n_max:
-            break
-            
+
+def iter_biens(path, n_max=None, schema=None, record="dict", columns=None, where=None):
+    """
+    Générateur : lit le CSV ligne par ligne et produit chaque bien converti.
+    Ne lit jamais plus de lignes que nécessaire pour fournir n_max biens.
+    Les conversions sont celles du schéma (SCHEMA_BIENS par défaut), résolu
+    une seule fois à partir de l'en-tête.
+    Les fichiers compressés (gzip, bz2, xz) sont décompressés à la volée.
+    """
+    if n_max is not None and n_max <= 0:
+        return
+
+    try:
+        f = ouvrir_csv(path)
+    except FileNotFoundError:
+        print(f"Erreur : fichier {path} non trouvé")
+        return
+
+    with f:
+        premiere_ligne = f.readline()
+        if not premiere_ligne:
+            return
+
+        header = premiere_ligne.strip().split(',')
+        convertisseur = (schema or SCHEMA_BIENS).compiler(header, record, columns, where)
+        nb_biens = 0
+
+        for i, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            vals = parse_csv_line(line)
+
+            if len(vals) != len(header):
+                print(_message_ligne_ignoree(i + 1, len(vals), len(header)))
+                continue
+
+            bien = convertisseur.convertir(vals)
+            if bien is None:
+                continue
+
+            yield bien
+            nb_biens += 1
+            if n_max is not None and nb_biens >= n_max:
+                break
+
+        convertisseur.afficher_rapport()
+
+
+class SchemaCSV:
+    """
+    Schéma du CSV : pour chaque colonne, (type, nullable, défaut).
+    Une valeur vide ou invalide est remplacée par le défaut ; les valeurs
+    invalides et les valeurs obligatoires manquantes sont décomptées.
+    Le type CATEGORIE produit des chaînes internées (sys.intern) : toutes les
+    lignes ayant la même valeur référencent le même objet, celui des
+    constantes internées du code ("PARIS"…), donc une égalité avec une telle
+    constante se conclut par identité sans comparer les caractères.
+    Les colonnes absentes du schéma restent des chaînes.
+    """
+
+    def __init__(self, colonnes):
+        self.colonnes = dict(colonnes)
+
+    def compiler(self, header, record="dict", colonnes=None, filtre=None):
+        """
+        Résout le schéma pour un en-tête, un type d'enregistrement, une
+        projection (colonnes à conserver) et un filtre {colonne: attendu}.
+        """
+        return ConvertisseurLignes(self, header, record, colonnes, filtre)
+
+    def type_colonne(self, nom):
+        """Retourne (type, nullable, défaut) pour une colonne."""
+        return self.colonnes.get(nom, (str, True, ""))
+
+
+class ConvertisseurLignes:
+    """
+    Schéma résolu pour un en-tête : une fonction de conversion par position,
+    appliquée à chaque ligne sans recherche sur le nom de colonne.
+    Seules les colonnes projetées sont converties ; les colonnes du filtre
+    sont testées d'abord et la ligne est écartée au premier échec.
+    """
+
+    def __init__(self, schema, header, record="dict", colonnes=None, filtre=None):
+        header = list(header)
+        self.noms = list(colonnes) if colonnes is not None else header
+        filtre = filtre or {}
+
+        inconnues = [nom for nom in list(self.noms) + list(filtre) if nom not in header]
+        if inconnues:
+            raise ValueError(f"Colonne(s) inconnue(s) : {', '.join(inconnues)}")
+
+        self.fabrique = _fabrique_records(record, self.noms)
+        self.categorielles = [nom for nom in self.noms
+                              if schema.type_colonne(nom)[0] == CATEGORIE]
+        self.invalides = {}
+        self.manquantes = {}
+        self.projection = [
+            (header.index(nom), self._compiler_colonne(nom, *schema.type_colonne(nom)))
+            for nom in self.noms
+        ]
+        # Les colonnes filtrées sont converties sans décompte : elles le
+        # seront une seconde fois si elles font aussi partie de la projection
+        self.filtres = [
+            (header.index(nom),
+             self._compiler_colonne(nom, *schema.type_colonne(nom), compter=False),
+             _compiler_filtre(attendu))
+            for nom, attendu in filtre.items()
+        ]
+
+    def _compiler_colonne(self, nom, type_colonne, nullable, defaut, compter=True):
+        invalides = self.invalides if compter else {}
+        manquantes = self.manquantes if compter else {}
+
+        if type_colonne is int:
+            def analyser(valeur):
+                try:
+                    return int(valeur)
+                except ValueError:
+                    return int(float(valeur))
+        elif type_colonne is str:
+            analyser = None
+        elif type_colonne == CATEGORIE:
+            analyser = sys.intern
+        else:
+            analyser = type_colonne
+
+        def convertir(valeur):
+            if not valeur:
+                if not nullable:
+                    manquantes[nom] = manquantes.get(nom, 0) + 1
+                return defaut
+            if analyser is None:
+                return valeur
+            try:
+                return analyser(valeur)
+            except (ValueError, OverflowError):
+                invalides[nom] = invalides.get(nom, 0) + 1
+                return defaut
+
+        return convertir
+
+    def convertir(self, vals):
+        """
+        Convertit les valeurs d'une ligne en enregistrement (dict ou Bien),
+        ou retourne None si la ligne ne satisfait pas le filtre.
+        """
+        for position, convertir, accepte in self.filtres:
+            if not accepte(convertir(vals[position])):
+                return None
+        return self.fabrique([convertir(vals[position]) for position, convertir in self.projection])
+
+    def reinterner(self, biens):
+        """
+        Interne à nouveau les valeurs catégorielles de biens reçus d'un autre
+        processus : le pickle transmet des copies, non les chaînes internées.
+        """
+        if not self.categorielles:
+            return
+        for bien in biens:
+            for nom in self.categorielles:
+                bien[nom] = sys.intern(bien[nom])
+
+    def fusionner(self, invalides, manquantes):
+        """Ajoute les décomptes d'un autre convertisseur (lecture parallèle)."""
+        for compteur, autre in ((self.invalides, invalides), (self.manquantes, manquantes)):
+            for nom, nb in autre.items():
+                compteur[nom] = compteur.get(nom, 0) + nb
+
+    def afficher_rapport(self):
+        """Affiche le bilan agrégé des valeurs invalides ou manquantes."""
+        for titre, compteur in (("Valeurs numériques invalides", self.invalides),
+                                ("Valeurs obligatoires manquantes", self.manquantes)):
+            if compteur:
+                total = sum(compteur.values())
+                details = ", ".join(f"{nom} ({nb})" for nom, nb in compteur.items())
+                print(f"⚠️  {titre} : {total} → {details}")
+
+
+def _compiler_filtre(attendu):
+    """
+    Test d'une colonne filtrée : égalité, appartenance à un ensemble, ou
+    fonction (jamais appelée sur une valeur absente). Une chaîne attendue est
+    internée : sur une colonne catégorielle l'égalité se conclut par identité.
+    """
+    if callable(attendu):
+        return lambda valeur: valeur is not None and attendu(valeur)
+    if isinstance(attendu, (set, frozenset, list, tuple)):
+        valeurs = set(attendu)
+        return lambda valeur: valeur in valeurs
+    if isinstance(attendu, str):
+        attendu = sys.intern(attendu)
+        return lambda valeur: valeur is attendu or valeur == attendu
+    return lambda valeur: valeur == attendu
+
+
+# Schéma des transactions immobilières
+SCHEMA_BIENS = SchemaCSV({
+    "date_mutation": (CATEGORIE, True, ""),
+    "prix": (int, False, None),
+    "surface": (int, False, None),
+    "commune": (CATEGORIE, False, ""),
+    "type_local": (CATEGORIE, False, ""),
+    "nb_pieces": (int, True, None),
+    "code_postal": (int, True, None),
+    "prix_m2": (float, True, None),
+})
+
+
+def _message_ligne_ignoree(numero, nb_vals, nb_colonnes):
+    return f"Ligne {numero} ignorée : nombre de colonnes incorrect ({nb_vals} vs {nb_colonnes})"
+
+
+def format_compression(path):
+    """
+    Détecte la compression du fichier d'après ses premiers octets.
+    Retourne "gzip", "bz2", "xz" ou None pour un fichier texte.
+    """
+    with open(path, "rb") as f:
+        debut = f.read(6)
+    for magique, nom in NOMBRES_MAGIQUES:
+        if debut.startswith(magique):
+            return nom
+    return None
+
+
+def ouvrir_csv(path):
+    """
+    Ouvre le CSV en texte UTF-8, compressé ou non. La décompression se fait
+    en flux, par blocs de TAILLE_TAMPON_LECTURE : la mémoire reste bornée.
+    """
+    compression = format_compression(path)
+    if compression is None:
+        return open(path, encoding="utf-8", buffering=TAILLE_TAMPON_LECTURE)
+
+    # Modules importés à la demande : ils peuvent manquer sur certaines
+    # installations de Python
+    if compression == "gzip":
+        import gzip
+        flux = gzip.open(path, "rb")
+    elif compression == "bz2":
+        import bz2
+        flux = bz2.open(path, "rb")
+    else:
+        import lzma
+        flux = lzma.open(path, "rb")
+
+    return io.TextIOWrapper(io.BufferedReader(flux, TAILLE_TAMPON_LECTURE), encoding="utf-8")
+
+
+def _lire_biens(path, n_max=None, workers=None, schema=None, record="dict",
+                columns=None, where=None):
+    """
+    Lecture complète du CSV, séquentielle ou parallèle selon workers.
+    Avec n_max, la lecture séquentielle reste préférable car elle s'arrête
+    dès que n_max biens ont été lus. Un fichier compressé ne peut pas être
+    découpé en plages d'octets : il est toujours lu séquentiellement.
+    """
+    if not workers or workers <= 1 or n_max is not None or format_compression(path):
+        return list(iter_biens(path, n_max, schema, record, columns, where))
+    return lire_csv_parallele(path, workers, schema, record, columns, where)
+
+
+def _decouper_tranches(path, nb_tranches):
+    """
+    Découpe le fichier en plages d'octets [début, fin) alignées sur les
+    débuts de ligne. Retourne (header, tranches).
+    """
+    taille = os.path.getsize(path)
+    with open(path, "rb") as f:
+        premiere_ligne = f.readline()
+        debut_donnees = f.tell()
+        bornes = [debut_donnees]
+
+        for k in range(1, nb_tranches):
+            position = debut_donnees + k * (taille - debut_donnees) // nb_tranches
+            if position <= bornes[-1]:
+                continue
+            # Se placer juste avant la position pour tomber sur le début
+            # de la ligne suivante (ou sur la position si elle en est un)
+            f.seek(position - 1)
+            f.readline()
+            borne = f.tell()
+            if bornes[-1] < borne < taille:
+                bornes.append(borne)
+
+        bornes.append(taille)
+
+    header = premiere_ligne.decode("utf-8").strip().split(',')
+    return header, list(zip(bornes[:-1], bornes[1:]))
+
+
+def _decouper_lignes(donnees):
+    """
+    Décode des octets et les découpe en lignes comme la lecture séquentielle
+    (fins de ligne universelles \n, \r\n, \r) : contrairement à
+    str.splitlines, U+2028, U+0085, \x0c ou \x1c–\x1e dans un champ ne
+    coupent pas la ligne.
+    """
+    return list(io.StringIO(donnees.decode("utf-8"), newline=None))
+
+
+def _parser_tranche(path, debut, fin, header, schema, record, columns, where):
+    """
+    Parse une plage d'octets du fichier (exécuté dans un processus fils).
+    Retourne (biens, lignes_ignorees, nb_lignes, invalides, manquantes) avec
+    des numéros de ligne relatifs à la tranche.
+    """
+    with open(path, "rb") as f:
+        f.seek(debut)
+        lignes = _decouper_lignes(f.read(fin - debut))
+
+    convertisseur = schema.compiler(header, record, columns, where)
+    biens, ignorees = _parser_lignes(lignes, len(header), convertisseur)
+    return biens, ignorees, len(lignes), convertisseur.invalides, convertisseur.manquantes
+
+
+def _parser_lignes(lignes, nb_colonnes, convertisseur):
+    """
+    Parse une liste de lignes déjà découpées.
+    Retourne (biens, lignes_ignorees) où lignes_ignorees contient des couples
+    (indice de la ligne dans la liste, nombre de valeurs trouvées).
+    """
+    biens = []
+    ignorees = []
+    for j, line in enumerate(lignes):
         line = line.strip()
-        if not line:  
+        if not line:
             continue
-            
-       
+
         vals = parse_csv_line(line)
-        
-        if len(vals) != len(header):
-            print(f"Ligne {i+1} ignorée : nombre de colonnes incorrect ({len(vals)} vs {len(header)})")
+        if len(vals) != nb_colonnes:
+            ignorees.append((j, len(vals)))
             continue
-            
-       
-        bien = {}
-        for j, (key, val) in enumerate(zip(header, vals)):
-            bien[key] = convert_value(val, key)
-        
-        biens.append(bien)
+
+        bien = convertisseur.convertir(vals)
+        if bien is not None:
+            biens.append(bien)
+
+    return biens, ignorees
+
+
+def lire_csv_parallele(path, workers, schema=None, record="dict", columns=None, where=None):
+    """
+    Lit le CSV en parallèle : chaque processus parse une tranche d'octets
+    alignée sur les lignes, puis les résultats sont concaténés dans l'ordre
+    du fichier. Les fonctions utilisées dans where doivent être picklables.
+    """
+    if not os.path.getsize(path):
+        return []
+
+    header, tranches = _decouper_tranches(path, workers)
+    if not tranches:
+        return []
+
+    schema = schema or SCHEMA_BIENS
+    # Valide la projection et le filtre avant de lancer les processus
+    bilan = schema.compiler(header, record, columns, where)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        resultats = list(executor.map(
+            _parser_tranche,
+            [path] * len(tranches),
+            [debut for debut, _ in tranches],
+            [fin for _, fin in tranches],
+            [header] * len(tranches),
+            [schema] * len(tranches),
+            [record] * len(tranches),
+            [columns] * len(tranches),
+            [where] * len(tranches),
+        ))
+
+    biens = []
+    # Ligne 1 = en-tête : la première ligne de données est la ligne 2
+    premiere_ligne = 2
+    for biens_tranche, ignorees, nb_lignes, invalides, manquantes in resultats:
+        for j, nb_vals in ignorees:
+            print(_message_ligne_ignoree(premiere_ligne + j, nb_vals, len(header)))
+        bilan.reinterner(biens_tranche)
+        biens.extend(biens_tranche)
+        bilan.fusionner(invalides, manquantes)
+        premiere_ligne += nb_lignes
+
+    bilan.afficher_rapport()
+    return biens
+
+
+class SuiviCSV:
+    """
+    Suivi d'un CSV alimenté en continu (ajouts en fin de fichier).
     
-    print(f"✅ {len(biens)} biens immobiliers chargés depuis {path}")
+    Chaque appel à interroger() ne lit que les octets ajoutés depuis l'appel
+    précédent (lignes complètes uniquement) et transmet les nouveaux biens à
+    toutes les vues abonnées via leur méthode ajouter(biens), par exemple
+    VueTriee (algorithmes_tri) ou IndexValeurs (algorithmes_recherche).
+    Si le contenu déjà lu a changé (fichier remplacé, tronqué ou réécrit sur
+    place, même à taille égale), le suivi repart du début.
+    Le fichier suivi doit être un CSV texte (non compressé).
+    """
+
+    TAILLE_TEMOIN = 64   # derniers octets lus, relus pour vérifier un ajout
+
+    def __init__(self, path, schema=None, record="dict"):
+        self.path = path
+        self.schema = schema or SCHEMA_BIENS
+        self.record = record
+        self.vues = []
+        self._reinitialiser()
+
+    def _reinitialiser(self):
+        self.offset = 0
+        self.header = None
+        # Numéro (1-based) de la prochaine ligne à lire dans le fichier
+        self.prochaine_ligne = 1
+        # (st_dev, st_ino, st_mtime_ns) au dernier appel, fin des octets lus
+        # et empreinte de tout le préfixe déjà lu
+        self.identite = None
+        self.temoin = b""
+        self.empreinte = hashlib.blake2b(digest_size=16)
+
+    def _prefixe_modifie(self, infos):
+        """
+        Le préfixe déjà lu a-t-il changé ? Un autre fichier (inode) ou un
+        fichier plus court : oui. Sinon, si le fichier a été modifié :
+        s'il a grandi, la fin du préfixe (témoin) doit être intacte ; à
+        taille égale ce n'est pas un ajout, tout le préfixe est revérifié.
+        """
+        if not self.offset:
+            return False
+        dev, ino, mtime_ns = self.identite
+        if (infos.st_dev, infos.st_ino) != (dev, ino) or infos.st_size < self.offset:
+            return True
+        if infos.st_mtime_ns == mtime_ns:
+            return False
+
+        with open(self.path, "rb") as f:
+            if infos.st_size > self.offset:
+                f.seek(self.offset - len(self.temoin))
+                return f.read(len(self.temoin)) != self.temoin
+            empreinte = hashlib.blake2b(digest_size=16)
+            restant = self.offset
+            while restant:
+                bloc = f.read(min(restant, TAILLE_TAMPON_LECTURE))
+                if not bloc:
+                    return True
+                empreinte.update(bloc)
+                restant -= len(bloc)
+        return empreinte.digest() != self.empreinte.digest()
+
+    def abonner(self, vue):
+        """Enregistre une vue à tenir à jour ; retourne la vue."""
+        self.vues.append(vue)
+        return vue
+
+    def interroger(self):
+        """
+        Lit les lignes ajoutées depuis le dernier appel.
+        Retourne la liste des nouveaux biens (vide si rien de nouveau).
+        """
+        infos = os.stat(self.path)
+        if self._prefixe_modifie(infos):
+            print(f"⚠️  {self.path} a été remplacé, tronqué ou réécrit : relecture depuis le début")
+            self._reinitialiser()
+        self.identite = (infos.st_dev, infos.st_ino, infos.st_mtime_ns)
+        taille = infos.st_size
+        if taille == self.offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            donnees = f.read(taille - self.offset)
+
+        # Une ligne en cours d'écriture sera lue au prochain appel
+        fin = donnees.rfind(b"\n") + 1
+        if not fin:
+            return []
+        self.offset += fin
+        self.empreinte.update(donnees[:fin])
+        self.temoin = (self.temoin + donnees[:fin])[-self.TAILLE_TEMOIN:]
+        lignes = _decouper_lignes(donnees[:fin])
+
+        if self.header is None:
+            self.header = lignes.pop(0).strip().split(',')
+            self.prochaine_ligne += 1
+
+        convertisseur = self.schema.compiler(self.header, self.record)
+        biens, ignorees = _parser_lignes(lignes, len(self.header), convertisseur)
+        for j, nb_vals in ignorees:
+            print(_message_ligne_ignoree(self.prochaine_ligne + j, nb_vals, len(self.header)))
+        convertisseur.afficher_rapport()
+        self.prochaine_ligne += len(lignes)
+
+        if biens:
+            for vue in self.vues:
+                vue.ajouter(biens)
+        return biens
+
+
+def _empreinte_csv(path):
+    """Empreinte blake2b du contenu du CSV."""
+    empreinte = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            empreinte.update(bloc)
+    return empreinte.hexdigest()
+
+
+def _entete_snapshot(path):
+    """En-tête d'invalidation du snapshot, sans lire le contenu du CSV."""
+    infos = os.stat(path)
+    return {"version": VERSION_SNAPSHOT, "marshal": marshal.version,
+            "chemin": os.path.abspath(path), "taille": infos.st_size,
+            "mtime_ns": infos.st_mtime_ns}
+
+
+def _snapshot_a_jour(entete, attendu, path):
+    """
+    Le snapshot correspond-il au CSV ? Taille et date identiques suffisent ;
+    à taille égale mais date différente (copie, touch), l'empreinte du
+    contenu décide. Aucun octet du CSV n'est relu dans le cas courant.
+    """
+    if not isinstance(entete, dict):
+        return False
+    if any(entete.get(cle) != attendu[cle] for cle in ("version", "marshal", "chemin", "taille")):
+        return False
+    if entete.get("mtime_ns") == attendu["mtime_ns"]:
+        return True
+    return entete.get("empreinte") == _empreinte_csv(path)
+
+
+def charger_snapshot(path, n_max=None, workers=None, record="dict"):
+    """
+    Retourne les biens du CSV via le snapshot binaire <path>.snapshot.
+    Le snapshot est (re)construit si absent, illisible ou périmé.
+    
+    Format : une ligne d'en-tête JSON, validée avant toute lecture des
+    données, puis (noms, lignes) sérialisés par marshal (tuples, chaînes,
+    nombres, None : aucun code n'est exécuté au chargement, contrairement
+    à pickle).
+    """
+    attendu = _entete_snapshot(path)
+    chemin_snapshot = path + EXTENSION_SNAPSHOT
+
+    try:
+        with open(chemin_snapshot, "rb") as f:
+            if _snapshot_a_jour(json.loads(f.readline()), attendu, path):
+                noms, lignes = marshal.loads(f.read())
+                if n_max is not None:
+                    lignes = lignes[:max(n_max, 0)]
+                fabrique = _fabrique_records(record, noms)
+                return [fabrique(ligne) for ligne in lignes]
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    biens = _lire_biens(path, workers=workers, record=record)
+    noms = tuple(biens[0].keys()) if biens else ()
+    lignes = [tuple(bien[nom] for nom in noms) for bien in biens]
+    entete = dict(attendu, empreinte=_empreinte_csv(path))
+
+    try:
+        with open(chemin_snapshot, "wb") as f:
+            f.write(json.dumps(entete).encode("utf-8") + b"\n")
+            f.write(marshal.dumps((noms, lignes)))
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Snapshot non écrit ({e}), lecture directe du CSV")
+
+    if n_max is not None:
+        biens = biens[:max(n_max, 0)]
     return biens
 
 
 def parse_csv_line(line):
     """
     Parse une ligne CSV en gérant les virgules dans les valeurs.
+    Chemin rapide (str.split) pour les lignes sans guillemets ; sinon les
+    champs entre guillemets peuvent contenir des virgules et des "" échappés.
+    """
+    if '"' not in line:
+        return [val.strip() for val in line.split(',')]
+
+    # Découpage sur les guillemets : les segments d'indice impair sont entre
+    # guillemets, les autres sont découpés sur les virgules
+    vals = []
+    courant = []
+    segments = line.split('"')
+    dernier = len(segments) - 1
+
+    for k, segment in enumerate(segments):
+        if k % 2:
+            courant.append(segment)
+        elif not segment:
+            # Guillemet fermant suivi d'un guillemet ouvrant : "" échappé
+            if 0 < k < dernier:
+                courant.append('"')
+        else:
+            morceaux = segment.split(',')
+            courant.append(morceaux[0])
+            for morceau in morceaux[1:]:
+                vals.append("".join(courant).strip())
+                courant = [morceau]
+
+    vals.append("".join(courant).strip())
+    return vals
+
+
+def _parse_csv_line_caractere(line):
+    """
+    Ancien parseur caractère par caractère, conservé comme référence
+    pour le micro-benchmark du tokenizer.
     """
     vals = []
     current_val = ""
@@ -89,14 +722,14 @@ def convert_value(value, key):
         return value
     
     
-    if key in {"prix", "surface", "nb_pieces", "code_postal"}:
+    if key in COLONNES_ENTIERES:
         try:
             return int(float(value))  
         except (ValueError, TypeError):
             return value
     
   
-    elif key in {"prix_m2"}:
+    elif key in COLONNES_REELLES:
         try:
             return float(value)
         except (ValueError, TypeError):
@@ -107,6 +740,282 @@ def convert_value(value, key):
         return value
 
 
+class Bien:
+    """
+    Enregistrement compact d'une transaction (__slots__, pas de __dict__).
+    Se manipule comme un dictionnaire (item[key], get, keys) : les fonctions
+    tri_*, recherche_* et valider_* l'acceptent sans modification.
+    """
+    __slots__ = ("date_mutation", "prix", "surface", "commune",
+                 "type_local", "nb_pieces", "code_postal", "prix_m2")
+
+    def __init__(self, date_mutation="", prix=None, surface=None, commune="",
+                 type_local="", nb_pieces=None, code_postal=None, prix_m2=None):
+        self.date_mutation = date_mutation
+        self.prix = prix
+        self.surface = surface
+        self.commune = commune
+        self.type_local = type_local
+        self.nb_pieces = nb_pieces
+        self.code_postal = code_postal
+        self.prix_m2 = prix_m2
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, valeur):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, valeur)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, defaut=None):
+        if key in self.__slots__:
+            return getattr(self, key)
+        return defaut
+
+    def keys(self):
+        return list(self.__slots__)
+
+    def __repr__(self):
+        return "Bien(" + ", ".join(f"{nom}={getattr(self, nom)!r}" for nom in self.__slots__) + ")"
+
+
+def _fabrique_records(record, noms):
+    """
+    Retourne la fonction qui construit un enregistrement à partir de la
+    liste des valeurs converties (dans l'ordre de noms).
+    """
+    if record == "dict":
+        return lambda valeurs: dict(zip(noms, valeurs))
+
+    if record == "slots":
+        inconnues = [nom for nom in noms if nom not in Bien.__slots__]
+        if inconnues:
+            raise ValueError(f"Colonnes non supportées par Bien : {', '.join(inconnues)}")
+        if tuple(noms) == Bien.__slots__:
+            return lambda valeurs: Bien(*valeurs)
+        return lambda valeurs: Bien(**dict(zip(noms, valeurs)))
+
+    raise ValueError(f"Type d'enregistrement inconnu : {record!r} (attendu 'dict' ou 'slots')")
+
+
+class LigneBien:
+    """
+    Vue d'une ligne d'un DatasetColonnes.
+    Se manipule comme un dictionnaire (item[key], get, keys) pour rester
+    compatible avec les fonctions de tri, de recherche et de validation.
+    """
+    __slots__ = ("_dataset", "_index")
+
+    def __init__(self, dataset, index):
+        self._dataset = dataset
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._dataset.valeur(key, self._index)
+
+    def __contains__(self, key):
+        return key in self._dataset.colonnes
+
+    def get(self, key, defaut=None):
+        if key in self._dataset.colonnes:
+            return self[key]
+        return defaut
+
+    def keys(self):
+        return list(self._dataset.noms)
+
+    def __repr__(self):
+        return repr({key: self[key] for key in self._dataset.noms})
+
+
+class TableCodes:
+    """Table de correspondance valeur ↔ code entier d'une colonne catégorielle."""
+
+    def __init__(self):
+        self.valeurs = []
+        self.codes = {}
+
+    def encoder(self, valeur):
+        """Retourne le code de valeur, en l'ajoutant à la table si besoin."""
+        code = self.codes.get(valeur)
+        if code is None:
+            code = len(self.valeurs)
+            self.codes[valeur] = code
+            self.valeurs.append(valeur)
+        return code
+
+    def __len__(self):
+        return len(self.valeurs)
+
+
+class DatasetColonnes:
+    """
+    Dataset stocké en colonnes plutôt qu'en liste de dictionnaires.
+    
+    Les colonnes entières (prix, surface, nb_pieces, code_postal) sont des
+    array('q'), prix_m2 est un array('d'), les autres colonnes des listes.
+    Une valeur numérique absente ou invalide est stockée comme 0 dans la
+    colonne typée et marquée dans un masque array('b') (absentes[nom]) :
+    elle se relit None et vaut ABSENTE dans les clés, jamais un vrai zéro.
+    Les colonnes catégorielles (commune, type_local, date_mutation) sont
+    encodées en array('I') de codes, avec une table code → valeur partagée
+    par tous les datasets dérivés (permuter, tranches).
+    """
+
+    def __init__(self, noms, tables=None):
+        self.noms = list(noms)
+        self.colonnes = {}
+        self.absentes = {}
+        self.tables = tables if tables is not None else {}
+        for nom in self.noms:
+            if nom in COLONNES_ENTIERES:
+                self.colonnes[nom] = array('q')
+                self.absentes[nom] = array('b')
+            elif nom in COLONNES_REELLES:
+                self.colonnes[nom] = array('d')
+                self.absentes[nom] = array('b')
+            elif nom in COLONNES_CATEGORIELLES:
+                self.colonnes[nom] = array('I')
+                self.tables.setdefault(nom, TableCodes())
+            else:
+                self.colonnes[nom] = []
+
+    @classmethod
+    def depuis_biens(cls, biens, noms=None):
+        """Construit le dataset à partir d'un itérable de dictionnaires."""
+        elements = iter(biens)
+        premier = next(elements, None)
+        if noms is None:
+            noms = list(premier.keys()) if premier is not None else []
+
+        dataset = cls(noms)
+        if premier is not None:
+            dataset.ajouter(premier)
+            for bien in elements:
+                dataset.ajouter(bien)
+        return dataset
+
+    @classmethod
+    def depuis_csv(cls, path, n_max=None):
+        """Charge directement le CSV en colonnes, sans garder les dictionnaires."""
+        dataset = cls.depuis_biens(iter_biens(path, n_max))
+        print(f"✅ {len(dataset)} biens immobiliers chargés en colonnes depuis {path}")
+        return dataset
+
+    def ajouter(self, bien):
+        """Ajoute un bien (dictionnaire) à la fin de chaque colonne."""
+        for nom in self.noms:
+            valeur = bien.get(nom, "")
+            if nom in self.absentes:
+                absente = not isinstance(valeur, (int, float))
+                self.absentes[nom].append(absente)
+                if absente:
+                    valeur = 0
+            elif nom in self.tables:
+                valeur = self.tables[nom].encoder(valeur)
+            self.colonnes[nom].append(valeur)
+
+    def colonne(self, key):
+        """
+        Retourne la colonne brute associée à key (array typé, liste, ou
+        array de codes pour une colonne catégorielle).
+        """
+        return self.colonnes[key]
+
+    def valeur(self, key, index):
+        """Retourne la valeur (décodée) de la colonne key à la ligne index, None si absente."""
+        if key in self.tables:
+            return self.tables[key].valeurs[self.colonnes[key][index]]
+        if key in self.absentes and self.absentes[key][index]:
+            return None
+        return self.colonnes[key][index]
+
+    def cles(self, key):
+        """
+        Clés numériques de comparaison pour les tris et recherches : la
+        colonne elle-même si elle est numérique et complète, sinon une copie
+        array('d') où chaque valeur absente ou non numérique vaut ABSENTE.
+        """
+        colonne = self.colonnes[key]
+        if key in self.absentes:
+            masque = self.absentes[key]
+            if 1 not in masque:
+                return colonne
+            return array('d', [ABSENTE if absente else valeur
+                               for valeur, absente in zip(colonne, masque)])
+
+        cles = array('d')
+        valeurs = self.tables[key].valeurs if key in self.tables else None
+        for valeur in colonne:
+            if valeurs is not None:
+                valeur = valeurs[valeur]
+            try:
+                cles.append(float(valeur))
+            except (ValueError, TypeError):
+                cles.append(ABSENTE)
+        return cles
+
+    def positions_egales(self, key, valeur):
+        """
+        Positions des lignes dont la colonne key vaut valeur. Sur une colonne
+        catégorielle, la comparaison porte sur les codes entiers.
+        """
+        colonne = self.colonnes[key]
+        if key in self.tables:
+            code = self.tables[key].codes.get(valeur)
+            if code is None:
+                return []
+            valeur = code
+        return [i for i, val in enumerate(colonne) if val == valeur]
+
+    def permuter(self, ordre):
+        """Retourne un nouveau dataset dont la ligne i est la ligne ordre[i]."""
+        resultat = DatasetColonnes(self.noms, self.tables)
+        for nom in self.noms:
+            source = self.colonnes[nom]
+            if isinstance(source, array):
+                resultat.colonnes[nom] = array(source.typecode, [source[i] for i in ordre])
+            else:
+                resultat.colonnes[nom].extend(source[i] for i in ordre)
+            if nom in self.absentes:
+                masque = self.absentes[nom]
+                resultat.absentes[nom] = array('b', [masque[i] for i in ordre])
+        return resultat
+
+    def ligne(self, index):
+        """Retourne la ligne index sous forme de tuple (ordre de self.noms)."""
+        return tuple(self.valeur(nom, index) for nom in self.noms)
+
+    def vers_biens(self):
+        """Reconstruit la liste de dictionnaires équivalente."""
+        return [dict(zip(self.noms, self.ligne(i))) for i in range(len(self))]
+
+    def __len__(self):
+        if not self.noms:
+            return 0
+        return len(self.colonnes[self.noms[0]])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.permuter(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index de ligne hors limites")
+        return LigneBien(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield LigneBien(self, i)
+
+
 def afficher_statistiques_dataset(biens):
     """
     Affiche des statistiques sur le dataset chargé.
@@ -85,7 +85,7 @@ def generer_tableau_comparatif():
     }
     
     for taille in tailles:
-        biens = lire_csv_biens(chemin_csv, n_max=taille)
+        biens = lire_csv_biens(chemin_csv, n_max=taille, cache=True)
         
         # Tri sélection
         _, comp, _, temps = tri_selection(biens, "prix")
@@ -151,21 +151,21 @@ def generer_analyse_scalabilite():
         temps_1000 = 0
         
         # Test sur 100 éléments
-        biens = lire_csv_biens(chemin_csv, n_max=100)
+        biens = lire_csv_biens(chemin_csv, n_max=100, cache=True)
         if nom == "Fusion":
             _, _, temps_100 = algo(biens, "prix")
         else:
             _, _, _, temps_100 = algo(biens, "prix")
         
         # Test sur 500 éléments
-        biens = lire_csv_biens(chemin_csv, n_max=500)
+        biens = lire_csv_biens(chemin_csv, n_max=500, cache=True)
         if nom == "Fusion":
             _, _, temps_500 = algo(biens, "prix")
         else:
             _, _, _, temps_500 = algo(biens, "prix")
         
         # Test sur 1000 éléments
-        biens = lire_csv_biens(chemin_csv, n_max=1000)
+        biens = lire_csv_biens(chemin_csv, n_max=1000, cache=True)
         if nom == "Fusion":
             _, _, temps_1000 = algo(biens, "prix")
         else: